@@ -0,0 +1,99 @@
+"""
+Choose the player's animation frame from tables of frames, advanced on
+simulation ticks.
+"""
+from settings import FPS
+
+# Frame names for each animation state and facing, in the order they are
+# shown. States with one frame hold it.
+ANIMATIONS = {
+    ("idle", "left"): ("lookleft.png",),
+    ("idle", "right"): ("lookright.png",),
+    ("walk", "left"): ("lookleft.png", "prepleft.png"),
+    ("walk", "right"): ("prepright.png", "lookright.png"),
+    ("jump", "left"): ("jumpleft.png",),
+    ("jump", "right"): ("jumpright.png",),
+}
+
+# Simulation ticks each walking frame is shown for (a tenth of a second).
+FRAME_TICKS = max(1, round(FPS / 10))
+
+# Slowest horizontal speed in pixels per tick that counts as walking.
+WALK_SPEED = 0.5
+
+
+class Animation:
+    """
+    The animation state of a player, stepped once per simulation tick.
+
+    Animation only depends on the player's state and the number of ticks
+    simulated, so it runs the same way in headless games and replays. The
+    frames themselves are looked up by the view, from a table of surfaces
+    made from ANIMATIONS.
+
+    Attributes:
+        state: A string containing the animation state, "idle", "walk" or
+            "jump".
+        facing: A string containing the direction the player faces, "left" or
+            "right". It only changes while the player is moving.
+        key: A tuple containing the state and facing, the key of the frames
+            being shown in ANIMATIONS.
+        ticks: An integer containing the number of ticks spent in the state.
+        index: An integer containing the position in the state's frames of
+            the frame to show.
+    """
+
+    def __init__(self):
+        """
+        Start the animation with the player sitting facing left.
+        """
+        self.state = "idle"
+        self.facing = "left"
+        self.key = (self.state, self.facing)
+        self.ticks = 0
+        self.index = 0
+
+    @property
+    def frame(self):
+        """
+        Get the name of the frame to show.
+
+        Returns:
+            A string containing the name of a frame in the atlas.
+        """
+        return ANIMATIONS[self.key][self.index]
+
+    def step(self, jumping, vel_x):
+        """
+        Advance the animation by one tick.
+
+        Args:
+            jumping: A boolean that is True if the player is in the air after
+                jumping.
+            vel_x: A float containing the player's horizontal velocity.
+        """
+        # Face the way the player moves, keeping the facing when it stops.
+        facing = self.facing
+        if vel_x < 0:
+            facing = "left"
+        elif vel_x > 0:
+            facing = "right"
+
+        # Pick the state, starting its frames again if it changed.
+        if jumping:
+            state = "jump"
+        elif abs(vel_x) >= WALK_SPEED:
+            state = "walk"
+        else:
+            state = "idle"
+        if state != self.state:
+            self.state = state
+            self.ticks = 0
+        else:
+            self.ticks += 1
+        if state != self.key[0] or facing != self.facing:
+            self.facing = facing
+            self.key = (state, facing)
+
+        # Show each frame for FRAME_TICKS ticks, looping through them.
+        self.index = self.ticks // FRAME_TICKS % len(ANIMATIONS[self.key])
@@ -0,0 +1,117 @@
+"""
+Build a texture atlas of named frames from the spritesheet and its XML
+description, so each frame is only cut out of the spritesheet once.
+"""
+from functools import lru_cache
+from os import path
+import xml.etree.ElementTree as ElementTree
+from settings import BLACK, SPRITESHEET, SPRITESHEET_XML
+from spritesheet_view import Spritesheet
+
+IMG_DIR = path.join(path.dirname(__file__), "img")
+
+# Scale factor applied to frames when they are extracted (1 if not listed).
+FRAME_SCALES = {
+    "title.png": 0.9,
+    "jumpleft.png": 1.2,
+    "jumpright.png": 1.2,
+    "largeplatform.png": 0.8,
+}
+
+
+@lru_cache(maxsize=None)
+def read_frames(filename=path.join(IMG_DIR, SPRITESHEET_XML)):
+    """
+    Read the position of every frame from a TexturePacker XML file.
+
+    This only parses the XML, so it works without a display.
+
+    Args:
+        filename: A string containing the path to the XML file.
+
+    Returns:
+        A dictionary mapping each frame name to a tuple containing its x
+        position, y position, width and height on the spritesheet, and a
+        boolean that is True if the frame is stored rotated.
+    """
+    frames = {}
+    for sprite in ElementTree.parse(filename).getroot().iter("sprite"):
+        frames[sprite.get("n")] = (int(sprite.get("x")),
+                                   int(sprite.get("y")),
+                                   int(sprite.get("w")),
+                                   int(sprite.get("h")),
+                                   sprite.get("r") == "y")
+    return frames
+
+
+def frame_size(name):
+    """
+    Find the size a frame has once it is extracted, without loading images.
+
+    Args:
+        name: A string containing the name of the frame, e.g. "lookleft.png".
+
+    Returns:
+        A tuple containing the width and height of the frame in pixels.
+    """
+    _, _, width, height, rotated = read_frames()[name]
+    scale = FRAME_SCALES.get(name, 1)
+    size = (round(width * scale), round(height * scale))
+    return (size[1], size[0]) if rotated else size
+
+
+class Atlas:
+    """
+    All the frames of a spritesheet, extracted once and looked up by name.
+
+    Frames are scaled, turned back upright if the spritesheet stores them
+    rotated, converted to the display format and made transparent, so they
+    can be blitted directly. The surfaces are shared by everything using the
+    atlas and should not be modified.
+
+    Attributes:
+        spritesheet: An instance of a Spritesheet class.
+        frames: A dictionary mapping each frame name to a pygame Surface.
+    """
+    def __init__(self, image_filename, xml_filename):
+        """
+        Extract every frame listed in the XML file from the spritesheet.
+
+        Args:
+            image_filename: A string containing the path to the spritesheet.
+            xml_filename: A string containing the path to the XML file.
+        """
+        self.spritesheet = Spritesheet(image_filename)
+        self.frames = {}
+        for name, (x_coord, y_coord, width, height, rotated) in \
+                read_frames(xml_filename).items():
+            self.frames[name] = self.spritesheet.get_image(
+                x_coord, y_coord, width, height,
+                scale=FRAME_SCALES.get(name, 1), rotate=90 if rotated else 0,
+                colorkey=BLACK)
+
+    def __getitem__(self, name):
+        """
+        Look up a frame by name.
+
+        Args:
+            name: A string containing the name of the frame.
+
+        Returns:
+            The pygame Surface of the frame.
+        """
+        return self.frames[name]
+
+
+@lru_cache(maxsize=None)
+def load_atlas():
+    """
+    Load the game's atlas the first time it is needed and share it afterwards.
+
+    The display must have been set up before the first call.
+
+    Returns:
+        The instance of an Atlas class shared by the whole game.
+    """
+    return Atlas(path.join(IMG_DIR, SPRITESHEET),
+                 path.join(IMG_DIR, SPRITESHEET_XML))
@@ -0,0 +1,179 @@
+"""
+Play the game's sound effects and music through one audio manager, which
+sets up the mixer and loads every sound once.
+"""
+from functools import lru_cache
+from os import path
+import threading
+import pygame as pg
+
+SND_DIR = path.join(path.dirname(__file__), "snd")
+
+# Sound effects, each played on a channel of its own so it never cuts off
+# another sound, or is cut off by one.
+SOUNDS = {
+    "jump": "PacificTreeFrog.wav",
+}
+
+# Music tracks, decoded into memory once so switching tracks never reads
+# from the disk. They are decoded in the background in this order, so the
+# start screen's track comes first.
+MUSIC = {
+    "menu": "startEndScreen.ogg",
+    "game": "forest.ogg",
+}
+
+# Time in milliseconds one music track takes to fade into another.
+CROSSFADE = 500
+
+
+class AudioManager:
+    """
+    The sound effects and music of the game.
+
+    Two channels are kept for music, so a new track can fade in on one while
+    the old track fades out on the other. Fading is done by the mixer, so
+    nothing waits for it. Music is decoded on a background thread, as it
+    takes much longer than anything else at startup, and a track asked for
+    before it is ready starts as soon as it is. If audio is turned off, or no
+    audio device can be opened, every method does nothing.
+
+    Attributes:
+        enabled: A boolean that is True if sounds are played.
+        sounds: A dictionary mapping each sound effect name to a pygame
+            Sound.
+        music: A dictionary mapping each music track name to a pygame Sound,
+            for the tracks decoded so far.
+        channels: A dictionary mapping each sound effect name to the pygame
+            Channel reserved for it.
+        music_channels: A list of the two pygame Channels reserved for music,
+            the one the current track plays on first.
+        track: A string containing the name of the music track playing (or
+            waiting to be decoded), or None.
+        lock: A threading Lock held while changing the music, so a track
+            finishing decoding does not start at the same time.
+        loaded: A threading Event set once every track is decoded.
+        loader: The Thread decoding the music, or None.
+    """
+
+    def __init__(self, enabled=True):
+        """
+        Set up the mixer and load every sound.
+
+        Args:
+            enabled: An optional boolean that is False to turn audio off.
+        """
+        self.enabled = enabled
+        self.sounds = {}
+        self.music = {}
+        self.channels = {}
+        self.music_channels = []
+        self.track = None
+        self.lock = threading.Lock()
+        self.loaded = threading.Event()
+        self.loader = None
+        if not enabled:
+            self.loaded.set()
+            return
+        try:
+            if not pg.mixer.get_init():
+                pg.mixer.init()
+        except pg.error:
+            self.enabled = False
+            self.loaded.set()
+            return
+
+        # Reserve a channel for each sound effect and two for music, leaving
+        # the rest for any other sounds.
+        reserved = len(SOUNDS) + 2
+        pg.mixer.set_num_channels(max(pg.mixer.get_num_channels(),
+                                      reserved + 4))
+        pg.mixer.set_reserved(reserved)
+        for number, (name, filename) in enumerate(SOUNDS.items()):
+            self.sounds[name] = pg.mixer.Sound(path.join(SND_DIR, filename))
+            self.channels[name] = pg.mixer.Channel(number)
+        self.music_channels = [pg.mixer.Channel(len(SOUNDS)),
+                               pg.mixer.Channel(len(SOUNDS) + 1)]
+        # The thread is not a daemon, so the program waits for it instead of
+        # closing the mixer while a track is being decoded.
+        self.loader = threading.Thread(target=self.load_music)
+        self.loader.start()
+
+    def load_music(self):
+        """
+        Decode every music track, starting each one that is asked for before
+        it is ready.
+        """
+        for name, filename in MUSIC.items():
+            sound = pg.mixer.Sound(path.join(SND_DIR, filename))
+            with self.lock:
+                self.music[name] = sound
+                if self.track == name:
+                    self.music_channels[0].play(sound, loops=-1,
+                                                fade_ms=CROSSFADE)
+        self.loaded.set()
+
+    def play(self, name):
+        """
+        Play a sound effect, restarting it if it is already playing.
+
+        Args:
+            name: A string containing the name of a sound in SOUNDS.
+        """
+        if self.enabled:
+            self.channels[name].play(self.sounds[name])
+
+    def play_music(self, name, fade=CROSSFADE):
+        """
+        Fade from the music playing to another track, looping it forever.
+
+        Args:
+            name: A string containing the name of a track in MUSIC.
+            fade: An optional integer containing the length of the fade in
+                milliseconds.
+        """
+        if not self.enabled or name == self.track:
+            return
+        with self.lock:
+            old, new = self.music_channels
+            old.fadeout(fade)
+            if name in self.music:
+                new.play(self.music[name], loops=-1, fade_ms=fade)
+            self.music_channels.reverse()
+            self.track = name
+
+    def stop_music(self, fade=CROSSFADE):
+        """
+        Fade out the music playing.
+
+        Args:
+            fade: An optional integer containing the length of the fade in
+                milliseconds.
+        """
+        if not self.enabled or self.track is None:
+            return
+        with self.lock:
+            self.music_channels[0].fadeout(fade)
+            self.track = None
+
+    def close(self):
+        """
+        Wait for the music to finish decoding, so the mixer can be closed.
+        """
+        if self.loader is not None:
+            self.loader.join()
+
+
+@lru_cache(maxsize=None)
+def load_audio(enabled=True):
+    """
+    Set up audio the first time it is needed and share it afterwards.
+
+    Args:
+        enabled: An optional boolean that is False for an audio manager that
+            plays nothing.
+
+    Returns:
+        The instance of an AudioManager class shared by the whole game.
+    """
+    return AudioManager(enabled)
@@ -0,0 +1,492 @@
+"""
+Step many independent PlatFrogs games at once, holding the state of every game
+in NumPy arrays.
+
+Each tick follows the same rules, in the same order, as Player.update and
+GameModel.update, including the way pygame Rects round positions, so given the
+same platforms the player moves, lands and scrolls exactly like in the scalar
+game. Levels are not the scalar game's: they follow the path rules of the
+level generator, but with a NumPy random number generator and without the
+extra platforms beside the path, as generating the real chunks in Python for
+every game would cost more than the rest of the tick. A batch game therefore
+plays a different level from a GameModel, even with the same seed.
+"""
+import numpy as np
+from settings import (HEIGHT,
+                      WIDTH,
+                      PLAYER_ACC,
+                      PLAYER_FRICTION,
+                      PLAYER_GRAVITY,
+                      PLAYER_JUMP,
+                      PLATFORM_LIST,)
+from atlas_view import frame_size
+from platform_model import PLATFORM_FRAMES
+from level_model import MIN_RISE, MAX_RISE, reach
+
+PLAYER_WIDTH, PLAYER_HEIGHT = frame_size("lookleft.png")
+PLATFORM_SIZES = np.array([frame_size(name) for name in PLATFORM_FRAMES])
+
+# Most platforms a game can hold. Path platforms are spawned 60 pixels above
+# the screen and removed once they scroll off the bottom, so they fit in a
+# band HEIGHT + 60 tall, at least MIN_RISE apart: at most 11. The starting
+# platforms are closer together, but below the path, and leave the band as
+# the path fills it, adding at most one more. Spawning raises an error
+# rather than overwrite a platform if this is ever exceeded.
+MAX_PLATFORMS = (HEIGHT + 60) // MIN_RISE + 2
+
+# Slot number of each row of the platform arrays.
+SLOTS = np.arange(MAX_PLATFORMS, dtype=np.uint8)[:, np.newaxis]
+
+# How far sideways a player can reach for each rise between platforms.
+REACH = np.array([reach(rise) for rise in range(MAX_RISE + 1)])
+
+# Integer type of rectangle coordinates, which are world coordinates like a
+# pygame Rect's, so they keep getting smaller as a player climbs.
+COORD = np.int32
+
+
+def round_rect(values):
+    """
+    Round positions the way a pygame Rect does when given floats (halves are
+    rounded away from zero).
+
+    Args:
+        values: A NumPy array of floats.
+
+    Returns:
+        A NumPy array of integers.
+    """
+    # Casting to an integer type truncates towards zero.
+    return (values + np.copysign(0.5, values)).astype(COORD)
+
+
+class BatchGameModel:
+    """
+    A batch of independent headless games stepped together.
+
+    Every quantity is stored as its own array, with one entry (or one column
+    of platform slots) per game.
+
+    Attributes:
+        size: An integer containing the number of games.
+        rng: A NumPy random Generator used to spawn platforms.
+        pos_x, pos_y: Float arrays of the position of each player.
+        vel_x, vel_y: Float arrays of the velocity of each player.
+        acc_x, acc_y: Float arrays of the acceleration of each player.
+        rect_x, rect_y: Integer arrays of the top-left corner of each player's
+            rectangle.
+        jumping: A boolean array that is True for players that are jumping.
+        grounded: A boolean array that is True for players that landed on a
+            platform in the last update, like Player.ground.
+        alive: A boolean array that is True for players still in the game,
+            like Player.alive() (False once scrolled off the top after
+            falling).
+        playing: A boolean array that is True for games still being played.
+        score: An integer array of the score of each game.
+        frames: An integer array of the number of ticks each game was played.
+        plat_x, plat_y, plat_w, plat_h: (MAX_PLATFORMS, size) integer arrays
+            of the rectangle of every platform slot. Slots are the first axis
+            so that reductions over a game's platforms run across whole rows.
+        plat_active: A (MAX_PLATFORMS, size) boolean array that is True for
+            slots holding a platform.
+        plat_order: A (MAX_PLATFORMS, size) integer array of the order
+            platforms were added in, which breaks ties the same way the
+            scalar game's PlatformGroup order does.
+        camera: A float array of the world y coordinate of the top of each
+            game's screen, like GameModel.camera.y.
+        level_bottom: An integer array of the world y coordinate of the
+            bottom of each game's level, like GameModel.level_bottom.
+        next_height, next_x, next_kind: Integer arrays of the height, x
+            coordinate and frame index of the next platform of each level.
+        ticks: An integer containing the number of times update was called.
+    """
+
+    def __init__(self, size, seed=None):
+        """
+        Create a batch of games and start all of them.
+
+        Args:
+            size: An integer containing the number of games.
+            seed: An optional integer used to seed platform spawning.
+        """
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.pos_x = np.zeros(size)
+        self.pos_y = np.zeros(size)
+        self.vel_x = np.zeros(size)
+        self.vel_y = np.zeros(size)
+        self.acc_x = np.zeros(size)
+        self.acc_y = np.zeros(size)
+        self.rect_x = np.zeros(size, dtype=COORD)
+        self.rect_y = np.zeros(size, dtype=COORD)
+        self.jumping = np.zeros(size, dtype=bool)
+        self.grounded = np.zeros(size, dtype=bool)
+        self.alive = np.zeros(size, dtype=bool)
+        self.playing = np.zeros(size, dtype=bool)
+        self.score = np.zeros(size, dtype=np.int32)
+        self.frames = np.zeros(size, dtype=np.int32)
+        shape = (MAX_PLATFORMS, size)
+        self.plat_x = np.zeros(shape, dtype=COORD)
+        self.plat_y = np.zeros(shape, dtype=COORD)
+        self.plat_w = np.zeros(shape, dtype=COORD)
+        self.plat_h = np.zeros(shape, dtype=COORD)
+        self.plat_active = np.zeros(shape, dtype=bool)
+        self.plat_order = np.zeros(shape, dtype=np.int64)
+        self.camera = np.zeros(size)
+        self.level_bottom = np.zeros(size, dtype=COORD)
+        self.next_height = np.zeros(size, dtype=np.int32)
+        self.next_x = np.zeros(size, dtype=COORD)
+        self.next_kind = np.zeros(size, dtype=np.int8)
+        self.ticks = 0
+        self._index = np.arange(size)
+        self.new()
+
+    def new(self, games=None):
+        """
+        Start new games, like GameModel.new.
+
+        Args:
+            games: An optional boolean array selecting the games to restart.
+                All games are restarted if it is None.
+        """
+        if games is None:
+            games = np.ones(self.size, dtype=bool)
+        count = int(games.sum())
+        self.pos_x[games] = 100
+        self.pos_y[games] = HEIGHT - 50
+        for array in (self.vel_x, self.vel_y, self.acc_x, self.acc_y):
+            array[games] = 0
+        self.rect_x[games] = 100 - PLAYER_WIDTH // 2
+        self.rect_y[games] = HEIGHT - 50 - PLAYER_HEIGHT // 2
+        self.jumping[games] = False
+        self.grounded[games] = False
+        self.alive[games] = True
+        self.playing[games] = True
+        self.score[games] = 0
+        self.frames[games] = 0
+
+        self.plat_active[:, games] = False
+        starting = round_rect(np.array(PLATFORM_LIST, dtype=float))
+        for slot, (x_coord, y_coord) in enumerate(starting):
+            kinds = self.rng.integers(0, len(PLATFORM_SIZES), count)
+            self.plat_x[slot, games] = x_coord
+            self.plat_y[slot, games] = y_coord
+            self.plat_w[slot, games] = PLATFORM_SIZES[kinds, 0]
+            self.plat_h[slot, games] = PLATFORM_SIZES[kinds, 1]
+            self.plat_active[slot, games] = True
+            self.plat_order[slot, games] = slot
+
+        # Start each level above the last (highest) starting platform.
+        self.camera[games] = 0
+        self.level_bottom[games] = y_coord
+        self.next_height[games] = 0
+        self.next_x[games] = x_coord
+        self.next_kind[games] = kinds
+        self._next_platform(np.flatnonzero(games))
+
+    def load(self, index, game_model):
+        """
+        Copy the state of a scalar game into one game of the batch.
+
+        Args:
+            index: An integer containing the index of the game in the batch.
+            game_model: An instance of a GameModel class.
+        """
+        player = game_model.player
+        self.pos_x[index], self.pos_y[index] = player.pos
+        self.vel_x[index], self.vel_y[index] = player.vel
+        self.acc_x[index], self.acc_y[index] = player.acc
+        self.rect_x[index], self.rect_y[index] = player.rect.topleft
+        self.jumping[index] = player.jumping
+        self.grounded[index] = player.ground is not None
+        self.alive[index] = player.alive()
+        self.playing[index] = game_model.playing
+        self.score[index] = game_model.score
+        self.frames[index] = 0
+        if len(game_model.platforms) > MAX_PLATFORMS:
+            raise ValueError(f"game has more than {MAX_PLATFORMS} platforms")
+        self.plat_active[:, index] = False
+        for slot, plat in enumerate(game_model.platforms):
+            (self.plat_x[slot, index], self.plat_y[slot, index],
+             self.plat_w[slot, index], self.plat_h[slot, index]) = plat.rect
+            self.plat_active[slot, index] = True
+            self.plat_order[slot, index] = slot
+
+        # Carry on from the next platform of the game's level, or from the
+        # top of its path if it has no upcoming platforms.
+        self.camera[index] = game_model.camera.y
+        self.level_bottom[index] = game_model.level_bottom
+        if game_model.upcoming:
+            (self.next_height[index], self.next_x[index],
+             self.next_kind[index]) = game_model.upcoming[0]
+        else:
+            (self.next_height[index], self.next_x[index],
+             self.next_kind[index]) = game_model.level.top
+            self._next_platform(np.array([index]))
+
+    def _next_platform(self, games):
+        """
+        Replace the next platform of some levels with a platform that can be
+        reached from it, like level_model.next_platform.
+
+        Args:
+            games: An integer array of the indices of the games.
+        """
+        count = games.size
+        kinds = self.rng.integers(0, len(PLATFORM_SIZES), count)
+        width = PLATFORM_SIZES[kinds, 0]
+        below_x = self.next_x[games].astype(np.int64)
+        below_width = PLATFORM_SIZES[self.next_kind[games], 0]
+        rise = self.rng.integers(MIN_RISE, MAX_RISE + 1, count)
+        gap = REACH[rise] - 2
+        lowest = np.maximum(0, below_x - gap - width)
+        highest = np.minimum(WIDTH - width, below_x + below_width + gap)
+        self.next_height[games] += rise
+        self.next_x[games] = self.rng.integers(lowest, highest + 1)
+        self.next_kind[games] = kinds
+
+    def _collisions(self, games):
+        """
+        Find which platforms overlap the rectangles of some players.
+
+        Args:
+            games: A boolean array selecting the players to test.
+
+        Returns:
+            A (MAX_PLATFORMS, size) boolean array.
+        """
+        rect_x = self.rect_x
+        rect_y = self.rect_y
+        hits = self.plat_active & games
+        hits &= rect_x < self.plat_x + self.plat_w
+        hits &= rect_x + PLAYER_WIDTH > self.plat_x
+        hits &= rect_y < self.plat_y + self.plat_h
+        hits &= rect_y + PLAYER_HEIGHT > self.plat_y
+        return hits
+
+    def jump(self, games):
+        """
+        Make players jump if they are standing on a platform, like
+        Player.jump.
+
+        Args:
+            games: A boolean array selecting the games where jump is pressed.
+        """
+        jumps = games & self.playing & self.grounded & ~self.jumping
+        self.jumping[jumps] = True
+        self.vel_y[jumps] = -PLAYER_JUMP
+
+    def jump_cut(self, games):
+        """
+        Shorten the jumps of players, like Player.jump_cut.
+
+        Args:
+            games: A boolean array selecting the games where jump is released.
+        """
+        cuts = games & self.playing & self.jumping & (self.vel_y < -3)
+        self.vel_y[cuts] = -3
+
+    def step(self, left, right, jump=None, jump_cut=None):
+        """
+        Apply one tick of input and advance every game still being played.
+
+        Args:
+            left: A boolean array that is True where the left key is held.
+            right: A boolean array that is True where the right key is held.
+            jump: An optional boolean array that is True where jump is
+                pressed this tick.
+            jump_cut: An optional boolean array that is True where jump is
+                released this tick.
+        """
+        if jump is not None:
+            self.jump(jump)
+        if jump_cut is not None:
+            self.jump_cut(jump_cut)
+        self.update(left, right)
+
+    def update(self, left, right):
+        """
+        Advance every game still being played by one tick, like
+        GameModel.update.
+
+        Args:
+            left: A boolean array that is True where the left key is held.
+            right: A boolean array that is True where the right key is held.
+        """
+        self.ticks += 1
+        games = self.playing.copy()
+        self.frames += games
+        self._update_players(games & self.alive, left, right)
+        self._land(games)
+        self._scroll(games)
+        self._spawn(games)
+        self._fall(games)
+        self.playing &= self.plat_active.max(axis=0)
+
+    def _update_players(self, games, left, right):
+        """
+        Apply the physics of Player.update to the selected players.
+
+        Args:
+            games: A boolean array selecting the players to update.
+            left: A boolean array that is True where the left key is held.
+            right: A boolean array that is True where the right key is held.
+        """
+        # Holding both keys cancels out, like moving with "Stop".
+        acc_x = np.subtract(right, left, dtype=float)
+        acc_x *= PLAYER_ACC
+        acc_x += self.vel_x * PLAYER_FRICTION
+
+        vel_x = self.vel_x + acc_x
+        vel_x[np.abs(vel_x) < 0.1] = 0
+        vel_y = self.vel_y + PLAYER_GRAVITY
+        pos_x = vel_x + 0.5 * acc_x
+        pos_x += self.pos_x
+        pos_y = vel_y + 0.5 * PLAYER_GRAVITY
+        pos_y += self.pos_y
+
+        # Wrap around the screen.
+        pos_x[pos_x < -PLAYER_WIDTH / 2] = WIDTH + PLAYER_WIDTH / 2
+        pos_x[pos_x > WIDTH + PLAYER_WIDTH / 2] = -PLAYER_WIDTH / 2
+
+        rect_x = round_rect(pos_x)
+        rect_x -= PLAYER_WIDTH // 2
+        rect_y = round_rect(pos_y)
+        rect_y -= PLAYER_HEIGHT
+
+        # Usually every game is being played, so the arrays can be swapped
+        # in whole instead of copying the selected entries.
+        if games.all():
+            self.acc_x, self.vel_x, self.vel_y = acc_x, vel_x, vel_y
+            self.pos_x, self.pos_y = pos_x, pos_y
+            self.rect_x, self.rect_y = rect_x, rect_y
+            self.acc_y.fill(PLAYER_GRAVITY)
+            return
+        np.copyto(self.acc_x, acc_x, where=games)
+        np.copyto(self.acc_y, PLAYER_GRAVITY, where=games)
+        np.copyto(self.vel_x, vel_x, where=games)
+        np.copyto(self.vel_y, vel_y, where=games)
+        np.copyto(self.pos_x, pos_x, where=games)
+        np.copyto(self.pos_y, pos_y, where=games)
+        np.copyto(self.rect_x, rect_x, where=games)
+        np.copyto(self.rect_y, rect_y, where=games)
+
+    def _land(self, games):
+        """
+        Rest falling players on the lowest platform they hit.
+
+        Args:
+            games: A boolean array selecting the games to update.
+        """
+        self.grounded[games] = False
+        hits = self._collisions(games & (self.vel_y > 0))
+        counts = hits.sum(axis=0, dtype=np.uint8)
+        hit = np.flatnonzero(counts)
+        if hit.size == 0:
+            return
+
+        # Most players hit a single platform, whose slot is the sum of the
+        # slots hit. Gathering whole columns is slow, so only players
+        # hitting more than one platform pick the first platform (in the
+        # order they were added) with the lowest bottom.
+        first = (hits * SLOTS).sum(axis=0, dtype=np.uint8)[hit]
+        several = counts[hit] > 1
+        if several.any():
+            crowded = hit[several]
+            hits = hits[:, crowded]
+            bottoms = np.where(hits, self.plat_y[:, crowded]
+                               + self.plat_h[:, crowded],
+                               np.iinfo(COORD).min)
+            lowest = hits & (bottoms == bottoms.max(axis=0))
+            first[several] = np.argmin(
+                np.where(lowest, self.plat_order[:, crowded],
+                         np.iinfo(np.int64).max), axis=0)
+        plat_x = self.plat_x[first, hit]
+        plat_y = self.plat_y[first, hit]
+        plat_w = self.plat_w[first, hit]
+        plat_h = self.plat_h[first, hit]
+        pos_x = self.pos_x[hit]
+        landed = ((pos_x < plat_x + plat_w)
+                  & (pos_x > plat_x)
+                  & (self.pos_y[hit] < plat_y + plat_h // 2))
+        lands = hit[landed]
+        self.pos_y[lands] = plat_y[landed]
+        self.vel_y[lands] = 0
+        self.jumping[lands] = False
+        self.grounded[lands] = True
+
+    def _scroll(self, games):
+        """
+        Move the camera up in games whose player is in the top fourth of the
+        screen, removing and scoring the platforms that go off the bottom.
+
+        Args:
+            games: A boolean array selecting the games to update.
+        """
+        scrolls = games & (self.rect_y - self.camera <= HEIGHT / 4)
+        if not scrolls.any():
+            return
+        self.camera[scrolls] -= np.maximum(np.abs(self.vel_y[scrolls]), 2)
+
+        # Many games scroll at once, so test the platforms of every game
+        # rather than gathering the columns of the ones scrolling.
+        off = self.plat_active & scrolls
+        off &= self.plat_y >= self.camera + HEIGHT
+        self.plat_active ^= off
+        self.score += 10 * off.sum(axis=0, dtype=np.int32)
+
+    def _spawn(self, games):
+        """
+        Spawn the next platform of each level once it is just above the top
+        of the screen, like GameModel.spawn.
+
+        Args:
+            games: A boolean array selecting the games to update.
+
+        Raises:
+            RuntimeError: If a game has no free platform slot.
+        """
+        needs = np.flatnonzero(games & (self.level_bottom - self.next_height
+                                        - self.camera >= -60))
+        while needs.size:
+            # Put each new platform in the first free slot, numbered after
+            # all older platforms as if they were added one at a time.
+            slots = np.argmin(self.plat_active[:, needs], axis=0)
+            if self.plat_active[slots, needs].any():
+                raise RuntimeError(f"game has more than {MAX_PLATFORMS} "
+                                   "platforms")
+            kinds = self.next_kind[needs]
+            self.plat_x[slots, needs] = self.next_x[needs]
+            self.plat_y[slots, needs] = (self.level_bottom[needs]
+                                         - self.next_height[needs])
+            self.plat_w[slots, needs] = PLATFORM_SIZES[kinds, 0]
+            self.plat_h[slots, needs] = PLATFORM_SIZES[kinds, 1]
+            self.plat_active[slots, needs] = True
+            self.plat_order[slots, needs] = (self.ticks * MAX_PLATFORMS
+                                             + slots)
+            self._next_platform(needs)
+            needs = needs[self.level_bottom[needs] - self.next_height[needs]
+                          - self.camera[needs] >= -60]
+
+    def _fall(self, games):
+        """
+        Move the camera down once a player falls off the bottom of the
+        screen, keeping the player in its place on the screen and removing
+        platforms that go off the top.
+
+        Args:
+            games: A boolean array selecting the games to update.
+        """
+        falling = games & (self.rect_y + PLAYER_HEIGHT - self.camera > HEIGHT)
+        falls = np.flatnonzero(falling)
+        if falls.size == 0:
+            return
+        distance = np.maximum(self.vel_y[falls], 10)
+        self.camera[falls] += distance
+        self.pos_y[falls] += distance
+        self.plat_active &= ((self.plat_y + self.plat_h >= self.camera)
+                             | ~falling)
+
+        player = falls[self.alive[falls]]
+        self.alive[player] = (self.rect_y[player] + PLAYER_HEIGHT
+                              >= self.camera[player])
@@ -0,0 +1,105 @@
+"""
+Compare how many game ticks per second the NumPy batch engine runs against a
+loop over headless GameModel objects.
+
+Every game holds the right arrow key and keeps pressing jump, and games that
+end are restarted. Each engine is timed a few times and its best run is kept.
+The speedup is reported against TARGET_SPEEDUP, which runs on a noisy machine
+can land either side of. The exit status is only 1 for a gross regression,
+when the batch engine is less than MIN_SPEEDUP times as fast as the loop.
+"""
+import sys
+import time
+import numpy as np
+from batch_model import BatchGameModel
+from game_model import GameModel
+from input_log import RIGHT, JUMP
+from input_model import InputSnapshot
+
+# Input of every tick: holding the right arrow key and pressing jump.
+JUMP_RIGHT = InputSnapshot(JUMP | RIGHT)
+
+# Number of times as many ticks per second the batch engine aims to run.
+TARGET_SPEEDUP = 100
+
+# Least number of times as many ticks per second the batch engine must run
+# before it counts as a regression, well below the noise of TARGET_SPEEDUP.
+MIN_SPEEDUP = 50
+
+# Times each engine is timed, keeping the fastest run.
+REPEAT = 3
+
+
+def bench_scalar(games, frames):
+    """
+    Time a loop over headless GameModel objects.
+
+    Args:
+        games: An integer containing the number of games.
+        frames: An integer containing the number of ticks to run each game.
+
+    Returns:
+        A float containing the number of game ticks run per second.
+    """
+    models = [GameModel(headless=True) for _ in range(games)]
+    for game_model in models:
+        game_model.playing = False
+    start = time.perf_counter()
+    for _ in range(frames):
+        for game_model in models:
+            if not game_model.playing:
+                game_model.new()
+                game_model.playing = True
+            game_model.update(JUMP_RIGHT)
+    return games * frames / (time.perf_counter() - start)
+
+
+def bench_batch(games, frames):
+    """
+    Time the NumPy batch engine.
+
+    Args:
+        games: An integer containing the number of games.
+        frames: An integer containing the number of ticks to run each game.
+
+    Returns:
+        A float containing the number of game ticks run per second.
+    """
+    batch = BatchGameModel(games, seed=0)
+    left = np.zeros(games, dtype=bool)
+    right = np.ones(games, dtype=bool)
+    start = time.perf_counter()
+    for _ in range(frames):
+        if not batch.playing.all():
+            batch.new(~batch.playing)
+        batch.step(left, right, right)
+    return games * frames / (time.perf_counter() - start)
+
+
+def main(argv):
+    """
+    Compare the engines from the command line.
+
+    Args:
+        argv: A list of the command line arguments, optionally holding the
+            number of games and of ticks to run each game.
+
+    Returns:
+        An integer exit status, 1 if the speedup is below MIN_SPEEDUP.
+    """
+    games = int(argv[0]) if len(argv) > 0 else 10000
+    frames = int(argv[1]) if len(argv) > 1 else 200
+    scalar = max(bench_scalar(100, frames) for _ in range(REPEAT))
+    batch = max(bench_batch(games, frames) for _ in range(REPEAT))
+    speedup = batch / scalar
+    print(f"scalar: {scalar:.0f} game ticks/sec")
+    print(f" batch: {batch:.0f} game ticks/sec ({games} games, "
+          f"{speedup:.0f}x, target {TARGET_SPEEDUP}x)")
+    if speedup < MIN_SPEEDUP:
+        print(f"REGRESSION: batch is under {MIN_SPEEDUP}x as fast")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,43 @@
+"""
+Measure the CPU used while the start screen waits for a key.
+
+Shows the start screen, leaves it idle for a number of seconds and reports
+the share of one core the process used meanwhile. Music is decoded before
+timing starts, so only the waiting is measured.
+"""
+import sys
+import time
+import pygame as pg
+from game_model import GameModel
+
+
+def bench(seconds):
+    """
+    Time the start screen waiting for a key with no input.
+
+    Args:
+        seconds: A float containing how long to leave the screen idle.
+
+    Returns:
+        A float containing the CPU time used divided by the time waited.
+    """
+    game_model = GameModel(record=False)
+    game_model.view.audio.loaded.wait()
+    game_model.view.draw_start_screen()
+    pg.event.clear()
+
+    # A key release ends the wait once the time is up.
+    pg.time.set_timer(pg.KEYUP, int(seconds * 1000), loops=1)
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    game_model.wait_for_key()
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    game_model.view.audio.close()
+    return cpu / wall
+
+
+if __name__ == "__main__":
+    SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"idle start screen: {bench(SECONDS):.1%} of a core over "
+          f"{SECONDS:g} s")
@@ -0,0 +1,60 @@
+"""
+Compare the full-screen and dirty rectangle rendering of the game.
+
+Plays the same scripted game with each renderer and reports the average time
+taken to draw a frame and the average number of pixels repainted per frame.
+"""
+import sys
+import time
+import pygame as pg
+from game_model import GameModel
+from game_view import GameView
+from headless import HopAgent
+from settings import WIDTH, HEIGHT
+
+
+def bench(dirty_rects, frames, seed=0):
+    """
+    Time the drawing of a scripted game.
+
+    Args:
+        dirty_rects: A boolean that is True to use the dirty rectangle
+            renderer.
+        frames: An integer containing the number of frames to draw.
+        seed: An optional integer used to seed the games, so both renderers
+            draw the same games.
+
+    Returns:
+        A tuple containing the average time in milliseconds and the average
+        number of pixels repainted per frame.
+    """
+    game_model = GameModel(seed=seed, record=False)
+    game_view = GameView(game_model, dirty_rects=dirty_rects)
+    source = HopAgent(game_model)
+    draw_time = 0
+    pixels = 0
+    for frame in range(frames):
+        if frame == 0 or not game_model.playing:
+            game_model.new()
+            game_model.playing = True
+            if game_view.renderer is not None:
+                game_view.renderer.reset()
+        pg.event.pump()
+        game_model.update(source.poll())
+
+        start = time.perf_counter()
+        game_view.draw()
+        draw_time += time.perf_counter() - start
+        if game_view.renderer is None:
+            pixels += WIDTH * HEIGHT
+        else:
+            pixels += game_view.renderer.pixels
+    return draw_time * 1000 / frames, pixels / frames
+
+
+if __name__ == "__main__":
+    FRAMES = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    for name, dirty in [("full", False), ("dirty", True)]:
+        MS, PIXELS = bench(dirty, FRAMES)
+        print(f"{name:>5}: {MS:.3f} ms/frame, {PIXELS:.0f} pixels/frame "
+              f"({PIXELS / (WIDTH * HEIGHT):.1%} of screen)")
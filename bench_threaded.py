@@ -0,0 +1,102 @@
+"""
+Compare the pacing of simulation ticks and drawn frames when the game is
+updated and drawn on one thread, and when the simulation runs on a thread of
+its own.
+
+Plays a scripted game in each mode for a number of seconds and prints a
+histogram of the intervals between ticks and between frames. Pass a number of
+milliseconds to add to every frame, as if flipping the display were slow.
+"""
+import sys
+import time
+import pygame as pg
+from game_model import GameModel
+from headless import HopAgent
+from input_model import NO_INPUT
+from profiler import FrameHistogram
+from settings import FPS, RENDER_FPS
+from threaded_model import SimulationThread
+from timestep import FixedTimestep
+
+
+def slow_down(game_view, delay):
+    """
+    Make every frame drawn by a view take longer, like a slow display.
+
+    Args:
+        game_view: An instance of a GameView class.
+        delay: A float containing the seconds to add to each frame.
+    """
+    draw = game_view.draw
+
+    def slow_draw(*args):
+        draw(*args)
+        time.sleep(delay)
+    game_view.draw = slow_draw
+
+
+def bench(threaded, seconds, delay=0, seed=0):
+    """
+    Play a scripted game, timing the intervals between ticks and frames.
+
+    Args:
+        threaded: A boolean that is True to run the simulation on a thread.
+        seconds: A float containing how long to play for.
+        delay: An optional float containing the seconds added to each frame.
+        seed: An optional integer used to seed the games.
+
+    Returns:
+        A tuple containing a FrameHistogram of the ticks and one of the
+        frames.
+    """
+    game_model = GameModel(seed=seed, record=False)
+    game_view = game_model.view
+    slow_down(game_view, delay)
+    source = HopAgent(game_model)
+    ticks = FrameHistogram()
+    frames = FrameHistogram()
+    timestep = FixedTimestep(FPS)
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        game_model.new()
+        game_model.playing = True
+        game_model.clock.tick()
+        timestep.reset()
+        inputs = NO_INPUT
+        if threaded:
+            simulation = SimulationThread(game_model, FPS, ticks)
+            simulation.start()
+        while game_model.playing and time.perf_counter() < end:
+            elapsed = game_model.clock.tick(RENDER_FPS) / 1000
+            pg.event.pump()
+            frames.tick()
+            if threaded:
+                simulation.post(source.poll())
+                state, alpha = simulation.latest()
+                for sound in simulation.sounds(state):
+                    game_view.audio.play(sound)
+                game_view.draw(alpha, state)
+                continue
+            inputs = inputs.then(source.poll())
+            for _ in range(timestep.advance(elapsed)):
+                game_model.update(inputs)
+                inputs = inputs.held()
+                ticks.tick()
+            game_view.draw(timestep.alpha)
+        if threaded:
+            simulation.stop()
+        game_model.level.close()
+    return ticks, frames
+
+
+if __name__ == "__main__":
+    SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    DELAY = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.025
+    for NAME, THREADED in [("one thread", False), ("threaded", True)]:
+        TICKS, FRAMES = bench(THREADED, SECONDS, DELAY)
+        for KIND, HISTOGRAM in [("ticks", TICKS), ("frames", FRAMES)]:
+            TIMES = HISTOGRAM.percentiles()
+            print(f"{NAME}, {KIND} ({len(HISTOGRAM.intervals)}): "
+                  + ", ".join(f"p{percent} {time_ms:.1f} ms"
+                              for percent, time_ms in TIMES.items()))
+            print("\n".join(HISTOGRAM.lines()))
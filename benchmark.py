@@ -0,0 +1,503 @@
+"""
+Benchmark the hot paths of the game and compare the results with a saved
+baseline.
+
+Run `python benchmark.py` to time every benchmark and compare it with the
+baseline file, `python benchmark.py --save` to store the results as the new
+baseline, or pass benchmark names to run only some of them. The exit status
+is 1 if any benchmark got slower than its threshold allows. Pass `--memory`
+to also show the memory used by each player and platform.
+"""
+import argparse
+import itertools
+import json
+import os
+from os import path
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import pygame as pg
+from atlas_view import IMG_DIR, read_frames
+from game_model import GameModel
+from game_view import GameView
+from headless import HopAgent
+from platform_model import Platform
+from player_model import Player
+from score_store import ScoreStore
+from spritesheet_view import Spritesheet
+from settings import HEIGHT, FONT_NAME, SPRITESHEET
+from text_view import find_font
+
+BASELINE_FILE = "benchmark_baseline.json"
+
+# Fraction a benchmark may get slower by before it counts as a regression.
+DEFAULT_THRESHOLD = 0.25
+
+# Registered benchmarks, by name.
+BENCHMARKS = {}
+
+
+class Benchmark:
+    """
+    A piece of code to time, with how often to run it.
+
+    Attributes:
+        name: A string containing the name of the benchmark.
+        setup: A function taking no arguments that prepares the benchmark and
+            returns a function taking no arguments to time.
+        number: An integer containing how many times the timed function is
+            called per repeat.
+        threshold: A float containing the fraction the time may grow by
+            before it counts as a regression.
+    """
+
+    def __init__(self, name, setup, number, threshold):
+        """
+        Describe a benchmark.
+
+        Args:
+            name: A string containing the name of the benchmark.
+            setup: A function returning the function to time.
+            number: An integer containing how many calls are timed together.
+            threshold: A float containing the fraction the time may grow by
+                before it counts as a regression.
+        """
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.threshold = threshold
+
+    def run(self, repeat=5, scale=1):
+        """
+        Time the benchmark.
+
+        Args:
+            repeat: An optional integer containing how many times to time
+                the calls. The fastest repeat is used, as slower ones were
+                disturbed by something else running.
+            scale: An optional float to multiply the number of calls by.
+
+        Returns:
+            A float containing the time of one call in microseconds.
+        """
+        function = self.setup()
+        number = max(1, int(self.number * scale))
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best / number * 1e6
+
+
+def benchmark(number, threshold=DEFAULT_THRESHOLD):
+    """
+    Register a setup function as a benchmark named after it.
+
+    Args:
+        number: An integer containing how many calls are timed together.
+        threshold: An optional float containing the fraction the time may
+            grow by before it counts as a regression.
+
+    Returns:
+        A decorator that registers the function and returns it unchanged.
+    """
+    def register(setup):
+        BENCHMARKS[setup.__name__] = Benchmark(setup.__name__, setup, number,
+                                               threshold)
+        return setup
+    return register
+
+
+def started_game(headless=True, seed=0):
+    """
+    Make a model and start a game in it.
+
+    Args:
+        headless: An optional boolean that is True for a game without a view.
+        seed: An optional integer used to seed the game.
+
+    Returns:
+        An instance of a GameModel class.
+    """
+    game_model = GameModel(headless=headless, seed=seed, record=False)
+    game_model.new()
+    game_model.playing = True
+    return game_model
+
+
+@benchmark(number=20000)
+def player_update():
+    """
+    Time the physics of the player falling through the air.
+
+    Returns:
+        A function updating the player.
+    """
+    player = started_game().player
+
+    def step():
+        player.pos.y = HEIGHT / 2
+        player.update()
+    return step
+
+
+@benchmark(number=20000)
+def player_animate():
+    """
+    Time picking the frame of a walking player.
+
+    Returns:
+        A function animating the player.
+    """
+    player = started_game(headless=False).player
+    player.vel.x = 2
+
+    return player.animate
+
+
+@benchmark(number=10000)
+def update_steady():
+    """
+    Time a game tick with the player standing still on a platform.
+
+    Returns:
+        A function updating the game.
+    """
+    return started_game().update
+
+
+@benchmark(number=10000)
+def update_scrolling():
+    """
+    Time a game tick with the player at the top of the screen, so the
+    platforms scroll and new ones keep being spawned.
+
+    Returns:
+        A function updating the game.
+    """
+    game_model = started_game()
+
+    def step():
+        game_model.player.pos.y = game_model.camera.y + HEIGHT / 4
+        game_model.update()
+    return step
+
+
+@benchmark(number=5000, threshold=0.4)
+def update_falling():
+    """
+    Time a game tick while the player falls off the bottom of the screen and
+    everything moves up, starting a new game whenever one ends.
+
+    Returns:
+        A function updating the game.
+    """
+    game_model = started_game()
+
+    def step():
+        if not game_model.playing:
+            game_model.new()
+            game_model.playing = True
+            game_model.player.pos.y = game_model.camera.y + HEIGHT + 100
+        game_model.update()
+    game_model.player.pos.y = HEIGHT + 100
+    return step
+
+
+@benchmark(number=2000, threshold=0.4)
+def view_draw():
+    """
+    Time drawing a frame of a game to the screen.
+
+    Returns:
+        A function drawing the game.
+    """
+    game_model = started_game(headless=False)
+    game_view = GameView(game_model)
+    game_model.update()
+    return game_view.draw
+
+
+@benchmark(number=5000)
+def spritesheet_get_image():
+    """
+    Time getting a scaled frame of the spritesheet that is already cached.
+
+    Returns:
+        A function getting an image.
+    """
+    spritesheet = started_game(headless=False).view.spritesheet
+    x_coord, y_coord, width, height, _ = read_frames()["jumpright.png"]
+    return lambda: spritesheet.get_image(x_coord, y_coord, width, height,
+                                         scale=1.2)
+
+
+@benchmark(number=5000)
+def spritesheet_cut():
+    """
+    Time cutting a scaled frame out of the spritesheet, with a cache too
+    small to keep it.
+
+    Returns:
+        A function getting an image.
+    """
+    started_game(headless=False)
+    spritesheet = Spritesheet(path.join(IMG_DIR, SPRITESHEET), max_bytes=0)
+    frames = [read_frames()[name][:4] for name in ("jumpleft.png",
+                                                   "jumpright.png")]
+    calls = itertools.cycle(frames)
+    return lambda: spritesheet.get_image(*next(calls), scale=1.2)
+
+
+@benchmark(number=20000)
+def platform_spawn():
+    """
+    Time spawning a platform from the pool and removing it again.
+
+    Returns:
+        A function spawning and removing a platform.
+    """
+    game_model = started_game()
+
+    def step():
+        plat = game_model.pool.acquire(game_model.rng.randrange(0, 300),
+                                       game_model.rng.randrange(-60, -30),
+                                       game_model.rng)
+        game_model.platforms.add(plat)
+        game_model.pool.release(plat)
+    return step
+
+
+@benchmark(number=20000)
+def game_snapshot():
+    """
+    Time saving the state of a game partway up its level.
+
+    Returns:
+        A function making a snapshot.
+    """
+    game_model = started_game()
+    source = HopAgent(game_model)
+    for _ in range(600):
+        game_model.update(source.poll())
+    return game_model.snapshot
+
+
+@benchmark(number=20000)
+def game_restore():
+    """
+    Time rolling a game back to a snapshot, as a search through its future
+    would.
+
+    Returns:
+        A function restoring the snapshot.
+    """
+    game_model = started_game()
+    source = HopAgent(game_model)
+    for _ in range(600):
+        game_model.update(source.poll())
+    data = game_model.snapshot()
+    return lambda: game_model.restore(data)
+
+
+@benchmark(number=5000, threshold=0.4)
+def session():
+    """
+    Time a whole session of a scripted player, updating and drawing the game
+    and starting new games when they end. Each repeat plays 5000 frames, and
+    the time is per frame.
+
+    Returns:
+        A function playing a frame of the session.
+    """
+    game_model = GameModel(seed=0, record=False)
+    game_view = GameView(game_model)
+    source = HopAgent(game_model)
+    game_model.playing = False
+
+    def frame():
+        if not game_model.playing:
+            game_model.new()
+            game_model.playing = True
+        pg.event.pump()
+        game_model.update(source.poll())
+        game_view.draw()
+    return frame
+
+
+@benchmark(number=1, threshold=0.4)
+def startup():
+    """
+    Time starting a new Python process that starts the game up to its first
+    frame, like main.py, and then exits.
+
+    Returns:
+        A function starting the game in a new process.
+    """
+    command = [sys.executable, "-c",
+               "import benchmark; benchmark.show_first_frame()"]
+    return lambda: subprocess.run(command, check=True,
+                                  stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL)
+
+
+def entity_memory(count=1000):
+    """
+    Measure the memory used by each entity of the simulation, including its
+    rect and vectors.
+
+    Args:
+        count: An optional integer containing how many of each entity to
+            make, to average out the memory of the list holding them.
+
+    Returns:
+        A dictionary mapping the names of the Player and Platform classes to
+        the bytes used by one of them.
+    """
+    makers = {"Platform": lambda: Platform(10, 10, kind=0),
+              "Player": Player}
+    sizes = {}
+    tracemalloc.start()
+    try:
+        for name, maker in makers.items():
+            before = tracemalloc.get_traced_memory()[0]
+            entities = [maker() for _ in range(count)]
+            sizes[name] = (tracemalloc.get_traced_memory()[0] - before) / count
+            del entities
+    finally:
+        tracemalloc.stop()
+    return sizes
+
+
+def show_first_frame():
+    """
+    Start the game the same way main.py does, up to drawing the start screen,
+    and exit straight away, without waiting for the music to be decoded.
+    """
+    find_font(FONT_NAME)
+    game_model = GameModel(scores=ScoreStore())
+    game_model.view.draw_start_screen()
+    os._exit(0)
+
+
+def machine():
+    """
+    Describe the machine and versions the benchmarks run on.
+
+    Returns:
+        A dictionary of strings.
+    """
+    return {"machine": platform.machine(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "pygame": pg.version.ver}
+
+
+def run(names=None, repeat=5, scale=1):
+    """
+    Run benchmarks.
+
+    Args:
+        names: An optional list of the names of benchmarks to run. All of
+            them are run if it is None.
+        repeat: An optional integer containing how many times to time each.
+        scale: An optional float to multiply the number of calls by.
+
+    Returns:
+        A dictionary mapping each benchmark name to its time in microseconds.
+    """
+    return {name: BENCHMARKS[name].run(repeat, scale)
+            for name in (names or BENCHMARKS)}
+
+
+def compare(results, baseline):
+    """
+    Compare results with a baseline.
+
+    Args:
+        results: A dictionary mapping benchmark names to times.
+        baseline: A dictionary mapping benchmark names to times.
+
+    Returns:
+        A list with a tuple for each result containing the benchmark name,
+        its baseline time (or None), its time, the fractional change (or
+        None) and a boolean that is True if it is a regression.
+    """
+    rows = []
+    for name, current in results.items():
+        before = baseline.get(name)
+        if before is None:
+            rows.append((name, None, current, None, False))
+            continue
+        change = current / before - 1
+        rows.append((name, before, current, change,
+                     change > BENCHMARKS[name].threshold))
+    return rows
+
+
+def main(argv):
+    """
+    Run the benchmarks from the command line.
+
+    Args:
+        argv: A list of the command line arguments.
+
+    Returns:
+        An integer exit status, 1 if there was a regression.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("names", nargs="*",
+                        help="benchmarks to run (all by default): "
+                        + ", ".join(BENCHMARKS))
+    parser.add_argument("--save", action="store_true",
+                        help="store the results as the baseline")
+    parser.add_argument("--baseline", default=BASELINE_FILE,
+                        help="baseline file to compare with or save to")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="times to repeat each benchmark")
+    parser.add_argument("--memory", action="store_true",
+                        help="show the memory used by each entity")
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name}")
+
+    results = run(args.names, args.repeat)
+    try:
+        with open(args.baseline) as file:
+            saved = json.load(file)
+    except FileNotFoundError:
+        saved = {"machine": machine(), "results": {}}
+    if saved["machine"] != machine():
+        print(f"warning: {args.baseline} was made on {saved['machine']}")
+
+    regressions = 0
+    for name, before, current, change, regression in \
+            compare(results, saved["results"]):
+        line = f"{name:>22}: {current:10.2f} us"
+        if change is not None:
+            line += f"  (baseline {before:.2f} us, {change:+.1%})"
+        if regression:
+            line += "  REGRESSION"
+            regressions += 1
+        print(line)
+    if args.memory:
+        for name, size in entity_memory().items():
+            print(f"{name:>22}: {size:10.1f} bytes")
+
+    if args.save:
+        saved["machine"] = machine()
+        saved["results"].update(results)
+        with open(args.baseline, "w") as file:
+            json.dump(saved, file, indent=1, sort_keys=True)
+        print(f"saved {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
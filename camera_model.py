@@ -0,0 +1,84 @@
+"""
+Keep track of the part of the game world shown on the screen.
+"""
+import pygame as pg
+from settings import WIDTH, HEIGHT
+
+
+class Camera:
+    """
+    The window onto the game world.
+
+    Sprites keep their positions in the world, whose y axis points down like
+    the screen's, and the camera moves instead of them. The camera only
+    moves up and down, so a point's screen position is its world position
+    less the camera's y coordinate.
+
+    Attributes:
+        y: A float containing the world y coordinate of the top of the
+            screen, which gets smaller as the camera scrolls up.
+        previous_y: A float containing y at the start of the last tick, used
+            to interpolate its position when drawing.
+    """
+
+    def __init__(self, y=0.0, previous_y=None):
+        """
+        Start the camera over the start of the world, or at a given position.
+
+        Args:
+            y: An optional float containing the world y coordinate of the top
+                of the screen.
+            previous_y: An optional float containing y at the start of the
+                last tick. By default it is y.
+        """
+        self.y = y
+        self.previous_y = y if previous_y is None else previous_y
+
+    def reset(self):
+        """
+        Move the camera back to the start of the world.
+        """
+        self.y = 0.0
+        self.previous_y = 0.0
+
+    def begin_tick(self):
+        """
+        Remember where the camera was at the start of a tick.
+        """
+        self.previous_y = self.y
+
+    def move(self, distance):
+        """
+        Move the camera down the world, or up if distance is negative.
+
+        Args:
+            distance: A number containing how far to move in pixels.
+        """
+        self.y += distance
+
+    def top(self, alpha=1):
+        """
+        Find the world y coordinate of the top of the screen in a frame.
+
+        Args:
+            alpha: An optional float from 0 to 1 containing how far the frame
+                is between the previous simulation tick and the latest one.
+
+        Returns:
+            An integer containing the coordinate, rounded the same way for
+            every sprite so they stay lined up.
+        """
+        return round(self.y + (self.previous_y - self.y) * (1 - alpha))
+
+    def bounds(self, alpha=1):
+        """
+        Find the part of the world on the screen in a frame.
+
+        Args:
+            alpha: An optional float from 0 to 1 containing how far the frame
+                is between the previous simulation tick and the latest one.
+
+        Returns:
+            A pygame Rect in world coordinates.
+        """
+        return pg.Rect(0, self.top(alpha), WIDTH, HEIGHT)
@@ -2,65 +2,43 @@
 Controller for the player of the PlatFrogs game.
 """
 import pygame as pg
-class PlayerController:
-    """
-    The controller class for controlling the player jumping and game quitting.
+from input_log import LEFT, RIGHT, JUMP, JUMP_CUT
+from input_model import InputSnapshot, press
 
-    Attributes:
-        game: An instance of a GameModel.
-    """
 
-    def __init__(self, game):
-        """
-        Initialize an instance of the game model as an attribute.
+class KeyboardInput:
+    """
+    Input source reading the player's input from the keyboard and window.
 
-        Args:
-            game: An instance of a GameModel class.
-        """
-        self.game = game
+    The space bar jumps (releasing it early cuts the jump short), the arrow
+    keys move the player, and closing the window quits the game.
+    """
 
-    def events(self):
+    def poll(self):
         """
-        Check events in the game loop and change attributes based on that.
+        Handle every event since the last poll and read the arrow keys held.
 
-        (E.g. if the event is QUIT, it quits the game by calling the approiate
-        method.)
+        Returns:
+            An InputSnapshot of the input given.
         """
+        bits = 0
+        quit_game = False
 
         # Check each event in list of past, non-executed events.
         for event in pg.event.get():
 
             # Check for end of program.
             if event.type == pg.QUIT:
-                self.game.quit_game()
-
+                quit_game = True
 
             # Check for space key for jumping.
-            if event.type == pg.KEYDOWN:
-                if event.key == pg.K_SPACE:
-                    self.game.player.jump()
+            if event.type == pg.KEYDOWN and event.key == pg.K_SPACE:
+                bits = press(bits, JUMP)
 
-            if event.type == pg.KEYUP:
-                if event.key == pg.K_SPACE:
-                    self.game.player.jump_cut()
+            if event.type == pg.KEYUP and event.key == pg.K_SPACE:
+                bits = press(bits, JUMP_CUT)
 
-    def move_test(self):
-        """
-        Control movement of player using arrow keys.
-
-        Pressing the left arrow key results in a message to go left, while
-        pressing the right arrow key results in a message to go right. Pressing
-        both results in the player coming to a halt.
-        """
         # Obtain all the current key presses.
         keys = pg.key.get_pressed()
-
-        # Match key presses to corresponding direction messages.
-        if keys[pg.K_LEFT]:
-            self.game.player.move("Left")
-
-        if keys[pg.K_RIGHT]:
-            self.game.player.move("Right")
-
-        if keys[pg.K_LEFT] and keys[pg.K_RIGHT]:
-            self.game.player.move("Stop")
+        bits |= LEFT * keys[pg.K_LEFT] | RIGHT * keys[pg.K_RIGHT]
+        return InputSnapshot(bits, quit_game)
@@ -0,0 +1,105 @@
+"""
+Renderer that only repaints the parts of the screen that changed since the
+last frame.
+"""
+
+
+class DirtyRenderer:
+    """
+    Draw a list of images on the screen, repainting only changed regions.
+
+    Each frame is described as a list of (key, image, rect) items in drawing
+    order. An item is dirty if it is new, was removed, or its image or
+    position changed since the last frame. The background is repainted under
+    the old and new rectangles of dirty items, and every item overlapping
+    those regions is blitted again, clipped to them.
+
+    Attributes:
+        screen: A pygame Surface to draw on.
+        background: A tuple representing the background colour in RGB.
+        drawn: A dictionary mapping each key drawn last frame to a tuple of
+            its image and rectangle.
+        full_repaint: A boolean that is True if the next frame must repaint
+            the whole screen.
+        pixels: An integer containing the number of pixels repainted in the
+            last frame.
+    """
+    def __init__(self, screen, background):
+        """
+        Create a renderer that repaints the whole screen on its first frame.
+
+        Args:
+            screen: A pygame Surface to draw on.
+            background: A tuple representing the background colour in RGB.
+        """
+        self.screen = screen
+        self.background = background
+        self.drawn = {}
+        self.full_repaint = True
+        self.pixels = 0
+
+    def reset(self):
+        """
+        Repaint the whole screen on the next frame, e.g. after something else
+        has drawn over it.
+        """
+        self.full_repaint = True
+
+    def render(self, items):
+        """
+        Draw a frame, repainting only the regions that changed.
+
+        Args:
+            items: A list of (key, image, rect) tuples in drawing order, where
+                key is any hashable object identifying the item between
+                frames.
+
+        Returns:
+            A list of pygame Rect objects covering the changed regions, to be
+            passed to pygame.display.update.
+        """
+        current = {key: (image, rect.copy()) for key, image, rect in items}
+
+        if self.full_repaint:
+            self.full_repaint = False
+            self.drawn = current
+            self.screen.fill(self.background)
+            for _, image, rect in items:
+                self.screen.blit(image, rect)
+            screen_rect = self.screen.get_rect()
+            self.pixels = screen_rect.width * screen_rect.height
+            return [screen_rect]
+
+        # Find the regions covered by items that appeared, moved or changed.
+        dirty = []
+        for key, (image, rect) in current.items():
+            previous = self.drawn.pop(key, None)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] is not image or previous[1] != rect:
+                if previous[1].colliderect(rect):
+                    dirty.append(previous[1].union(rect))
+                else:
+                    dirty.append(previous[1])
+                    dirty.append(rect)
+
+        # Anything left was drawn last frame but has been removed since.
+        dirty.extend(rect for _, rect in self.drawn.values())
+        self.drawn = current
+
+        dirty = [region.clip(self.screen.get_rect()) for region in dirty]
+        dirty = [region for region in dirty if region.width and region.height]
+
+        # Repaint the background, then redraw items over the dirty regions.
+        for region in dirty:
+            self.screen.fill(self.background, region)
+        for _, image, rect in items:
+            for region in dirty:
+                clipped = rect.clip(region)
+                if clipped.width and clipped.height:
+                    self.screen.blit(image, clipped,
+                                     clipped.move(-rect.x, -rect.y))
+
+        self.pixels = sum(region.width * region.height for region in dirty)
+        return dirty
+
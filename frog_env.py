@@ -0,0 +1,220 @@
+"""
+Wrap the PlatFrogs game in a reinforcement learning environment, in the style
+of Gym, with observations as NumPy arrays (`pip install numpy`).
+
+Run `python frog_env.py [steps]` to time stepping the environment with random
+actions.
+"""
+import random
+import sys
+import time
+import numpy as np
+import pygame as pg
+from settings import WIDTH, HEIGHT, PLAYER_JUMP
+from game_model import GameModel
+from input_log import LEFT, RIGHT, JUMP, JUMP_CUT
+from input_model import InputSnapshot
+
+# The input of each action the agent can take, by index.
+ACTIONS = (
+    InputSnapshot(),
+    InputSnapshot(LEFT),
+    InputSnapshot(RIGHT),
+    InputSnapshot(JUMP),
+    InputSnapshot(JUMP | LEFT),
+    InputSnapshot(JUMP | RIGHT),
+    InputSnapshot(JUMP_CUT),
+)
+
+# Number of platforms nearest the player included in each observation.
+NEAREST = 5
+
+# Values observed about the player: its x position, its height on the
+# screen, its velocity and whether it is standing on a platform.
+PLAYER_VALUES = 5
+
+# Values observed about each platform: whether it exists, and its position
+# relative to the player and its size.
+PLATFORM_VALUES = 5
+
+
+class FrogEnv:
+    """
+    An environment in which an agent plays PlatFrogs one tick at a time.
+
+    Each step plays one tick with the input of an action and gives back an
+    observation, the points scored during the tick, whether the game is over
+    and more information. Games are headless unless they are rendered, and
+    stepping never draws anything, so it runs as fast as the game model.
+
+    Observations are float32 arrays of the player's values followed by the
+    values of the nearest platforms, closest first. Positions are divided by
+    the size of the screen and velocities by the jump speed, so the values
+    stay small. Missing platforms are all zeros.
+
+    Attributes:
+        nearest: An integer containing the number of platforms observed.
+        observation_size: An integer containing the length of observations.
+        action_count: An integer containing the number of actions.
+        max_frames: An integer containing the most ticks a game lasts before
+            it is cut short, or None.
+        render_mode: A string, "human" if games are shown in a window, or
+            None.
+        game: An instance of a GameModel class playing the games.
+        last_score: An integer containing the score after the last step.
+        frames: An integer containing the number of steps in this game.
+    """
+
+    def __init__(self, nearest=NEAREST, max_frames=None, render_mode=None,
+                 seed=None):
+        """
+        Create the environment's game.
+
+        Args:
+            nearest: An optional integer containing the number of platforms
+                to observe.
+            max_frames: An optional integer containing the most ticks to play
+                each game for.
+            render_mode: An optional string, "human" to show the games in a
+                window.
+            seed: An optional integer seeding the games played after resets
+                that are not given a seed.
+        """
+        self.nearest = nearest
+        self.observation_size = PLAYER_VALUES + PLATFORM_VALUES * nearest
+        self.action_count = len(ACTIONS)
+        self.max_frames = max_frames
+        self.render_mode = render_mode
+        self.game = GameModel(headless=render_mode != "human", seed=seed,
+                              record=False)
+        self.last_score = 0
+        self.frames = 0
+
+    def reset(self, seed=None):
+        """
+        Start a new game.
+
+        Args:
+            seed: An optional integer containing the seed of the game. By
+                default the next seed of the environment is used.
+
+        Returns:
+            The observation of the start of the game.
+        """
+        self.game.new(seed)
+        self.game.playing = True
+        self.last_score = 0
+        self.frames = 0
+        return self.observe()
+
+    def step(self, action):
+        """
+        Play one tick of the game.
+
+        Args:
+            action: An integer containing the index of an action in ACTIONS.
+
+        Returns:
+            A tuple containing the observation after the tick, the points
+            scored in it, a boolean that is True if the game is over, and a
+            dictionary containing the score, the ticks played and whether
+            the game was cut short by max_frames.
+
+        Raises:
+            RuntimeError: If the game is over and has not been reset.
+        """
+        game = self.game
+        if not game.playing:
+            raise RuntimeError("the game is over, call reset first")
+        game.update(ACTIONS[action])
+        self.frames += 1
+
+        # Points are scored as platforms scroll off the screen.
+        reward = game.score - self.last_score
+        self.last_score = game.score
+        truncated = self.max_frames is not None and \
+            self.frames >= self.max_frames and game.playing
+        done = not game.playing or truncated
+        if truncated:
+            game.playing = False
+        return self.observe(), reward, done, {"score": game.score,
+                                              "frames": self.frames,
+                                              "truncated": truncated}
+
+    def observe(self):
+        """
+        Make the observation of the current tick.
+
+        Returns:
+            A NumPy float32 array of length observation_size.
+        """
+        game = self.game
+        player = game.player
+        pos_x = player.pos.x
+        pos_y = player.pos.y
+        values = [pos_x / WIDTH, (pos_y - game.camera.y) / HEIGHT,
+                  player.vel.x / PLAYER_JUMP, player.vel.y / PLAYER_JUMP,
+                  float(player.ground is not None)]
+
+        # Add the platforms closest to the player's feet.
+        rects = sorted((plat.rect for plat in game.platforms),
+                       key=lambda rect: (rect.centerx - pos_x) ** 2
+                       + (rect.top - pos_y) ** 2)
+        for rect in rects[:self.nearest]:
+            values += (1.0, (rect.centerx - pos_x) / WIDTH,
+                       (rect.top - pos_y) / HEIGHT, rect.width / WIDTH,
+                       rect.height / HEIGHT)
+        values += [0.0] * (self.observation_size - len(values))
+        return np.array(values, dtype=np.float32)
+
+    def render(self):
+        """
+        Draw the current tick in the game window, if the environment was
+        made with the "human" render mode.
+        """
+        if self.render_mode != "human":
+            return
+        pg.event.pump()
+        self.game.view.draw()
+
+    def close(self):
+        """
+        Stop generating the level of the last game.
+        """
+        if self.game.level is not None:
+            self.game.level.close()
+
+
+def run(steps, seed=0):
+    """
+    Step the environment with random actions for a number of steps,
+    resetting it when games end.
+
+    Args:
+        steps: An integer containing the number of steps to take.
+        seed: An optional integer seeding the games and actions.
+
+    Returns:
+        A tuple containing the number of games played and the time taken in
+        seconds.
+    """
+    env = FrogEnv(seed=seed)
+    rng = random.Random(seed)
+    env.reset()
+    games = 1
+    start = time.perf_counter()
+    for _ in range(steps):
+        _, _, done, _ = env.step(rng.randrange(env.action_count))
+        if done:
+            env.reset()
+            games += 1
+    elapsed = time.perf_counter() - start
+    env.close()
+    return games, elapsed
+
+
+if __name__ == "__main__":
+    STEPS = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    GAMES, ELAPSED = run(STEPS)
+    print(f"{STEPS} steps over {GAMES} games in {ELAPSED:.2f} s "
+          f"({STEPS / ELAPSED:.0f} steps/sec)")
@@ -1,15 +1,27 @@
 """
 Create the PlatFrogs game and manage and track the game state.
 """
-from os import path
+from collections import deque
 import random
 import pygame as pg
-from settings import HEIGHT, WIDTH, FPS, PLATFORM_LIST
+from settings import HEIGHT, MENU_TIMEOUT, MENU_POLL_FPS, PLATFORM_LIST
 from player_model import Player
-from platform_model import Platform
+from platform_model import PlatformGroup, PlatformPool
 from game_view import GameView
+from input_log import InputLog
+from input_model import NO_INPUT
+from profiler import NullProfiler
+from level_model import LevelGenerator, LevelPlatform
+from camera_model import Camera
+import snapshot_model
 
 
+# Video drivers that must be polled instead of waiting for events. SDL's
+# offscreen driver cannot sleep until an event arrives, and waiting with it
+# was measured to keep a whole core busy. Every other driver waits, falling
+# back to SDL's own polling if it has no way to sleep.
+POLL_DRIVERS = {"offscreen"}
+
 # House In a Forest by https://opengameart.org/users/horrorpen
 # forest by https://opengameart.org/users/syncopika
 
@@ -23,19 +35,75 @@ class GameModel:
         running: A boolean that determines if the game is running.
         view: An instance of a GameView class.
         score: An integer storing the score of a particular game.
-        all_sprites: A sprite group that contains all the sprites (player and
-            platform) in the game.
-        platforms: A sprite group that contains all current platform sprites in
-            the game.
+        ticks: An integer containing the number of ticks the current game
+            has been updated for.
+        jumps: An integer containing the number of times the player jumped in
+            the current game.
+        defer_sounds: A boolean that is True while a simulation thread
+            updates the game. Sounds are then left to the main thread, which
+            plays them from the jumps counted in each snapshot.
+        platforms: A PlatformGroup that contains all current platforms in the
+            game, indexed by height.
+        pool: An instance of a PlatformPool class that recycles platforms.
         player: An instance of a Player class.
         playing: A boolean determining whether a current game is being played.
         flag: An integer that is used for unit testing the wait_for_key method.
+        headless: A boolean that is True if the game is run as a pure
+            simulation, without a display window, audio or a game view.
+        seeds: A random number generator that picks the seed of each game.
+        game_seed: An integer containing the seed of the current game.
+        rng: A random number generator, seeded with game_seed, used for
+            everything random in the current game.
+        record: A boolean that is True if the input of each game is logged.
+        input_log: An instance of an InputLog class recording the current
+            game, or None if input is not being recorded.
+        profiler: A FrameProfiler timing each section of the game loop, or a
+            NullProfiler if the game is not being profiled.
+        level: A LevelGenerator making the platforms of the current game, on
+            a worker thread unless the game is headless.
+        camera: An instance of a Camera class containing the part of the
+            world shown on the screen. Sprites keep their world positions,
+            and the camera moves as the screen scrolls.
+        level_bottom: An integer containing the world y coordinate of the
+            bottom of the level (the top of the highest starting platform).
+        upcoming: A deque of the LevelPlatforms generated but not spawned
+            yet, lowest first.
     """
 
-    def __init__(self):
+    def __init__(self, headless=False, seed=None, record=None, scores=None):
         """
         Set initial conditions for the GameModel class.
+
+        Args:
+            headless: An optional boolean. If True, no game view is created,
+                so the model can be stepped without a display or audio.
+            seed: An optional integer. If given, the games played are the
+                same every time the program is run.
+            record: An optional boolean that is True to log the input of each
+                game. By default, only games with a view are recorded.
+            scores: An optional instance of a ScoreStore class the view
+                records games in.
         """
+        self.headless = headless
+
+        # Every game gets its own seed, so it can be replayed on its own.
+        self.seeds = random.Random(seed)
+        self.game_seed = self.seeds.getrandbits(32)
+        self.rng = random.Random(self.game_seed)
+        self.record = not headless if record is None else record
+        self.input_log = None
+
+        # Play sounds as the game is updated, unless another thread updates it.
+        self.defer_sounds = False
+
+        # Don't time the game loop unless a profiler is set.
+        self.profiler = NullProfiler()
+
+        # No level is generated until a game starts.
+        self.level = None
+        self.level_bottom = 0
+        self.upcoming = deque()
+        self.camera = Camera()
 
         # Start the game clock.
         self.clock = pg.time.Clock()
@@ -43,19 +111,21 @@ class GameModel:
         # Start running the program loop (NOT the game loop).
         self.running = True
 
-        # Initialize an instance of a game view.
-        self.view = GameView(self)
+        # Initialize the one game view (none in headless mode), which draws
+        # the player and platforms.
+        self.view = None if headless else GameView(self, scores=scores)
 
         # Starting score.
         self.score = 0
+        self.ticks = 0
+        self.jumps = 0
 
-        # Create sprite groups.
-        self.all_sprites = pg.sprite.LayeredUpdates()
-        self.platforms = pg.sprite.Group()
+        # Create the platforms and the pool recycling them.
+        self.platforms = PlatformGroup()
+        self.pool = PlatformPool()
 
-        # Define player sprite.
-        self.player = Player(self)
-        self.all_sprites.add(self.player)
+        # Define player.
+        self.player = Player()
 
         # Define playing.
         self.playing = True
@@ -63,95 +133,188 @@ class GameModel:
         # Flag for unit testing wait_for_key method.
         self.flag = 0
 
-    def new(self):
+    def new(self, seed=None):
         """
         Start a new game.
 
-        Initialize score to 0, load the player and platform sprites, and start
-        playing the game music.
+        Initialize score to 0, seed the game's random numbers, load the player
+        and platform sprites, and start playing the game music.
+
+        Args:
+            seed: An optional integer containing the seed of the game, e.g. to
+                replay a recorded game. By default the next seed is used.
+
+        Raises:
+            ValueError: If the seed is not from 0 to 2**64 - 1, the range
+                replays and snapshots store it in.
         """
+        if seed is not None and not 0 <= seed < 2**64:
+            raise ValueError(f"seed {seed} is not from 0 to 2**64 - 1")
 
         # Reinitialize starting score.
         self.score = 0
+        self.ticks = 0
+        self.jumps = 0
+        self.camera.reset()
 
-        # Create sprite groups.
-        self.all_sprites = pg.sprite.LayeredUpdates()
-        self.platforms = pg.sprite.Group()
+        # Seed the game and start recording its input.
+        self.game_seed = self.seeds.getrandbits(32) if seed is None else seed
+        self.rng.seed(self.game_seed)
+        self.input_log = InputLog(self.game_seed) if self.record else None
 
-        # Define player sprite.
-        self.player = Player(self)
-        self.all_sprites.add(self.player)
+        # Return platforms from the last game to the pool.
+        for plat in self.platforms:
+            self.pool.release(plat)
 
-        # Define platform sprites from list.
+        # Create the platform group.
+        self.platforms = PlatformGroup()
+
+        # Define player.
+        self.player = Player()
+
+        # Define platforms from list.
         for plat in PLATFORM_LIST:
-            platform = Platform(self.view, *plat)
-            self.all_sprites.add(platform)
+            platform = self.pool.acquire(*plat, self.rng)
             self.platforms.add(platform)
 
-        # Load music.
-        pg.mixer.music.load(path.join(self.view.snd_dir, 'forest.ogg'))
-        pg.mixer.music.play(loops=-1)
+        # Start generating the rest of the level above the last (highest)
+        # starting platform.
+        if self.level is not None:
+            self.level.close()
+        self.level = LevelGenerator(self.rng.getrandbits(32),
+                                    LevelPlatform(0, platform.rect.x,
+                                                  platform.kind),
+                                    threaded=not self.headless)
+        self.level_bottom = platform.rect.y
+        self.upcoming = deque(self.level.next_chunk())
 
+        # Fade in the game music.
+        if self.headless:
+            return
+        self.view.audio.play_music("game")
 
-    def update(self):
+
+    def update(self, inputs=NO_INPUT):
         """
         Update the game loop.
 
-        Update the sprites based on changes, program player sprite to jump on
-        platforms, scroll the screen, randomly generate new platforms and check
-        when the player sprite falls of the screen and dies.
+        Give the player the input of the tick, update the sprites based on
+        changes, program player sprite to jump on platforms, scroll the
+        screen, spawn the platforms of the level and check when the player
+        sprite falls of the screen and dies.
 
+        Args:
+            inputs: An optional InputSnapshot of the input for this tick, from
+                any input source. By default no keys are pressed.
         """
-        # Update all the sprites based on changes in sprites.py
-        self.all_sprites.update()
+        # Quit without updating if the player closed the game.
+        if inputs.quit:
+            self.quit_game()
+            return
+        self.ticks += 1
+        player = self.player
+        if player.handle(inputs):
+            self.jumps += 1
+            if self.view is not None and not self.defer_sounds:
+                self.view.audio.play("jump")
+
+        # Remember where the player, every platform and the camera were, so
+        # the view can interpolate between this tick and the last one.
+        for plat in self.platforms:
+            plat.previous_topleft = plat.rect.topleft
+        camera = self.camera
+        camera.begin_tick()
+
+        # Move the player, which stays where it is once it has died.
+        if player.alive():
+            player.previous_topleft = player.rect.topleft
+            player.update()
+        self.profiler.mark("sprites")
+
+        # Program player to land on platforms.
+        player.land(self.platforms)
+        self.profiler.mark("collision")
+
+        # If player reaches top fourth of screen, scroll up.
+        if self.player.rect.top - camera.y <= HEIGHT/4:
+            camera.move(-max(abs(self.player.vel.y), 2))
+
+            # Delete platforms that go off the screen.
+            for plat in self.platforms.below(camera.y + HEIGHT):
+                self.pool.release(plat)
+                self.score += 10
+        self.profiler.mark("scroll")
+
+        # Spawn the platforms of the level (recycled from the pool) as they
+        # scroll into view.
+        self.spawn()
+        self.profiler.mark("spawn")
 
-        # Program player sprites to jump on platforms.
-        if self.player.vel.y > 0:
-            hits = pg.sprite.spritecollide(self.player, self.platforms, False)
+        # Check if player sprite falls of screen, and end the game accordingly.
+        # The camera follows the player down, so everything else moves up the
+        # screen while the player keeps its place on it.
+        if self.player.rect.bottom - camera.y > HEIGHT:
+            distance = max(self.player.vel.y, 10)
+            camera.move(distance)
+            self.player.pos.y += distance
+            for plat in self.platforms.above(camera.y):
+                self.pool.release(plat)
+            if self.player.rect.bottom < camera.y:
+                self.player.kill()
+        if len(self.platforms) == 0:
+            self.playing = False
 
-            if hits:
-                lowest = hits[0]
-                for hit in hits:
-                    if hit.rect.bottom > lowest.rect.bottom:
-                        lowest = hit
+        # Store the input given for this tick.
+        if self.input_log is not None:
+            self.input_log.tick(inputs.bits)
+        self.profiler.mark("fall")
 
-                # Enable player sprite to rest on a platform.
-                if self.player.pos.x < lowest.rect.right and \
-                self.player.pos.x > lowest.rect.left:
-                    if self.player.pos.y < lowest.rect.centery:
-                        self.player.pos.y = lowest.rect.top
-                        self.player.vel.y = 0
-                        self.player.jumping = False
+    def spawn(self):
+        """
+        Add the upcoming platforms of the level that are just above the top of
+        the screen.
 
-        # If player reaches top fourth of screen, scroll.
-        if self.player.rect.top  <= HEIGHT/4:
-            self.player.pos.y += max(abs(self.player.vel.y), 2)
-            for plat in self.platforms:
-                plat.rect.y += max(abs(self.player.vel.y), 2)
+        Chunks of the level are taken from the generator about a screen before
+        they are needed, without waiting for its worker thread. Only if no
+        upcoming platforms are left does it wait for the next chunk.
+        """
+        top = self.camera.y
+        if not self.upcoming or \
+                self.level_bottom - self.upcoming[-1].height - top > -HEIGHT:
+            chunk = self.level.next_chunk(block=not self.upcoming)
+            if chunk is not None:
+                self.upcoming.extend(chunk)
+
+        while self.upcoming and \
+                self.level_bottom - self.upcoming[0].height - top >= -60:
+            plat = self.upcoming.popleft()
+            platform = self.pool.acquire(plat.x,
+                                         self.level_bottom - plat.height,
+                                         self.rng, plat.kind)
+            self.platforms.add(platform)
 
-                # Delete platforms that go off the screen.
-                if plat.rect.top >= HEIGHT:
-                    plat.kill()
-                    self.score += 10
+    def snapshot(self):
+        """
+        Save the complete state of the current game, including its random
+        number generator, in a small binary blob.
 
-        # Randomly spawn new platforms to keep same average number.
-        while len(self.platforms) < 6:
+        Returns:
+            A bytes object that restore can put the game back to.
+        """
+        return snapshot_model.snapshot(self)
 
-            width = random.randrange(0,400)
-            platform = Platform(self.view, random.randrange(0, WIDTH-width),
-                        random.randrange(-60, -30))
+    def restore(self, data):
+        """
+        Put the game back in a state saved by snapshot, which may have been
+        made by another GameModel or another run of the program.
 
-            self.platforms.add(platform)
-            self.all_sprites.add(platform)
+        Args:
+            data: A bytes object made by snapshot.
 
-        # Check if player sprite falls of screen, and end the game accordingly.
-        if self.player.rect.bottom > HEIGHT:
-            for sprite in self.all_sprites:
-                sprite.rect.y -= max(self.player.vel.y, 10)
-                if sprite.rect.bottom < 0:
-                    sprite.kill()
-        if len(self.platforms) == 0:
-            self.playing = False
+        Raises:
+            ValueError: If the data is not a snapshot.
+        """
+        snapshot_model.restore(self, data)
 
     def wait_for_key(self):
         """
@@ -162,8 +325,7 @@ class GameModel:
         """
         waiting = True
         while waiting:
-            self.clock.tick(FPS)
-            for event in pg.event.get():
+            for event in self.menu_events():
                 # Check for player quitting game.
                 if event.type == pg.QUIT:
                     self.flag = 2
@@ -175,6 +337,28 @@ class GameModel:
                     self.flag = 1
                     waiting = False
 
+                # Show the screen again if the window was uncovered.
+                if event.type == pg.WINDOWEXPOSED and self.view is not None:
+                    self.view.refresh_menu()
+
+    def menu_events(self):
+        """
+        Sleep until there are events for a menu screen, waking up at least
+        every MENU_TIMEOUT milliseconds.
+
+        The program sleeps until an event arrives, for at most MENU_TIMEOUT
+        milliseconds, except with the drivers in POLL_DRIVERS, which are
+        polled MENU_POLL_FPS times a second.
+
+        Returns:
+            A list of pygame events, or a list of one NOEVENT event if there
+            were none.
+        """
+        if pg.display.get_driver() not in POLL_DRIVERS:
+            return [pg.event.wait(MENU_TIMEOUT)] + pg.event.get()
+        self.clock.tick(MENU_POLL_FPS)
+        return pg.event.get() or [pg.event.Event(pg.NOEVENT)]
+
     def quit_game(self):
         """
         Quit the game when called.
@@ -182,3 +366,5 @@ class GameModel:
         if self.playing:
             self.playing = False
         self.running = False
+        if self.level is not None:
+            self.level.close()
@@ -7,14 +7,22 @@ from settings import (WIDTH,
                       HEIGHT,
                       TITLE,
                       FONT_NAME,
-                      SPRITESHEET,
-                      HS_FILE,
+                      FPS,
+                      DIRTY_RECTS,
                       BGCOLOUR,
                       WHITE,
+                      BLACK,
                       LIGHTGREEN,
-                      GREEN,
-                      BLACK,)
-from spritesheet_view import Spritesheet
+                      GREEN,)
+from animation_model import ANIMATIONS
+from atlas_view import load_atlas
+from platform_model import PLATFORM_FRAMES
+from sprite_view import PlayerSprite, PlatformSprite
+from camera_model import Camera
+from text_view import TextCache, find_font
+from dirty_view import DirtyRenderer
+from score_store import ScoreStore
+from audio_view import load_audio
 
 
 class GameView:
@@ -25,153 +33,285 @@ class GameView:
         game_model: An instance of a GameModel class.
         screen: A pygame display surface that creates a display window for the
             game.
-        font_name: A pygame module for rendering the text fonts.
+        font_name: A Future giving the path to the font file, found in the
+            background.
+        text_cache: An instance of a TextCache class holding the fonts and
+            rendered text.
+        renderer: An instance of a DirtyRenderer class if only changed
+            regions of the screen are repainted, otherwise None.
         dir: A path to the current directory of the file.
-        spritesheet: An instance of a Spritesheet class.
-        highscore: An integer containing the highest score across all games run
-            in this instance.
-        snd_dir: A path to the folder containing the sound files.
-        jump_sound: A pygame sound object that plays the sound when the player
-            sprite jumps.
+        atlas: The instance of an Atlas class shared by the whole game.
+        spritesheet: The instance of a Spritesheet class used by the atlas.
+        scores: An instance of a ScoreStore class that records every game.
+        highscore: An integer containing the highest score across all games
+            recorded.
+        audio: The instance of an AudioManager class shared by the whole
+            game, which plays the sound effects and music.
         image: A pygame Surface object containing the image for a particular
             sprite.
         title_rect: A pygame rectangle containing the title.
-        walk_frames_l: A list of two pygame Surface objects containing the
-            image for the player sprite walking to the left.
-        walk_frames_r: A list of two pygame Surface objects containing the
-            image for the player sprite walking to the right.
-        jump_l: A pygame Surface object containing the image for the player
-            sprite jumping to the left.
-        jump_r: A pygame Surface object containing the image for the player
-            sprite jumping to the right.
+        player_frames: A dictionary mapping each animation state and facing
+            in ANIMATIONS to a tuple of the pygame Surfaces of its frames.
+        platform_images: A tuple of the pygame Surfaces of each kind of
+            platform, in the order of PLATFORM_FRAMES.
+        player_sprite: A PlayerSprite showing the game model's player, or
+            None until it is first drawn.
+        platform_sprites: A dictionary mapping each platform drawn so far to
+            its PlatformSprite. Platforms are recycled by their pool, so it
+            stays about as big as the pool.
     """
-    def __init__(self, game_model):
+    def __init__(self, game_model, dirty_rects=DIRTY_RECTS, scores=None):
         """
         Initialize the GameView class.
 
         Args:
             game_model: An instance of a GameModel.
+            dirty_rects: An optional boolean. If True, draw only repaints the
+                regions of the screen that changed since the last frame.
+            scores: An optional instance of a ScoreStore class to record games
+                in. By default, games are only recorded in memory.
         """
         # Initialize game window.
         pg.init()
 
-        # Initialize sounds & screen
-        pg.mixer.init()
-
         # Pass an instance of the game model.
         self.game_model = game_model
 
         # Define game display.
         self.screen = pg.display.set_mode((WIDTH, HEIGHT))
         pg.display.set_caption(TITLE)
-        self.font_name = pg.font.match_font(FONT_NAME)
+
+        # Search the system fonts while the rest of the view is set up.
+        self.font_name = find_font(FONT_NAME)
+        self.text_cache = TextCache(self.font_name)
+        self.renderer = DirtyRenderer(self.screen, BGCOLOUR) if dirty_rects \
+            else None
 
         # Specify path to current directory.
         self.dir = path.dirname(__file__)
-        img_dir = path.join(self.dir, "img")
-        self.spritesheet = Spritesheet(path.join(img_dir, SPRITESHEET))
+        self.atlas = load_atlas()
+        self.spritesheet = self.atlas.spritesheet
 
-        #load high score
-        with open(path.join(self.dir, HS_FILE), 'w') as file_object:
-            try:
-                self.highscore = int(file_object.read())
+        # Load high score.
+        self.scores = ScoreStore() if scores is None else scores
+        self.highscore = self.scores.highscore
 
-            #if the file is empty, try will give an error
-            except IOError:
-                self.highscore = 0
+        # Set up sounds (only the first time a view is made). Music is decoded
+        # in the background.
+        self.audio = load_audio()
+        self.image = self.atlas["title.png"]
 
-        # Load sounds.
-        self.snd_dir = path.join(self.dir, 'snd')
-        self.jump_sound = pg.mixer.Sound(path.join(self.snd_dir, 'PacificTreeFrog.wav'))
-        self.image = self.spritesheet.get_image(1, 1, 465, 175, scale=0.9)
+        # Look up the frames of every player animation once.
+        self.player_frames = {key: tuple(self.atlas[name] for name in names)
+                              for key, names in ANIMATIONS.items()}
+        self.platform_images = tuple(self.atlas[name]
+                                     for name in PLATFORM_FRAMES)
 
-        # Extract two images each for each of the walking frames.
-        self.walk_frames_l = [self.spritesheet.get_image(83, 346, 64, 50),
-                            self.spritesheet.get_image(413, 178, 66, 50)]
-        self.walk_frames_r = [self.spritesheet.get_image(413, 230, 66, 50),
-                              self.spritesheet.get_image(149, 346, 64, 50)]
+        # Make sprites for the player and platforms as they are drawn.
+        self.player_sprite = None
+        self.platform_sprites = {}
 
-        # Extract image for right jump frame and reorient in correct direction.
-        self.jump_r = self.spritesheet.get_image(403, 282, 80, 90, scale=1.2)
-        self.jump_r = pg.transform.flip(self.jump_r, False, False)
-        self.jump_r = pg.transform.rotate(self.jump_r, 90)
+    def draw(self, alpha=1, state=None):
+        """
+        Display and draw the game loop.
 
-        # Define the image for the left jump frame as a reflection of the right
-        # jump frame.
-        self.jump_l = pg.transform.flip(self.jump_r, True, False)
+        Fill the display with the background color, draw the sprite objects
+        the camera can see, and flip the display to show the changes. With a
+        dirty rectangle renderer, only the changed regions are repainted and
+        pushed to the display instead. Each step is timed by the game's
+        profiler.
 
-        # Ensure the image rectangles for all the frames are transparent.
-        self.jump_l.set_colorkey(BLACK)
-        self.jump_r.set_colorkey(BLACK)
+        Args:
+            alpha: An optional float from 0 to 1 containing how far the frame
+                is between the previous simulation tick and the latest one.
+                Sprites are drawn that far between their two positions.
+            state: An optional FrameState to draw, published by a simulation
+                running on another thread. By default the game model is
+                drawn.
+        """
+        # Find what to draw, from the game model or a snapshot of it.
+        if state is None:
+            camera = self.game_model.camera
+            score = self.game_model.score
+            drawables = [(sprite, sprite.image, sprite.entity)
+                         for sprite in self.sprites()]
+        else:
+            camera = Camera(state.camera_y, state.previous_camera_y)
+            score = state.score
+            drawables = self.state_drawables(state)
+
+        # Find where to draw the sprites the camera can see, at their
+        # interpolated positions, moved from the world onto the screen.
+        bounds = camera.bounds(alpha)
+        items = []
+        for key, image, entity in drawables:
+            rect = self.sprite_rect(entity, alpha)
+            if rect.colliderect(bounds):
+                items.append((key, image, rect.move(0, -bounds.y)))
+        profiler = self.game_model.profiler
+        profiler.mark("cull")
+
+        # Position the score, which is only rendered again when it changes,
+        # and the profiler's summary if it is shown.
+        items.append(("score",) + self.text_item(str(score), 22, WHITE,
+                                                 (WIDTH/2, 15)))
+        if profiler.overlay:
+            items.extend(self.overlay_items(profiler.summary))
+        profiler.mark("text")
+
+        # Repaint only what changed.
+        if self.renderer is not None:
+            dirty = self.renderer.render(items)
+            profiler.mark("blit")
+            pg.display.update(dirty)
+            profiler.mark("flip")
+            return
 
-        for frame in self.walk_frames_l:
-            frame.set_colorkey(BLACK)
+        # Fill display with empty light-blue screen.
+        self.screen.fill(BGCOLOUR)
+        profiler.mark("fill")
 
-        for frame in self.walk_frames_r:
-            frame.set_colorkey(BLACK)
+        # Draw all the sprites and the score.
+        for _, image, rect in items:
+            self.screen.blit(image, rect)
+        profiler.mark("blit")
 
-    def draw(self):
+        # 'Flip' display to show updated view.
+        pg.display.flip()
+        profiler.mark("flip")
+
+    def sprites(self):
         """
-        Display and draw the game loop.
+        Get the sprites showing the game model's platforms and player.
+
+        Returns:
+            A list of sprites in the order they are drawn: the platforms,
+            then the player in front of them if it is alive.
+        """
+        platform_sprites = self.platform_sprites
+        sprites = []
+        for plat in self.game_model.platforms:
+            sprite = platform_sprites.get(plat)
+            if sprite is None:
+                sprite = platform_sprites[plat] = PlatformSprite(plat, self)
+            sprites.append(sprite)
+        player = self.game_model.player
+        if player.alive():
+            if self.player_sprite is None or \
+                    self.player_sprite.entity is not player:
+                self.player_sprite = PlayerSprite(player, self)
+            sprites.append(self.player_sprite)
+        return sprites
+
+    def state_drawables(self, state):
+        """
+        Look up the images of the player and platforms in a snapshot.
+
+        Args:
+            state: A FrameState.
 
-        Fill the display with the background color, draw all the sprite objects
-        on the screen, and flip the display to show the changes.
+        Returns:
+            A list of (key, image, entity) tuples in the order they are
+            drawn, where entity is the PlatformState or PlayerState giving
+            the position.
         """
+        platform_images = self.platform_images
+        drawables = [(plat.key, platform_images[plat.kind], plat)
+                     for plat in state.platforms]
+        player = state.player
+        if player is not None:
+            drawables.append(("player",
+                              self.player_frames[player.key][player.index],
+                              player))
+        return drawables
+
+    def overlay_items(self, lines):
+        """
+        Position the lines of a profiler summary in the top-left corner.
 
-        # Fill display with empty light-blue screen.
-        self.screen.fill(BGCOLOUR)
+        Args:
+            lines: A list of strings to draw.
 
-        # Draw all the sprites.
-        self.game_model.all_sprites.draw(self.screen)
-        self.screen.blit(self.game_model.player.image, self.game_model.player.rect)
+        Returns:
+            A list of (key, image, rect) tuples, like the items drawn each
+            frame.
+        """
+        items = []
+        for number, line in enumerate(lines):
+            surface = self.text_cache.render(line, 14, BLACK)
+            items.append((f"profile{number}", surface,
+                          surface.get_rect(topleft=(5, 5 + 16 * number))))
+        return items
+
+    @staticmethod
+    def sprite_rect(sprite, alpha):
+        """
+        Find where to draw a sprite between its previous and current position.
 
-        # Show score
-        self.draw_text(str(self.game_model.score), 22, WHITE, (WIDTH/2, 15))
+        Args:
+            sprite: A Player, Platform or pygame Sprite with rect and
+                previous_topleft attributes.
+            alpha: A float from 0 to 1 containing how far the frame is between
+                the previous simulation tick and the latest one.
 
-        # 'Flip' display to show updated view.
-        pg.display.flip()
+        Returns:
+            A pygame Rect to draw the sprite at.
+        """
+        if alpha >= 1:
+            return sprite.rect
+        previous_x, previous_y = sprite.previous_topleft
+        return sprite.rect.move(round((previous_x - sprite.rect.x) * (1 - alpha)),
+                                round((previous_y - sprite.rect.y) * (1 - alpha)))
 
     def show_start_screen(self):
         """
-        Display the game start screen.
+        Display the game start screen and wait for a key to be pressed.
+        """
+        self.draw_start_screen()
+
+        # Exit start screen and begin game once key is pressed.
+        self.game_model.wait_for_key()
+
+    def draw_start_screen(self):
+        """
+        Draw the game start screen.
 
         Play the start screen music, the game title, and draw the instructions
         to play as well as the current highscore (initialized to zero).
         """
         # Start screen music.
-        pg.mixer.music.load(path.join(self.snd_dir, 'startEndScreen.ogg'))
-        pg.mixer.music.play(loops=-1)
+        self.audio.play_music("menu")
 
         # Title & background displays.
         self.screen.fill(LIGHTGREEN)
         # Display title.
-        self.image = self.spritesheet.get_image(1, 1, 465, 175, scale=0.9)
-        self.image.set_colorkey(BLACK)
+        self.image = self.atlas["title.png"]
         title_rect = self.image.get_rect()
         title_rect.midtop = (WIDTH/2, HEIGHT/5)
         self.screen.blit(self.image, title_rect)
 
-        # Draw start screen text.
+        # Draw start screen text, with the prompt below a full leaderboard.
         self.draw_text("Arrows to move, Space to jump", 22, GREEN,
                         (WIDTH/2, HEIGHT/2))
-        self.draw_text("Press any key to play", 22, GREEN, (WIDTH/2, HEIGHT*3/4))
+        self.draw_text("Press any key to play", 22, GREEN, (WIDTH/2, HEIGHT*7/8))
         self.draw_text(f"High Score: {self.highscore}", 22, GREEN, (WIDTH/2, 15))
+        self.draw_leaderboard(HEIGHT/2 + 40)
         pg.display.flip()
 
-        # Exit start screen and begin game once key is pressed.
-        self.game_model.wait_for_key()
-        pg.mixer.music.fadeout(500)
+        # The next game frame has to repaint over the start screen.
+        if self.renderer is not None:
+            self.renderer.reset()
 
     def show_go_screen(self):
         """
         Display the game over screen.
 
         Play the game over screen music and display the game over title, the
-        updated high score as well a prompt to play again.
+        updated high score as well a prompt to play again. The game is
+        recorded in the score store, which saves it in the background.
         """
         # Game over screen music.
-        pg.mixer.music.load(path.join(self.snd_dir, 'startEndScreen.ogg'))
-        pg.mixer.music.play(loops=-1)
+        self.audio.play_music("menu")
 
         # Check that game is running before displaying screen.
         if not self.game_model.running:
@@ -179,8 +319,7 @@ class GameView:
 
         # Display Game Over title.
         self.screen.fill(LIGHTGREEN)
-        self.image = self.spritesheet.get_image(1, 178, 410, 96)
-        self.image.set_colorkey(BLACK)
+        self.image = self.atlas["gameover.png"]
         title_rect = self.image.get_rect()
         title_rect.midtop = (WIDTH/2, HEIGHT/5)
         self.screen.blit(self.image, title_rect)
@@ -197,19 +336,41 @@ class GameView:
         if self.game_model.score > self.highscore:
             self.highscore = self.game_model.score
             self.draw_text("NEW HIGH SCORE!", 22, GREEN, (WIDTH/2, HEIGHT/2 + 40))
-
-            #save high score in file
-            with open(path.join(self.dir, HS_FILE), 'w') as file_object:
-                file_object.write(str(self.game_model.score))
         else:
             self.draw_text(f"High Score: {self.highscore}", 22, GREEN,
                             (WIDTH/2, HEIGHT/2 +40))
 
+        # Record the game without waiting for it to be saved.
+        self.scores.record(self.game_model.score, self.game_model.game_seed,
+                           self.game_model.ticks / FPS)
+
         pg.display.flip()
 
+        # The next game frame has to repaint over the game over screen.
+        if self.renderer is not None:
+            self.renderer.reset()
+
         # Exit game over screen and restart game once key is pressed.
         self.game_model.wait_for_key()
-        pg.mixer.music.fadeout(500)
+
+    def refresh_menu(self):
+        """
+        Show the menu screen waiting for a key again after the window was
+        uncovered, without drawing anything. Nothing on a menu screen
+        changes while it waits, so it never has to be drawn again.
+        """
+        pg.display.flip()
+
+    def draw_leaderboard(self, top):
+        """
+        Draw the best games recorded, one per line.
+
+        Args:
+            top: A number containing the y coordinate of the first line.
+        """
+        for rank, run in enumerate(self.scores.leaderboard()):
+            self.draw_text(f"{rank + 1}. {run.score}  ({run.date[:10]})", 18,
+                           GREEN, (WIDTH/2, top + 24 * rank))
 
     def draw_text(self, text, font_size, colour, coords):
         """
@@ -221,14 +382,33 @@ class GameView:
             colour: A tuple representing the colour of the font in RGB.
             coords: A tuple containing the coordinates of the position of the
                 text on the screen.
+
+        Returns:
+            A pygame Rect containing the area of the screen drawn over.
+        """
+        return self.screen.blit(*self.text_item(text, font_size, colour,
+                                                coords))
+
+    def text_item(self, text, font_size, colour, coords):
         """
-        # Set font.
-        font = pg.font.Font(self.font_name, font_size)
+        Helper function used for positioning text without drawing it.
 
-        # Define a surface with the specified text, colour, and font.
-        text_surface = font.render(text, True, colour)
+        Args:
+            text: A string representing the text to draw.
+            font_size: An integer containing the size of the font to use.
+            colour: A tuple representing the colour of the font in RGB.
+            coords: A tuple containing the coordinates of the position of the
+                text on the screen.
+
+        Returns:
+            A tuple containing the pygame Surface with the text and the
+            pygame Rect it should be drawn at.
+        """
+        # Get a surface with the specified text, colour, and font, rendering
+        # it only if it isn't cached.
+        text_surface = self.text_cache.render(text, font_size, colour)
         text_rect = text_surface.get_rect()
 
-        # Position and display the text.
+        # Position the text.
         text_rect.midtop = coords
-        self.screen.blit(text_surface, text_rect)
+        return text_surface, text_rect
@@ -0,0 +1,94 @@
+"""
+Run the PlatFrogs game as a pure simulation, without a window, audio or a frame
+cap, and report how many steps per second it manages.
+"""
+import sys
+import time
+from game_model import GameModel
+from input_log import LEFT, RIGHT, JUMP
+from input_model import InputSnapshot, NO_INPUT
+
+# Input of a tick jumping without moving.
+JUMPING = InputSnapshot(JUMP)
+
+
+class HopAgent:
+    """
+    A simple scripted player that keeps jumping and steers towards the highest
+    platform it can reach.
+
+    It is an input source, like the keyboard, so it can play any game.
+
+    Attributes:
+        game: An instance of a GameModel.
+    """
+
+    def __init__(self, game):
+        """
+        Initialize an instance of the game model as an attribute.
+
+        Args:
+            game: An instance of a GameModel class.
+        """
+        self.game = game
+
+    def poll(self):
+        """
+        Jump whenever the player sprite is able to, and move it towards the
+        highest platform it can still reach, or the closest one above it if
+        none are in reach.
+
+        Returns:
+            An InputSnapshot of the input for the next tick.
+        """
+        player = self.game.player
+        above = [plat for plat in self.game.platforms
+                 if player.rect.bottom - plat.rect.top > 20]
+        if not above:
+            return JUMPING
+        reachable = [plat for plat in above
+                     if player.rect.bottom - plat.rect.top < 180]
+        if reachable:
+            target = min(reachable, key=lambda plat: plat.rect.top)
+        else:
+            target = max(above, key=lambda plat: plat.rect.top)
+        if target.rect.centerx < player.pos.x - 10:
+            return InputSnapshot(JUMP | LEFT)
+        if target.rect.centerx > player.pos.x + 10:
+            return InputSnapshot(JUMP | RIGHT)
+        return JUMPING
+
+
+def run(frames, agent=HopAgent):
+    """
+    Step headless games back to back for a number of frames.
+
+    Args:
+        frames: An integer containing the number of frames to simulate.
+        agent: An input source class taking the GameModel, such as HopAgent,
+            polled before every update. None gives no input.
+
+    Returns:
+        A tuple containing the number of frames simulated, the number of games
+        that were started, and the time taken in seconds.
+    """
+    game_model = GameModel(headless=True)
+    source = None if agent is None else agent(game_model)
+    steps = 0
+    games = 0
+    start = time.perf_counter()
+    while steps < frames:
+        game_model.new()
+        game_model.playing = True
+        games += 1
+        while game_model.playing and steps < frames:
+            game_model.update(NO_INPUT if source is None else source.poll())
+            steps += 1
+    return steps, games, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    FRAMES = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    STEPS, GAMES, ELAPSED = run(FRAMES)
+    print(f"{STEPS} steps over {GAMES} games in {ELAPSED:.2f} s "
+          f"({STEPS / ELAPSED:.0f} steps/sec)")
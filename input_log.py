@@ -0,0 +1,99 @@
+"""
+Record the player's input one byte per tick, so a game can be replayed
+exactly.
+"""
+import struct
+import zlib
+
+# Bits of the byte recorded for each tick.
+LEFT = 1
+RIGHT = 2
+JUMP = 4
+JUMP_CUT = 8
+# Set if the jump key was released before it was pressed within the tick.
+CUT_FIRST = 16
+
+# File header: a magic string, a format version, the seed of the game and the
+# number of ticks recorded.
+HEADER = struct.Struct("<4sBQI")
+MAGIC = b"PFIL"
+VERSION = 1
+
+
+class InputLog:
+    """
+    The seed of a game and the input given on every tick of it.
+
+    Each tick's InputSnapshot is stored as the one byte of its bits, which
+    is all it takes to play the tick back.
+
+    Attributes:
+        seed: An integer containing the seed the game was started with.
+        inputs: A bytearray with one byte of input bits for each tick.
+    """
+
+    def __init__(self, seed, inputs=b""):
+        """
+        Create a log for a game.
+
+        Args:
+            seed: An integer containing the seed the game was started with.
+            inputs: Optional bytes of input already recorded.
+        """
+        self.seed = seed
+        self.inputs = bytearray(inputs)
+
+    def __len__(self):
+        """
+        Get the number of ticks recorded.
+
+        Returns:
+            An integer containing the number of ticks in the log.
+        """
+        return len(self.inputs)
+
+    def tick(self, bits):
+        """
+        Store the input given for a tick.
+
+        Args:
+            bits: An integer containing the bits of the tick's InputSnapshot.
+        """
+        self.inputs.append(bits)
+
+    def save(self, filename):
+        """
+        Write the log to a file, compressing the inputs.
+
+        Args:
+            filename: A string containing the path of the file.
+        """
+        with open(filename, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.seed, len(self)))
+            file.write(zlib.compress(bytes(self.inputs), 9))
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Read a log written by save.
+
+        Args:
+            filename: A string containing the path of the file.
+
+        Returns:
+            An instance of an InputLog class.
+
+        Raises:
+            ValueError: If the file is not an input log.
+        """
+        with open(filename, "rb") as file:
+            data = file.read()
+        try:
+            magic, version, seed, ticks = HEADER.unpack_from(data)
+            inputs = zlib.decompress(data[HEADER.size:])
+        except (struct.error, zlib.error) as error:
+            raise ValueError(f"{filename} is not a valid input log") \
+                from error
+        if magic != MAGIC or version != VERSION or len(inputs) != ticks:
+            raise ValueError(f"{filename} is not a valid input log")
+        return cls(seed, inputs)
@@ -0,0 +1,136 @@
+"""
+Describe the player's input for a tick as one immutable snapshot, whatever
+the input comes from.
+
+An input source is any object with a poll method that takes no arguments and
+returns an InputSnapshot of the input given since it was last polled. The
+keyboard (KeyboardInput in controller.py), a recorded game
+(ReplayController in replay.py) and scripted agents (HopAgent in
+headless.py) are all input sources, so the game model never knows where its
+input comes from.
+"""
+from collections import namedtuple
+from input_log import LEFT, RIGHT, JUMP, JUMP_CUT, CUT_FIRST
+
+# Bits of the arrow keys, which stay held from one tick to the next.
+HELD = LEFT | RIGHT
+
+
+def press(bits, bit):
+    """
+    Add a jump or jump cut to the input bits of a tick, remembering if the
+    jump key was released before it was pressed.
+
+    Args:
+        bits: An integer containing the input bits so far.
+        bit: Either JUMP or JUMP_CUT.
+
+    Returns:
+        An integer containing the new input bits.
+    """
+    if bit == JUMP and bits & JUMP_CUT:
+        bits |= CUT_FIRST
+    return bits | bit
+
+
+class InputSnapshot(namedtuple("InputSnapshot", ["bits", "quit"],
+                               defaults=(0, False))):
+    """
+    The input given for one tick of the game.
+
+    The input is kept in the byte an InputLog records for the tick, so
+    snapshots are small, cheap to make and compare, and can be stored as
+    they are.
+
+    Attributes:
+        bits: An integer made of the LEFT, RIGHT, JUMP, JUMP_CUT and
+            CUT_FIRST bits.
+        quit: A boolean that is True if the player asked to quit the game.
+    """
+    __slots__ = ()
+
+    @property
+    def left(self):
+        """
+        Check if the left arrow key is held.
+
+        Returns:
+            A boolean that is True if it is.
+        """
+        return bool(self.bits & LEFT)
+
+    @property
+    def right(self):
+        """
+        Check if the right arrow key is held.
+
+        Returns:
+            A boolean that is True if it is.
+        """
+        return bool(self.bits & RIGHT)
+
+    @property
+    def jump(self):
+        """
+        Check if the jump key was pressed.
+
+        Returns:
+            A boolean that is True if it was.
+        """
+        return bool(self.bits & JUMP)
+
+    @property
+    def jump_cut(self):
+        """
+        Check if the jump key was released.
+
+        Returns:
+            A boolean that is True if it was.
+        """
+        return bool(self.bits & JUMP_CUT)
+
+    @property
+    def cut_first(self):
+        """
+        Check if the jump key was released before it was pressed.
+
+        Returns:
+            A boolean that is True if it was.
+        """
+        return bool(self.bits & CUT_FIRST)
+
+    def held(self):
+        """
+        Get the input that carries on to the next tick, once this tick has
+        used the key presses and releases.
+
+        Returns:
+            An InputSnapshot with only the arrow keys held.
+        """
+        return InputSnapshot(self.bits & HELD, self.quit)
+
+    def then(self, later):
+        """
+        Combine this input with input given after it, before any tick has
+        used this input.
+
+        Args:
+            later: An InputSnapshot of the later input.
+
+        Returns:
+            An InputSnapshot with the key presses and releases of both, in
+            order, and the arrow keys held later.
+        """
+        bits = self.bits & ~HELD
+        if later.cut_first:
+            bits = press(bits, JUMP_CUT)
+        if later.jump:
+            bits = press(bits, JUMP)
+        if later.jump_cut:
+            bits = press(bits, JUMP_CUT)
+        return InputSnapshot(bits | later.bits & HELD,
+                             self.quit or later.quit)
+
+
+# Input of a tick with no keys pressed.
+NO_INPUT = InputSnapshot()
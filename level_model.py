@@ -0,0 +1,273 @@
+"""
+Generate the platforms of a level in chunks, ahead of the player, making sure
+every platform can be reached by jumping from the one below it.
+"""
+from collections import namedtuple
+import queue
+import random
+import threading
+from settings import (HEIGHT,
+                      WIDTH,
+                      PLAYER_ACC,
+                      PLAYER_FRICTION,
+                      PLAYER_GRAVITY,
+                      PLAYER_JUMP,)
+from atlas_view import frame_size
+from platform_model import PLATFORM_FRAMES
+
+# A platform of the level: its height above the first platform of the level
+# (to the top of the platform), its x coordinate and the index of its frame
+# in PLATFORM_FRAMES.
+LevelPlatform = namedtuple("LevelPlatform", ["height", "x", "kind"])
+
+# Height of the part of the level generated at once.
+CHUNK_HEIGHT = HEIGHT
+
+# Number of chunks generated ahead of the player.
+LOOKAHEAD = 3
+
+# Fraction of the jump envelope used, leaving room for imperfect jumps.
+SAFETY = 0.75
+
+# Chance of an extra platform next to each platform on the path.
+EXTRA_CHANCE = 0.3
+
+# Gap kept between an extra platform and any other platform.
+EXTRA_MARGIN = 20
+
+PLATFORM_SIZES = [frame_size(name) for name in PLATFORM_FRAMES]
+
+
+def jump_envelope():
+    """
+    Simulate the highest jump of a player starting from rest and holding an
+    arrow key, following the physics of Player.update.
+
+    Returns:
+        A list of (x, y) tuples of how far the player has moved sideways and
+        upwards after each tick, until it falls back below where it started.
+    """
+    pos_x, pos_y = 0, 0
+    vel_x, vel_y = 0, -PLAYER_JUMP
+    path = []
+    while pos_y <= 0:
+        acc_x = PLAYER_ACC + vel_x * PLAYER_FRICTION
+        vel_x += acc_x
+        vel_y += PLAYER_GRAVITY
+        pos_x += vel_x + 0.5 * acc_x
+        pos_y += vel_y + 0.5 * PLAYER_GRAVITY
+        path.append((pos_x, -pos_y))
+    return path
+
+
+ENVELOPE = jump_envelope()
+
+# Highest rise between two platforms on the path, and the smallest (so that
+# platforms never overlap).
+MAX_RISE = int(SAFETY * max(rise for _, rise in ENVELOPE))
+MIN_RISE = max(height for _, height in PLATFORM_SIZES) + 10
+
+
+def reach(rise):
+    """
+    Find how far sideways a player can get while jumping up to a platform.
+
+    Args:
+        rise: A number containing how far above the player the platform is.
+
+    Returns:
+        An integer containing how many pixels the player can move sideways
+        before it falls back below the platform, scaled down by SAFETY.
+    """
+    apex = max(range(len(ENVELOPE)), key=lambda tick: ENVELOPE[tick][1])
+    distance = 0
+    for run, height in ENVELOPE[apex:]:
+        if height < rise:
+            break
+        distance = run
+    return int(SAFETY * distance)
+
+
+def overlaps(plat, others):
+    """
+    Check if a platform is too close to any other platform.
+
+    Args:
+        plat: A LevelPlatform.
+        others: A list of LevelPlatforms.
+
+    Returns:
+        A boolean that is True if the platforms, grown by EXTRA_MARGIN on
+        every side, overlap.
+    """
+    width, height = PLATFORM_SIZES[plat.kind]
+    for other in others:
+        other_width, other_height = PLATFORM_SIZES[other.kind]
+        if (plat.x < other.x + other_width + EXTRA_MARGIN
+                and other.x < plat.x + width + EXTRA_MARGIN
+                and plat.height - height - EXTRA_MARGIN < other.height
+                and other.height - other_height - EXTRA_MARGIN < plat.height):
+            return True
+    return False
+
+
+def next_platform(rng, below, max_rise=MAX_RISE):
+    """
+    Randomly place a platform that can be reached from another one.
+
+    Args:
+        rng: A random number generator.
+        below: The LevelPlatform the new platform is reached from.
+        max_rise: An optional integer containing the most the new platform
+            can be above the other one.
+
+    Returns:
+        A LevelPlatform above the other one.
+    """
+    kind = rng.randrange(len(PLATFORM_FRAMES))
+    width = PLATFORM_SIZES[kind][0]
+    below_width = PLATFORM_SIZES[below.kind][0]
+    rise = rng.randint(MIN_RISE, max_rise)
+
+    # The player stands inside the platform below and has to land inside the
+    # new one, so the gap between them can be at most the reach.
+    gap = reach(rise) - 2
+    lowest = max(0, below.x - gap - width)
+    highest = min(WIDTH - width, below.x + below_width + gap)
+    return LevelPlatform(below.height + rise, rng.randint(lowest, highest),
+                         kind)
+
+
+def generate_chunk(seed, index, last):
+    """
+    Generate one chunk of a level.
+
+    The chunk is a path of platforms, each reachable from the one before it,
+    with some extra platforms beside the path. Extra platforms are no higher
+    than the next platform on the path, so the path that follows never runs
+    into them, and are dropped if they are too close to another platform. A
+    chunk only depends on its arguments, so a level is always the same for
+    the same seed.
+
+    Args:
+        seed: An integer containing the seed of the level.
+        index: An integer containing the index of the chunk, counting up from
+            0 for the chunk right above the first platform.
+        last: The LevelPlatform at the top of the path of the chunk before.
+
+    Returns:
+        A tuple containing a list of the chunk's LevelPlatforms sorted by
+        height, and the LevelPlatform at the top of its path.
+    """
+    rng = random.Random(seed * 1000003 + index)
+    top = (index + 1) * CHUNK_HEIGHT
+    platforms = []
+    while last.height < top:
+        below, last = last, next_platform(rng, last)
+        platforms.append(last)
+        if rng.random() < EXTRA_CHANCE:
+            extra = next_platform(rng, below,
+                                  max(MIN_RISE, last.height - below.height))
+            if not overlaps(extra, platforms):
+                platforms.append(extra)
+    platforms.sort(key=lambda plat: plat.height)
+    return platforms, last
+
+
+class LevelGenerator:
+    """
+    Generate the chunks of a level in order, either on a worker thread that
+    keeps LOOKAHEAD chunks ready, or when they are asked for.
+
+    Attributes:
+        seed: An integer containing the seed of the level.
+        last: The LevelPlatform at the top of the path generated so far.
+        index: An integer containing the index of the next chunk to generate.
+        handed: An integer containing the number of chunks given out by
+            next_chunk, which is behind index while the worker thread has
+            chunks ready.
+        top: The LevelPlatform at the top of the path of the chunks given
+            out so far.
+        chunks: A Queue of tuples, each containing a list of LevelPlatforms
+            and the LevelPlatform at the top of its path, or None if chunks
+            are generated when asked for.
+        stopped: A threading Event that is set to stop the worker thread.
+    """
+
+    def __init__(self, seed, first, threaded=True, index=0):
+        """
+        Start generating a level.
+
+        Args:
+            seed: An integer containing the seed of the level.
+            first: The LevelPlatform the level starts from, at height 0, or
+                the top of the path of the chunk before index.
+            threaded: An optional boolean that is True to generate chunks on a
+                worker thread.
+            index: An optional integer containing the index of the first
+                chunk to generate, to carry on with a level part of the way
+                through.
+        """
+        self.seed = seed
+        self.last = first
+        self.index = index
+        self.handed = index
+        self.top = first
+        self.stopped = threading.Event()
+        self.chunks = None
+        if threaded:
+            self.chunks = queue.Queue(maxsize=LOOKAHEAD)
+            threading.Thread(target=self.work, daemon=True).start()
+
+    def generate(self):
+        """
+        Generate the next chunk.
+
+        Returns:
+            A list of LevelPlatforms sorted by height.
+        """
+        platforms, self.last = generate_chunk(self.seed, self.index,
+                                              self.last)
+        self.index += 1
+        return platforms
+
+    def work(self):
+        """
+        Keep the queue of chunks full until the generator is closed.
+        """
+        while not self.stopped.is_set():
+            chunk = (self.generate(), self.last)
+            while not self.stopped.is_set():
+                try:
+                    self.chunks.put(chunk, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+
+    def next_chunk(self, block=True):
+        """
+        Get the next chunk of the level.
+
+        Args:
+            block: An optional boolean. If False, None is returned instead of
+                waiting when the worker thread has no chunk ready.
+
+        Returns:
+            A list of LevelPlatforms sorted by height, or None.
+        """
+        if self.chunks is None:
+            chunk, last = self.generate(), self.last
+        else:
+            try:
+                chunk, last = self.chunks.get(block)
+            except queue.Empty:
+                return None
+        self.handed += 1
+        self.top = last
+        return chunk
+
+    def close(self):
+        """
+        Stop the worker thread.
+        """
+        self.stopped.set()
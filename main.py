@@ -1,44 +1,123 @@
 """
 Puts together all game elements into a main game loop.
 """
+# Time the startup from as early as possible.
+from time import perf_counter
+g_launched = perf_counter()
 
+# pylint: disable=wrong-import-position
+from os import path
 import pygame as pg
 
 from game_model import GameModel
-from game_view import GameView
-from controller import PlayerController
-from settings import FPS
-g_model = GameModel()
-g_controller = PlayerController(g_model)
-g_view = GameView(g_model)
+from controller import KeyboardInput
+from input_model import NO_INPUT
+from score_store import ScoreStore
+from text_view import find_font
+from settings import (FPS,
+                      RENDER_FPS,
+                      THREADED,
+                      REPLAY_FILE,
+                      PROFILE,
+                      PROFILE_OVERLAY,
+                      PROFILE_FILE,
+                      SCORE_FILE,
+                      HS_FILE,
+                      FONT_NAME,)
+from timestep import FixedTimestep
+from profiler import FrameProfiler
+from threaded_model import SimulationThread
 
-g_view.show_start_screen()
+# Open the window and show the start screen first. The system fonts are
+# searched while the scores and images load, and music is decoded in the
+# background after the start screen is shown.
+find_font(FONT_NAME)
+g_dir = path.dirname(__file__)
+g_scores = ScoreStore(path.join(g_dir, SCORE_FILE),
+                      legacy_file=path.join(g_dir, HS_FILE))
+g_model = GameModel(scores=g_scores)
+g_view = g_model.view
+g_view.draw_start_screen()
+# Only report how long startup took when profiling, so normal launches stay
+# quiet.
+if PROFILE:
+    print(f"First frame after {(perf_counter() - g_launched) * 1000:.0f} ms")
+
+# The profiler's sections can't be timed from two threads at once.
+g_profile = PROFILE and not THREADED
+if g_profile:
+    g_model.profiler = FrameProfiler(overlay=PROFILE_OVERLAY)
+g_source = KeyboardInput()
+g_timestep = FixedTimestep(FPS)
+
+g_model.wait_for_key()
 
 while g_model.running:
     g_model.new()
     # Start running the game loop.
     g_model.playing = True
 
+    # Don't count the time spent on the start or game over screen.
+    g_model.clock.tick()
+    g_timestep.reset()
+    g_inputs = NO_INPUT
+
+    # Start the simulation thread, which plays the game until it ends.
+    if THREADED:
+        g_simulation = SimulationThread(g_model, FPS)
+        g_simulation.start()
+
     # Game loop.
     while g_model.playing:
-        # Set delay for fixed time gap for each iteration of game loop (in
-        # this case, 60 iterations (frames) per second).
-        g_model.clock.tick(FPS)
+        # Limit the number of frames drawn per second, and find how much time
+        # has passed since the last frame.
+        elapsed = g_model.clock.tick(RENDER_FPS) / 1000
+        g_model.profiler.begin_frame()
 
-        # Input and process user's key presses.
-        g_controller.events()
+        # Read the user's input once per frame. Key presses not used by a
+        # tick yet are kept for the next one.
+        g_inputs = g_inputs.then(g_source.poll())
+        g_model.profiler.mark("events")
 
-        # Input and process left and right key presses.
-        # g_controller.movement()
+        # With a simulation thread, hand it the input and draw the latest
+        # tick it published, interpolated up to the present, playing the
+        # sounds of the ticks since the last frame.
+        if THREADED:
+            g_simulation.post(g_inputs)
+            g_inputs = NO_INPUT
+            g_state, g_alpha = g_simulation.latest()
+            for g_sound in g_simulation.sounds(g_state):
+                g_view.audio.play(g_sound)
+            g_view.draw(g_alpha, g_state)
+            continue
 
-        # Update the game state to reflect the key presses.
-        g_model.update()
+        # Update the game state to reflect the key presses, once for every
+        # fixed-length tick (in this case, 1/60 of a second) that has passed,
+        # so the game runs at the same speed whatever the frame rate. Only
+        # the first tick gets the key presses, while the arrow keys stay held.
+        for _ in range(g_timestep.advance(elapsed)):
+            g_model.update(g_inputs)
+            g_inputs = g_inputs.held()
 
-        # Draw (render) the changes.
-        g_view.draw()
+        # Draw (render) the changes, interpolating between the last two ticks.
+        g_view.draw(g_timestep.alpha)
+        g_model.profiler.end_frame()
+
+    # Wait for the simulation thread to finish its last tick.
+    if THREADED:
+        g_simulation.join()
+
+    # Keep the input of the game, so it can be replayed.
+    g_model.input_log.save(path.join(g_dir, REPLAY_FILE))
 
-    pg.mixer.music.fadeout(500)
     g_view.show_go_screen()
 
+# Save the frame times of the end of the session.
+if g_profile:
+    g_model.profiler.dump(path.join(g_dir, PROFILE_FILE))
+
+# Save any scores still being written, and let the music finish decoding.
+g_scores.close()
+g_view.audio.close()
 
 pg.quit()
@@ -1,49 +1,320 @@
 """
-Create an instance of a Platform sprite.
+Create the platforms of the game, and the pool and group that hold them.
 """
-from random import choice
+from bisect import bisect_left, bisect_right, insort
+import random
 import pygame as pg
-from settings import BLACK
+from atlas_view import frame_size
 
+# Names of the frames that can be used for platforms.
+PLATFORM_FRAMES = ["smallplatform.png", "largeplatform.png"]
 
-class Platform(pg.sprite.Sprite):
+# Size of each kind of platform.
+PLATFORM_SIZES = [frame_size(name) for name in PLATFORM_FRAMES]
+
+
+def top(platform):
+    """
+    Get the y coordinate of the top of a platform, used to sort platforms.
+
+    Args:
+        platform: a Platform, or anything else with a rect
+
+    Returns:
+        An integer containing the y coordinate of the top of the platform.
+    """
+    return platform.rect.top
+
+
+class Platform:
     """
-    Platform model class that inherits from the pygame Sprite class.
+    A platform of the game, as plain data with no images.
+
+    The view draws platforms through sprites of its own, so a platform only
+    holds what the simulation needs.
 
     Attributes:
-    game: an instance of a Game
-    images: a list of images that can be displayed for the platforms (in this
-    case, lillypads)
-    image: a random choice of either the larger or smaller lillypad which will
-    be displayed
     rect: the interactable area of the lillypad platforms
+    kind: the index of the platform's frame in PLATFORM_FRAMES
+    previous_topleft: the position of the platform at the start of the last
+    tick, used to interpolate its position when drawing
+    group: the PlatformGroup the platform is in, or None
     """
+    __slots__ = ("rect", "kind", "previous_topleft", "group")
 
-    def __init__(self, game_view, x_coord, y_coord):
+    def __init__(self, x_coord, y_coord, rng=random, kind=None):
         """
         Set initial conditions for Platform class.
 
-        Grab platform images from spritesheet, randomly choose a platform, and
-        create pygame sprite of Platform at specified position.
+        Randomly choose a platform (unless kind is given) at the specified
+        position.
 
         Args:
-            game_view: an instance of a GameView
             x_coord: the x positon of the platform
             y_coord: the y position of the platform
+            rng: the random number generator used to choose the platform
+                (the random module by default)
+            kind: the index of the platform's frame in PLATFORM_FRAMES, or
+                None to choose it randomly
         """
-        # Create an instance of a game view.
-        self.game_view = game_view
-        # Inherit all attributes of pygame Sprite class.
-        pg.sprite.Sprite.__init__(self)
+        self.rect = pg.Rect(0, 0, 0, 0)
+        self.group = None
 
-        # Create platform sprite.
-        self.images = [self.game_view.spritesheet.get_image(215, 346, 136, 40),
-                        self.game_view.spritesheet.get_image(83, 276, 318, 68, scale=0.8)]
+        # Choose a platform and set platform positions.
+        self.reset(x_coord, y_coord, rng, kind)
+
+    def reset(self, x_coord, y_coord, rng=random, kind=None):
+        """
+        Choose a platform (randomly, unless kind is given) and move it to a
+        new position.
 
-        self.image = choice(self.images)
-        self.image.set_colorkey(BLACK)
-        self.rect = self.image.get_rect()
+        This is used to recycle a platform that is no longer on the screen.
 
-        # Set platform positions.
+        Args:
+            x_coord: the x positon of the platform
+            y_coord: the y position of the platform
+            rng: the random number generator used to choose the platform
+                (the random module by default)
+            kind: the index of the platform's frame in PLATFORM_FRAMES, or
+                None to choose it randomly
+        """
+        if kind is None:
+            kind = rng.randrange(len(PLATFORM_FRAMES))
+        self.kind = kind
+        self.rect.size = PLATFORM_SIZES[kind]
         self.rect.x = x_coord
         self.rect.y = y_coord
+        self.previous_topleft = self.rect.topleft
+
+    def alive(self):
+        """
+        Check if the platform is in a group.
+
+        Returns:
+            A boolean that is True if it is.
+        """
+        return self.group is not None
+
+    def kill(self):
+        """
+        Remove the platform from its group, if it is in one.
+        """
+        if self.group is not None:
+            self.group.remove(self)
+
+
+class PlatformPool:
+    """
+    Pool of Platform sprites that are recycled instead of being recreated.
+
+    Attributes:
+        free: a list of the platforms that are not currently in use
+        created: the number of platforms the pool has had to create
+        reused: the number of times a free platform has been recycled
+    """
+
+    def __init__(self):
+        """
+        Create an empty pool.
+        """
+        self.free = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, x_coord, y_coord, rng=random, kind=None):
+        """
+        Get a platform at the given position, recycling a free one if there is
+        one.
+
+        Args:
+            x_coord: the x positon of the platform
+            y_coord: the y position of the platform
+            rng: the random number generator used to choose the platform
+                (the random module by default)
+            kind: the index of the platform's frame in PLATFORM_FRAMES, or
+                None to choose it randomly
+
+        Returns:
+            An instance of a Platform that is not in any group.
+        """
+        if self.free:
+            platform = self.free.pop()
+            platform.reset(x_coord, y_coord, rng, kind)
+            self.reused += 1
+        else:
+            platform = Platform(x_coord, y_coord, rng, kind)
+            self.created += 1
+        return platform
+
+    def release(self, platform):
+        """
+        Remove a platform from its group and keep it for reuse.
+
+        Args:
+            platform: an instance of a Platform that is no longer needed
+        """
+        platform.kill()
+        self.free.append(platform)
+
+
+class PlatformGroup:
+    """
+    Group of platforms that keeps them sorted by the y coordinate of their
+    tops, so collisions only check platforms at the right height.
+
+    The index is updated when platforms are added to or removed from the
+    group (including when they are killed). Moving every platform by the same
+    amount, as scrolling and falling do, keeps them in the same order, so the
+    index does not need updating then. A platform moved on its own must be
+    passed to reposition. Iterating over the group gives the platforms in
+    the order they were added, and the group can be changed while doing so.
+
+    Attributes:
+        by_top: a list of the platforms sorted by the y coordinate of their
+        tops
+        max_height: the height of the tallest platform added so far
+        serials: a dictionary mapping each platform to the order it was added
+        in, so collisions are reported in the same order as iterating over
+        the group
+        next_serial: the serial number given to the next platform added
+    """
+
+    def __init__(self, *platforms):
+        """
+        Create a group, optionally adding platforms to it.
+
+        Args:
+            *platforms: platforms to add to the group
+        """
+        self.by_top = []
+        self.max_height = 0
+        self.serials = {}
+        self.next_serial = 0
+        self.add(*platforms)
+
+    def __iter__(self):
+        """
+        Iterate over a copy of the platforms, in the order they were added.
+
+        Returns:
+            An iterator of platforms.
+        """
+        return iter(list(self.serials))
+
+    def __len__(self):
+        """
+        Get the number of platforms in the group.
+
+        Returns:
+            An integer containing the number of platforms.
+        """
+        return len(self.serials)
+
+    def __contains__(self, platform):
+        """
+        Check if a platform is in the group.
+
+        Args:
+            platform: a Platform
+
+        Returns:
+            A boolean that is True if it is.
+        """
+        return platform in self.serials
+
+    def add(self, *platforms):
+        """
+        Add platforms to the group and the index, taking them out of any
+        other group.
+
+        Args:
+            *platforms: the platforms being added
+        """
+        for platform in platforms:
+            if platform.group is self:
+                continue
+            platform.kill()
+            platform.group = self
+            insort(self.by_top, platform, key=top)
+            self.max_height = max(self.max_height, platform.rect.height)
+            self.serials[platform] = self.next_serial
+            self.next_serial += 1
+
+    def remove(self, *platforms):
+        """
+        Remove platforms from the group and the index.
+
+        Args:
+            *platforms: the platforms being removed
+        """
+        for platform in platforms:
+            if platform.group is not self:
+                continue
+            platform.group = None
+            self.by_top.remove(platform)
+            del self.serials[platform]
+
+    def reposition(self, platform):
+        """
+        Update the index after a single platform in the group has moved.
+
+        Args:
+            platform: the platform that moved
+        """
+        self.by_top.remove(platform)
+        insort(self.by_top, platform, key=top)
+
+    def reindex(self):
+        """
+        Rebuild the index after any of the platforms in the group have moved,
+        keeping platforms at the same height in the order they were added.
+        """
+        self.by_top = sorted(self.serials, key=top)
+
+    def below(self, y_coord):
+        """
+        Find the platforms whose tops are at or below a height.
+
+        Args:
+            y_coord: a number containing the y coordinate
+
+        Returns:
+            A list of the platforms, highest first.
+        """
+        return self.by_top[bisect_left(self.by_top, y_coord, key=top):]
+
+    def above(self, y_coord):
+        """
+        Find the platforms whose bottoms are above a height.
+
+        Args:
+            y_coord: a number containing the y coordinate
+
+        Returns:
+            A list of the platforms, highest first.
+        """
+        end = bisect_left(self.by_top, y_coord, key=top)
+        return [plat for plat in self.by_top[:end]
+                if plat.rect.bottom < y_coord]
+
+    def collide(self, rect):
+        """
+        Find the platforms overlapping a rectangle, like
+        pygame.sprite.spritecollide would for sprites.
+
+        Only the platforms whose tops are between the top of the rectangle
+        (less the height of the tallest platform) and its bottom are checked.
+
+        Args:
+            rect: a pygame Rect to check
+
+        Returns:
+            A list of the platforms overlapping the rectangle, in the order
+            they were added to the group.
+        """
+        start = bisect_right(self.by_top, rect.top - self.max_height, key=top)
+        end = bisect_left(self.by_top, rect.bottom, key=top)
+        hits = [plat for plat in self.by_top[start:end]
+                if rect.colliderect(plat.rect)]
+        hits.sort(key=self.serials.__getitem__)
+        return hits
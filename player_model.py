@@ -2,96 +2,158 @@
 Create a player for the PlatFrogs game.
 """
 import pygame as pg
-from settings import (BLACK,
-                      HEIGHT,
+from settings import (HEIGHT,
                       WIDTH,
                       PLAYER_JUMP,
                       PLAYER_ACC,
                       PLAYER_GRAVITY,
                       PLAYER_FRICTION,)
-
-from game_view import GameView
-from controller import PlayerController
+from animation_model import Animation, WALK_SPEED
+from atlas_view import frame_size
+from input_log import LEFT, RIGHT
+from input_model import HELD, NO_INPUT
 # Import vectors from pygame math module.
 vec = pg.math.Vector2
 
-class Player(pg.sprite.Sprite):
+class Player:
     """
     The frog player class used throughout the game.
 
+    A player is plain data with no images. The view draws it through a
+    sprite of its own, showing the frame its animation is on.
+
     Attributes:
-        game: an instance of a Game
         walking: boolean set to True if the player is walking, set to False
         otherwise
         jumping: boolean set to True if the player is jumping, otherwise False
-        current_frame: the current frame of animation
-        last_update: the latest update of the player (used in animation)
-        image: the image of the character (what will be displayed)
+        animation: an instance of an Animation class choosing the frame to
+        show, stepped once per tick
         rect: the interactable dimensions of the player image (rectangle)
         rect.center: position of the center of the player sprite
+        previous_topleft: the position of the player sprite at the start of
+            the last tick, used to interpolate its position when drawing
+        ground: the platform the player landed on in the last update, or None
+            if it is not standing on a platform
         pos: a vector with the x and y positions of the player sprite
         vel: a vector with the x and y velocities of the player sprite
         acc: a vector with the x and y accelerations of the player sprite
         flag_unit_test: an integer indicating whether a player enters certain
             methods, used for unit testing.
+        inputs: the InputSnapshot of the current tick, whose arrow keys move
+            the player
+        dead: boolean set to True once the player has fallen out of the game
     """
+    __slots__ = ("walking", "jumping", "animation", "rect",
+                 "previous_topleft", "ground", "pos", "vel", "acc",
+                 "flag_unit_test", "inputs", "dead")
 
-    def __init__(self, game_model):
+    def __init__(self):
         """
         Initialize the Player class.
-
-        Args:
-            game_model: An instance of a game model.
         """
-
-        # Inherit all attributes of pygame Sprite class.
-        pg.sprite.Sprite.__init__(self)
-
-        # Pass an instance of the game to the player sprite.
-        self.game_model = game_model
-
-        # Initialize an instance of the game view.
-        self.game_view =  GameView(game_model)
-
         # Animation attributes.
         self.walking = False
         self.jumping = False
-        self.current_frame = 0
-        self.last_update = 0
+        self.animation = Animation()
 
-        # Create a player sprite.
-        self.image = self.game_view.spritesheet.get_image(83, 346, 64, 50)
-        self.image.set_colorkey(BLACK)
-        # self.game_view.load_images()
-        self.rect = self.image.get_rect()
+        # Create the rectangle used for collisions, the size of the player's
+        # first frame.
+        self.rect = pg.Rect((0, 0), frame_size("lookleft.png"))
 
         # Initialize sprite's position, velocity, and acceleration vectors.
         self.rect.center = (100, HEIGHT - 50)
+        self.previous_topleft = self.rect.topleft
         self.pos = vec(100, HEIGHT - 50)
         self.vel = vec(0, 0)
         self.acc = vec(0, 0)
+        self.ground = None
+        self.dead = False
 
         # Initialize a flag used for unit testing the controller.
         self.flag_unit_test = 0
 
-        # Initialize controller instance.
-        self.controller = PlayerController(game_model)
+        # No keys are held until the game gives the player its input.
+        self.inputs = NO_INPUT
+
+    def alive(self):
+        """
+        Check if the player is still in the game.
+
+        Returns:
+            A boolean that is True until the player is killed.
+        """
+        return not self.dead
+
+    def kill(self):
+        """
+        Take the player out of the game, so it is no longer updated or drawn.
+        """
+        self.dead = True
+
+    def handle(self, inputs):
+        """
+        Use the input of a tick, making its jumps and jump cuts in the order
+        they were given and keeping its arrow keys for the update.
+
+        Args:
+            inputs: An InputSnapshot of the input for the tick.
+
+        Returns:
+            A boolean that is True if the player jumped.
+        """
+        self.inputs = inputs
+        if not inputs.bits & ~HELD:
+            return False
+        if inputs.cut_first:
+            self.jump_cut()
+        jumped = inputs.jump and self.jump()
+        if inputs.jump_cut and not inputs.cut_first:
+            self.jump_cut()
+        return jumped
 
     def jump(self):
         """
-        Execute necessary actions for jumping movement of player (jump sound,
-        moving, etc.)
+        Execute necessary actions for jumping movement of player.
+
+        Returns:
+            A boolean that is True if the player was on a platform and
+            jumped, so the jump sound should be played.
         """
         # Change value of flag for unit test.
         self.flag_unit_test = 1
         # Check if player sprite is on a platform.
-        self.rect.y += 2
-        hits = pg.sprite.spritecollide(self, self.game_model.platforms, False)
-        self.rect.y -= 2
-        if hits and not self.jumping:
-            self.game_view.jump_sound.play()
+        if self.ground is not None and not self.jumping:
             self.jumping = True
             self.vel.y = -PLAYER_JUMP
+            return True
+        return False
+
+    def land(self, platforms):
+        """
+        Rest the player on the lowest platform it hits while falling, and
+        remember that platform as the ground it can jump from.
+
+        Args:
+            platforms: The PlatformGroup of the platforms in the game.
+        """
+        self.ground = None
+        if self.vel.y <= 0:
+            return
+        hits = platforms.collide(self.rect)
+        if not hits:
+            return
+        lowest = hits[0]
+        for hit in hits:
+            if hit.rect.bottom > lowest.rect.bottom:
+                lowest = hit
+
+        # Enable player sprite to rest on a platform.
+        if lowest.rect.left < self.pos.x < lowest.rect.right and \
+        self.pos.y < lowest.rect.centery:
+            self.pos.y = lowest.rect.top
+            self.vel.y = 0
+            self.jumping = False
+            self.ground = lowest
 
     def jump_cut(self):
         """
@@ -143,8 +205,15 @@ class Player(pg.sprite.Sprite):
         # Include gravity in the game.
         self.acc = vec(0, PLAYER_GRAVITY)
 
-        # Move the player left and right.
-        self.controller.move_test()
+        # Move the player left and right, coming to a halt if both arrow keys
+        # are held.
+        held = self.inputs.bits & HELD
+        if held == HELD:
+            self.move("Stop")
+        elif held == LEFT:
+            self.move("Left")
+        elif held == RIGHT:
+            self.move("Right")
 
         # Instill friction into movement.
         self.acc.x += self.vel.x * PLAYER_FRICTION
@@ -158,61 +227,30 @@ class Player(pg.sprite.Sprite):
         self.pos += self.vel + 0.5 * self.acc
 
         # Make sprite wrap around screen.
+        wrapped = False
         if self.pos.x < 0  - self.rect.width / 2:
             self.pos.x = WIDTH + self.rect.width / 2
+            wrapped = True
 
         if self.pos.x > WIDTH  + self.rect.width / 2:
             self.pos.x = 0  - self.rect.width / 2
+            wrapped = True
 
-        # Set sprite position.
+        # Set sprite position. A wrapped sprite is not interpolated from the
+        # other side of the screen, or it would be drawn streaking across it.
         self.rect.midbottom = self.pos
+        if wrapped:
+            self.previous_topleft = self.rect.topleft
 
     def animate(self):
         """
         Animate player sprite.
 
-        Define what the sprite will look like in different states, i.e. if it
-        is jumping or walking, and which direction it is pointing in.
+        Step the animation by one tick, which decides if the player is
+        walking or jumping and which direction it is facing, and show its
+        frame.
         """
-        # Initialize timer (to be used later).
-        now = pg.time.get_ticks()
-
         # Decide if player is walking.
-        if abs(self.vel.x) >= 0.5:
-            self.walking = True
-        else:
-            self.walking = False
-
-        # Jumping animation.
-        if self.jumping:
+        self.walking = abs(self.vel.x) >= WALK_SPEED
 
-            # Choose left or right jumping frame depending on the player's
-            # horizontal velocity.
-            if self.vel.x < 0:
-                self.image = self.game_view.jump_l
-            else:
-                self.image = self.game_view.jump_r
-
-        # Walking animation.
-        elif self.walking:
-            # Alternate between two walking animation frames every 100
-            # milliseconds to produce a realistic walking motion.
-            if now - self.last_update > 100:
-                self.last_update = now
-                self.current_frame = (self.current_frame + 1) \
-                % len(self.game_view.walk_frames_l)
-                # Choose left or right walking frame based on the player's
-                # horizontal velocity.
-                if self.vel.x < 0:
-                    self.image = \
-                    self.game_view.walk_frames_l[self.current_frame]
-                else:
-                    self.image = \
-                    self.game_view.walk_frames_r[self.current_frame]
-
-        # Ensure that jumping and walking sprites are in the same direction.
-        else:
-            if self.image == self.game_view.jump_l:
-                self.image = self.game_view.walk_frames_l[self.current_frame]
-            elif self.image == self.game_view.jump_r:
-                self.image = self.game_view.walk_frames_r[self.current_frame]
+        self.animation.step(self.jumping, self.vel.x)
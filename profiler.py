@@ -0,0 +1,329 @@
+"""
+Time each phase of every frame of the game loop, keeping the most recent
+frames in a ring buffer that can be summarised on screen or saved to a file.
+"""
+from array import array
+import csv
+import json
+import time
+
+# Sections of a frame, timed in this order. Each is timed from the end of
+# the section before it, so the time of code between two sections counts
+# towards the later one.
+SECTIONS = ("wait",
+            "events",
+            "sprites",
+            "collision",
+            "scroll",
+            "spawn",
+            "fall",
+            "cull",
+            "fill",
+            "blit",
+            "text",
+            "flip")
+
+# Phases of the game loop and the sections they are made of.
+PHASES = {
+    "events": ("events",),
+    "update": ("sprites", "collision", "scroll", "spawn", "fall"),
+    "draw": ("cull", "fill", "blit", "text", "flip"),
+    "frame": SECTIONS[1:],
+}
+
+# Percentiles shown and saved for each section and phase.
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, percent):
+    """
+    Find a percentile of some values using the nearest-rank method.
+
+    Args:
+        values: A sorted list of numbers.
+        percent: A number from 0 to 100.
+
+    Returns:
+        The smallest value that at least percent percent of the values are
+        less than or equal to, or 0 if there are no values.
+    """
+    if not values:
+        return 0
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+
+class NullProfiler:
+    """
+    Profiler that does nothing, used when profiling is turned off so the game
+    loop can always call the same methods at almost no cost.
+
+    Attributes:
+        overlay: A boolean that is True if a summary is drawn on the screen
+            (always False).
+    """
+    overlay = False
+
+    def begin_frame(self):
+        """
+        Do nothing instead of starting a frame.
+        """
+
+    def mark(self, section):
+        """
+        Do nothing instead of timing a section.
+
+        Args:
+            section: A string containing the name of a section.
+        """
+
+    def end_frame(self):
+        """
+        Do nothing instead of ending a frame.
+        """
+
+
+class FrameProfiler:
+    """
+    Time the sections of the most recent frames of the game loop.
+
+    Call begin_frame when a frame starts, mark after each section and
+    end_frame when the frame has been drawn. Sections marked several times in
+    a frame, like the update sections when several ticks run, are added up.
+
+    Attributes:
+        size: An integer containing the number of frames kept.
+        overlay: A boolean that is True if a summary is drawn on the screen.
+        clock: A function returning the time in seconds.
+        times: A dictionary mapping each section to an array of its time in
+            seconds for each frame slot of the ring buffer.
+        index: An integer containing the slot of the current frame.
+        frames: An integer containing the number of frames ended.
+        last: A float containing the time the last section ended.
+        summary_every: An integer containing how many frames the on-screen
+            summary is kept for before it is worked out again.
+        summary: A list of the lines of the on-screen summary.
+    """
+
+    def __init__(self, size=600, overlay=False, clock=time.perf_counter):
+        """
+        Create a profiler with an empty ring buffer.
+
+        Args:
+            size: An optional integer containing the number of frames kept.
+            overlay: An optional boolean that is True to draw a summary on
+                the screen.
+            clock: An optional function returning the time in seconds.
+        """
+        self.size = size
+        self.overlay = overlay
+        self.clock = clock
+        self.times = {section: array("d", bytes(8 * size))
+                      for section in SECTIONS}
+        self.index = 0
+        self.frames = 0
+        self.last = clock()
+        self.summary_every = 30
+        self.summary = []
+
+    def begin_frame(self):
+        """
+        Start timing a new frame, counting the time since the last frame
+        ended as waiting.
+        """
+        for times in self.times.values():
+            times[self.index] = 0
+        self.mark("wait")
+
+    def mark(self, section):
+        """
+        Add the time since the last mark to a section of this frame.
+
+        Args:
+            section: A string containing the name of a section in SECTIONS.
+        """
+        now = self.clock()
+        self.times[section][self.index] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        """
+        Store the current frame in the ring buffer.
+        """
+        self.frames += 1
+        self.index = self.frames % self.size
+        if self.overlay and (self.frames - 1) % self.summary_every == 0:
+            self.summary = self.summary_lines()
+
+    def history(self, section):
+        """
+        Get the times of a section or phase for the frames kept, oldest first.
+
+        Args:
+            section: A string containing the name of a section or a phase.
+
+        Returns:
+            A list of floats containing times in seconds.
+        """
+        count = min(self.frames, self.size)
+        start = (self.frames - count) % self.size
+        slots = [(start + offset) % self.size for offset in range(count)]
+        parts = [self.times[name] for name in PHASES.get(section, (section,))]
+        return [sum(times[slot] for times in parts) for slot in slots]
+
+    def percentiles(self, section):
+        """
+        Find the percentiles of the time of a section or phase.
+
+        Args:
+            section: A string containing the name of a section or a phase.
+
+        Returns:
+            A dictionary mapping each percentile in PERCENTILES to a time in
+            milliseconds.
+        """
+        values = sorted(self.history(section))
+        return {percent: percentile(values, percent) * 1000
+                for percent in PERCENTILES}
+
+    def summary_lines(self):
+        """
+        Describe the percentiles of each phase for the on-screen summary.
+
+        Returns:
+            A list of strings, one for each phase.
+        """
+        lines = []
+        for phase in PHASES:
+            times = self.percentiles(phase)
+            lines.append(f"{phase} " + " ".join(
+                f"p{percent} {times[percent]:.2f}" for percent in PERCENTILES)
+                + " ms")
+        return lines
+
+    def dump(self, filename):
+        """
+        Save the frames kept to a file.
+
+        A .json file holds the percentiles of every section and phase as
+        well as the time of each section in every frame, while any other file
+        is written as CSV with one row per frame. All times are in
+        milliseconds.
+
+        Args:
+            filename: A string containing the path of the file.
+        """
+        columns = {name: [value * 1000 for value in self.history(name)]
+                   for name in SECTIONS + tuple(PHASES)}
+        if filename.endswith(".json"):
+            with open(filename, "w") as file:
+                json.dump({
+                    "frames": self.frames,
+                    "percentiles": {
+                        name: {f"p{percent}": value for percent, value
+                               in self.percentiles(name).items()}
+                        for name in columns},
+                    "times": columns,
+                }, file, indent=1)
+            return
+        with open(filename, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + list(columns))
+            first = self.frames - len(columns["wait"])
+            for row, values in enumerate(zip(*columns.values())):
+                writer.writerow([first + row] + [f"{value:.4f}"
+                                                 for value in values])
+
+
+class FrameHistogram:
+    """
+    Count how long the intervals between frames (or ticks) were, in buckets
+    of equal width, to show how evenly they are paced.
+
+    Call tick once per frame. The first call only starts timing.
+
+    Attributes:
+        bucket_ms: A float containing the width of a bucket in milliseconds.
+        counts: A list of integers containing the number of intervals in each
+            bucket. The last bucket counts every interval longer than the
+            others cover.
+        clock: A function returning the time in seconds.
+        last: A float containing the time of the last tick, or None before
+            the first one.
+        intervals: A list of floats containing every interval in seconds.
+    """
+
+    def __init__(self, bucket_ms=2, buckets=25, clock=time.perf_counter):
+        """
+        Create a histogram with no intervals.
+
+        Args:
+            bucket_ms: An optional float containing the width of a bucket in
+                milliseconds.
+            buckets: An optional integer containing the number of buckets.
+            clock: An optional function returning the time in seconds.
+        """
+        self.bucket_ms = bucket_ms
+        self.counts = [0] * buckets
+        self.clock = clock
+        self.last = None
+        self.intervals = []
+
+    def tick(self):
+        """
+        Add the interval since the last tick.
+        """
+        now = self.clock()
+        if self.last is not None:
+            self.add(now - self.last)
+        self.last = now
+
+    def add(self, seconds):
+        """
+        Add an interval.
+
+        Args:
+            seconds: A float containing the length of the interval.
+        """
+        bucket = int(seconds * 1000 / self.bucket_ms)
+        self.counts[min(bucket, len(self.counts) - 1)] += 1
+        self.intervals.append(seconds)
+
+    def percentiles(self):
+        """
+        Find the percentiles of the intervals.
+
+        Returns:
+            A dictionary mapping each percentile in PERCENTILES to an
+            interval in milliseconds.
+        """
+        values = sorted(self.intervals)
+        return {percent: percentile(values, percent) * 1000
+                for percent in PERCENTILES}
+
+    def lines(self, width=40):
+        """
+        Draw the histogram as text, one line for each bucket from the first
+        to the last one holding any intervals.
+
+        Args:
+            width: An optional integer containing the length of the longest
+                bar.
+
+        Returns:
+            A list of strings.
+        """
+        used = [bucket for bucket, count in enumerate(self.counts) if count]
+        if not used:
+            return []
+        most = max(self.counts)
+        lines = []
+        for bucket in range(used[0], used[-1] + 1):
+            start = bucket * self.bucket_ms
+            end = "" if bucket == len(self.counts) - 1 \
+                else start + self.bucket_ms
+            label = f"{start:5g}{'-' if end else '+'}{end:<3} ms"
+            count = self.counts[bucket]
+            lines.append(f"{label} {count:6} "
+                         + "#" * round(count * width / most))
+        return lines
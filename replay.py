@@ -0,0 +1,81 @@
+"""
+Replay a recorded game of PlatFrogs as a headless simulation, as fast as it
+can run, and report how it ended.
+"""
+import sys
+import time
+from game_model import GameModel
+from settings import FPS
+from input_log import InputLog
+from input_model import InputSnapshot
+
+
+class ReplayController:
+    """
+    Input source playing back the input recorded in an InputLog.
+
+    It is polled once before every update, like any other input source.
+
+    Attributes:
+        log: An instance of an InputLog class.
+        index: An integer containing the index of the next tick to replay.
+    """
+
+    def __init__(self, log):
+        """
+        Initialize the log to replay.
+
+        Args:
+            log: An instance of an InputLog class.
+        """
+        self.log = log
+        self.index = 0
+
+    @property
+    def finished(self):
+        """
+        Check if every recorded tick has been replayed.
+
+        Returns:
+            A boolean that is True once the log has been used up.
+        """
+        return self.index >= len(self.log)
+
+    def poll(self):
+        """
+        Move on to the next tick of the log.
+
+        Returns:
+            An InputSnapshot of the input recorded for the tick.
+        """
+        bits = self.log.inputs[self.index]
+        self.index += 1
+        return InputSnapshot(bits)
+
+
+def replay(log):
+    """
+    Replay a recorded game headlessly, without a frame cap.
+
+    Args:
+        log: An instance of an InputLog class.
+
+    Returns:
+        A tuple containing the GameModel once the replay has finished, the
+        number of ticks replayed, and the time taken in seconds.
+    """
+    game_model = GameModel(headless=True)
+    source = ReplayController(log)
+    start = time.perf_counter()
+    game_model.new(log.seed)
+    game_model.playing = True
+    while game_model.playing and not source.finished:
+        game_model.update(source.poll())
+    return game_model, source.index, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    LOG = InputLog.load(sys.argv[1])
+    GAME, TICKS, ELAPSED = replay(LOG)
+    print(f"Replayed {TICKS} ticks (seed {LOG.seed}) in {ELAPSED:.3f} s, "
+          f"{TICKS / ELAPSED / FPS:.0f}x real time: score {GAME.score}")
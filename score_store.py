@@ -0,0 +1,223 @@
+"""
+Keep a record of every game played in an SQLite database, written on a
+background thread so saving a score never holds up the game.
+"""
+from collections import namedtuple
+from datetime import datetime, timezone
+import queue
+import sqlite3
+import threading
+
+# Number of runs kept in memory and shown on the leaderboard.
+LEADERBOARD_SIZE = 5
+
+# A finished game: its score, the seed it was played with (None for a score
+# imported from the old high score file), how long it lasted in seconds and
+# when it ended, as an ISO 8601 string in UTC.
+Run = namedtuple("Run", ["score", "seed", "duration", "date"])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    seed INTEGER,
+    duration REAL NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC);
+"""
+
+
+def connect(filename):
+    """
+    Open the score database, creating it if needed.
+
+    The database uses write-ahead logging, so a crash in the middle of a
+    write leaves the last committed runs intact, and reading never waits for
+    writing.
+
+    Args:
+        filename: A string containing the path of the database, or
+            ":memory:" for one that is not saved.
+
+    Returns:
+        An sqlite3 Connection.
+    """
+    connection = sqlite3.connect(filename, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def read_highscore(filename):
+    """
+    Read a score from the old high score file.
+
+    Args:
+        filename: A string containing the path of the file.
+
+    Returns:
+        An integer containing the score, or 0 if the file is missing, empty
+        or not a number.
+    """
+    try:
+        with open(filename) as file:
+            return int(file.read())
+    except (OSError, ValueError):
+        return 0
+
+
+def now():
+    """
+    Get the current time for a run.
+
+    Returns:
+        A string containing the current UTC time in ISO 8601 format.
+    """
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class ScoreStore:
+    """
+    The runs saved in a score database, with the best ones kept in memory.
+
+    Runs are recorded in memory straight away and put on a queue, which a
+    writer thread saves to the database, committing each run on its own.
+
+    Attributes:
+        connection: An sqlite3 Connection to the database.
+        best: A list of the LEADERBOARD_SIZE best Runs, best first.
+        writes: A Queue of Runs waiting to be saved, or None if runs are
+            saved as they are recorded.
+        writer: The writer Thread, or None.
+    """
+
+    def __init__(self, filename=":memory:", legacy_file=None, threaded=True):
+        """
+        Open a score database and read its best runs.
+
+        Args:
+            filename: An optional string containing the path of the
+                database. By default the runs are only kept in memory.
+            legacy_file: An optional string containing the path of an old
+                high score file, whose score is imported into a new database.
+            threaded: An optional boolean that is True to save runs on a
+                writer thread.
+        """
+        self.connection = connect(filename)
+        if legacy_file is not None and self.count() == 0:
+            score = read_highscore(legacy_file)
+            if score:
+                self.save(Run(score, None, 0.0, now()))
+        self.best = [Run(*row) for row in self.connection.execute(
+            "SELECT score, seed, duration, date FROM runs "
+            "ORDER BY score DESC, id LIMIT ?", (LEADERBOARD_SIZE,))]
+        self.writes = None
+        self.writer = None
+        if threaded:
+            self.writes = queue.Queue()
+            self.writer = threading.Thread(target=self.work, daemon=True)
+            self.writer.start()
+
+    @property
+    def highscore(self):
+        """
+        Get the best score saved.
+
+        Returns:
+            An integer containing the score, or 0 if no runs are saved.
+        """
+        return self.best[0].score if self.best else 0
+
+    def leaderboard(self, count=LEADERBOARD_SIZE):
+        """
+        Get the best runs saved.
+
+        Args:
+            count: An optional integer containing the most runs to return, up
+                to LEADERBOARD_SIZE.
+
+        Returns:
+            A list of Runs, best first.
+        """
+        return self.best[:count]
+
+    def record(self, score, seed, duration):
+        """
+        Record a finished game, without waiting for it to be saved.
+
+        Args:
+            score: An integer containing the score of the game.
+            seed: An integer containing the seed of the game.
+            duration: A float containing how long the game lasted in seconds.
+
+        Returns:
+            The Run recorded.
+        """
+        run = Run(score, seed, duration, now())
+
+        # Runs with the same score are ranked oldest first.
+        rank = sum(1 for best in self.best if best.score >= score)
+        self.best.insert(rank, run)
+        del self.best[LEADERBOARD_SIZE:]
+
+        if self.writes is None:
+            self.save(run)
+        else:
+            self.writes.put(run)
+        return run
+
+    def save(self, run):
+        """
+        Save a run to the database in its own transaction.
+
+        Args:
+            run: The Run to save.
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO runs (score, seed, duration, date) "
+                "VALUES (?, ?, ?, ?)", run)
+
+    def work(self):
+        """
+        Save runs from the queue until None is taken from it.
+        """
+        while True:
+            run = self.writes.get()
+            try:
+                if run is None:
+                    return
+                self.save(run)
+            finally:
+                self.writes.task_done()
+
+    def count(self):
+        """
+        Count the runs saved.
+
+        Returns:
+            An integer containing the number of runs in the database.
+        """
+        [(count,)] = self.connection.execute("SELECT COUNT(*) FROM runs")
+        return count
+
+    def flush(self):
+        """
+        Wait until every run recorded has been saved.
+        """
+        if self.writes is not None:
+            self.writes.join()
+
+    def close(self):
+        """
+        Save the runs left on the queue, stop the writer thread and close the
+        database.
+        """
+        if self.writer is not None:
+            self.writes.put(None)
+            self.writer.join()
+            self.writer = None
+        self.connection.close()
+
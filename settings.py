@@ -6,10 +6,36 @@ the code without having to look through the code to where they were defined.
 TITLE = "PlatFrogs"
 WIDTH = 480
 HEIGHT = 600
+# Simulation ticks per second.
 FPS = 60
+# Most frames drawn per second (0 for no limit). Sprite positions are
+# interpolated between ticks, so this can be higher than FPS.
+RENDER_FPS = 144
+# Run the simulation on a thread of its own, so slow frames never delay a
+# tick. The profiler is only used when this is off.
+THREADED = False
+# Longest time in milliseconds the start and game over screens sleep while
+# waiting for a key.
+MENU_TIMEOUT = 1000
+# Times per second the start and game over screens check for events with a
+# video driver that has to be polled (see game_model.POLL_DRIVERS).
+MENU_POLL_FPS = 20
+# Repaint only the regions of the screen that change each frame.
+DIRTY_RECTS = False
+# Time each part of the game loop, optionally showing the times on screen,
+# and save them to PROFILE_FILE (.csv or .json) when the game is closed.
+PROFILE = False
+PROFILE_OVERLAY = True
+PROFILE_FILE = "profile.csv"
 FONT_NAME = "arial"
+# Database of every game played, and the old high score file it replaces
+# (its score is imported into a new database).
+SCORE_FILE = "scores.db"
 HS_FILE = "highscore.txt"
+# Input of the last game played, which replay.py can play back.
+REPLAY_FILE = "lastgame.pflog"
 SPRITESHEET = "spritesheet.png"
+SPRITESHEET_XML = "spritesheet.xml"
 
 # Player movement properties.
 PLAYER_ACC = 0.7
@@ -0,0 +1,187 @@
+"""
+Pack the complete state of a game into a small binary blob and unpack it
+again, for rolling back, saving and resuming, or searching ahead.
+"""
+import math
+import struct
+from animation_model import ANIMATIONS
+from input_model import InputSnapshot
+from level_model import LevelGenerator, LevelPlatform
+
+# Animation states and facings, numbered in the order they first appear in
+# ANIMATIONS.
+STATES = tuple(dict.fromkeys(state for state, _ in ANIMATIONS))
+FACINGS = tuple(dict.fromkeys(facing for _, facing in ANIMATIONS))
+
+# The fixed part of a snapshot: a magic string and format version; the
+# game's seed, score, ticks, jumps, whether it is being played and the bottom
+# of its level; the camera's position now and at the start of the tick; the
+# level generator's seed, chunks given out and top platform (height, x and
+# kind); the player's position, velocity, acceleration, rect position and
+# position at the start of the tick, whether it is jumping, walking and
+# alive, the index of its ground platform (-1 for none), its input bits and
+# its animation state, facing, ticks and frame index; and the number of
+# platforms and upcoming platforms that follow.
+STATE = struct.Struct("<4sB QIII?i dd IIiiB dddddd iiii ???hBBBIB HH")
+MAGIC = b"PFSS"
+VERSION = 2
+
+# Each platform in the game, in the order it was added: its rect position,
+# kind and position at the start of the tick.
+PLATFORM = struct.Struct("<iiBii")
+
+# Each upcoming platform of the level: its height, x coordinate and kind.
+UPCOMING = struct.Struct("<iiB")
+
+# The state of the game's random number generator: the Mersenne Twister's
+# 624 words and position, and the saved Gaussian value (NaN for none).
+RNG = struct.Struct("<625Id")
+
+
+def snapshot(game):
+    """
+    Pack the state of a game.
+
+    Everything that decides how the game carries on is included, so
+    restoring it and playing the same input gives the same game. Which
+    seeds later games are given, what the view shows and the pool of spare
+    platforms are not part of the game, so they are left out.
+
+    Args:
+        game: An instance of a GameModel class with a game started.
+
+    Returns:
+        A bytes object containing the snapshot.
+    """
+    player = game.player
+    platforms = list(game.platforms.serials)
+    ground = platforms.index(player.ground) \
+        if player.ground in game.platforms.serials else -1
+    level = game.level
+    animation = player.animation
+    parts = [STATE.pack(
+        MAGIC, VERSION,
+        game.game_seed, game.score, game.ticks, game.jumps, game.playing,
+        game.level_bottom, game.camera.y, game.camera.previous_y,
+        level.seed, level.handed, *level.top,
+        *player.pos, *player.vel, *player.acc, *player.rect.topleft,
+        *player.previous_topleft, player.jumping, player.walking,
+        player.alive(), ground, player.inputs.bits,
+        STATES.index(animation.state), FACINGS.index(animation.facing),
+        animation.ticks, animation.index,
+        len(platforms), len(game.upcoming))]
+    for plat in platforms:
+        parts.append(PLATFORM.pack(*plat.rect.topleft, plat.kind,
+                                   *plat.previous_topleft))
+    for plat in game.upcoming:
+        parts.append(UPCOMING.pack(*plat))
+    _, words, gauss = game.rng.getstate()
+    parts.append(RNG.pack(*words, float("nan") if gauss is None else gauss))
+    return b"".join(parts)
+
+
+def restore(game, data):
+    """
+    Put a game back in the state packed by snapshot.
+
+    The game's input log is cut back to the restored tick if it is recording
+    the same game, and dropped otherwise, as the input before the snapshot
+    is not part of it.
+
+    Args:
+        game: An instance of a GameModel class.
+        data: A bytes object made by snapshot.
+
+    Raises:
+        ValueError: If the data is not a snapshot.
+    """
+    try:
+        (magic, version, game_seed, score, ticks, jumps, playing,
+         level_bottom, camera_y, camera_previous_y, level_seed, handed,
+         top_height, top_x, top_kind, pos_x, pos_y, vel_x, vel_y, acc_x,
+         acc_y, rect_x, rect_y, previous_x, previous_y, jumping, walking,
+         alive, ground, bits, state, facing, animation_ticks,
+         animation_index, platform_count, upcoming_count) = STATE.unpack_from(data)
+    except struct.error as error:
+        raise ValueError("not a game snapshot") from error
+    size = STATE.size + platform_count * PLATFORM.size \
+        + upcoming_count * UPCOMING.size + RNG.size
+    if magic != MAGIC or version != VERSION or len(data) != size:
+        raise ValueError("not a game snapshot")
+
+    # Restore the game and its camera.
+    same_game = game.game_seed == game_seed
+    game.game_seed = game_seed
+    game.score = score
+    game.ticks = ticks
+    game.jumps = jumps
+    game.playing = playing
+    game.level_bottom = level_bottom
+    game.camera.y = camera_y
+    game.camera.previous_y = camera_previous_y
+    log = game.input_log
+    if log is not None:
+        if same_game and len(log) >= ticks:
+            del log.inputs[ticks:]
+        else:
+            game.input_log = None
+
+    # Carry on generating the level from the chunks given out.
+    if game.level is None or game.level.seed != level_seed or \
+            game.level.handed != handed or game.level.chunks is not None:
+        if game.level is not None:
+            game.level.close()
+        game.level = LevelGenerator(
+            level_seed, LevelPlatform(top_height, top_x, top_kind),
+            threaded=not game.headless, index=handed)
+
+    # Put back the platforms, in the order they were added. The platforms
+    # already in the game are moved into place, and only the difference is
+    # taken from or given back to the pool.
+    offset = STATE.size
+    platforms = list(game.platforms.serials)
+    for plat in platforms[platform_count:]:
+        game.pool.release(plat)
+    del platforms[platform_count:]
+    for index in range(platform_count):
+        (plat_x, plat_y, kind, plat_previous_x,
+         plat_previous_y) = PLATFORM.unpack_from(data, offset)
+        offset += PLATFORM.size
+        if index < len(platforms):
+            plat = platforms[index]
+            plat.reset(plat_x, plat_y, kind=kind)
+        else:
+            plat = game.pool.acquire(plat_x, plat_y, kind=kind)
+            game.platforms.add(plat)
+            platforms.append(plat)
+        plat.previous_topleft = (plat_previous_x, plat_previous_y)
+    game.platforms.reindex()
+    game.upcoming.clear()
+    for _ in range(upcoming_count):
+        game.upcoming.append(LevelPlatform(*UPCOMING.unpack_from(data,
+                                                                 offset)))
+        offset += UPCOMING.size
+
+    # Restore the player.
+    player = game.player
+    player.pos.update(pos_x, pos_y)
+    player.vel.update(vel_x, vel_y)
+    player.acc.update(acc_x, acc_y)
+    player.rect.topleft = (rect_x, rect_y)
+    player.previous_topleft = (previous_x, previous_y)
+    player.jumping = jumping
+    player.walking = walking
+    player.ground = platforms[ground] if ground >= 0 else None
+    player.inputs = InputSnapshot(bits)
+    animation = player.animation
+    animation.state = STATES[state]
+    animation.facing = FACINGS[facing]
+    animation.key = (animation.state, animation.facing)
+    animation.ticks = animation_ticks
+    animation.index = animation_index
+    player.dead = not alive
+
+    # Restore the random number generator.
+    *words, gauss = RNG.unpack_from(data, offset)
+    game.rng.setstate((3, tuple(words),
+                       None if math.isnan(gauss) else gauss))
@@ -0,0 +1,82 @@
+"""
+Draw the plain player and platforms of the game model as pygame sprites.
+"""
+import pygame as pg
+
+
+class EntitySprite(pg.sprite.Sprite):
+    """
+    A pygame Sprite showing an entity of the game model.
+
+    The sprite holds no position of its own. Its rect and previous_topleft
+    are the entity's, so it is always drawn where the simulation put it.
+
+    Attributes:
+        entity: The Player or Platform shown by the sprite.
+        game_view: An instance of a GameView class with the sprite's images.
+    """
+
+    def __init__(self, entity, game_view):
+        """
+        Make a sprite for an entity.
+
+        Args:
+            entity: A Player or Platform to show.
+            game_view: An instance of a GameView class.
+        """
+        pg.sprite.Sprite.__init__(self)
+        self.entity = entity
+        self.game_view = game_view
+
+    @property
+    def rect(self):
+        """
+        Get the entity's rectangle.
+
+        Returns:
+            A pygame Rect containing the entity's position in the world.
+        """
+        return self.entity.rect
+
+    @property
+    def previous_topleft(self):
+        """
+        Get the entity's position at the start of the last tick.
+
+        Returns:
+            A tuple containing the x and y coordinates.
+        """
+        return self.entity.previous_topleft
+
+
+class PlayerSprite(EntitySprite):
+    """
+    A sprite showing the frame the player's animation is on.
+    """
+
+    @property
+    def image(self):
+        """
+        Get the player's current frame.
+
+        Returns:
+            A pygame Surface from the view's player_frames.
+        """
+        animation = self.entity.animation
+        return self.game_view.player_frames[animation.key][animation.index]
+
+
+class PlatformSprite(EntitySprite):
+    """
+    A sprite showing a platform's kind of lillypad.
+    """
+
+    @property
+    def image(self):
+        """
+        Get the image of the platform's kind.
+
+        Returns:
+            A pygame Surface from the view's platform_images.
+        """
+        return self.game_view.platform_images[self.entity.kind]
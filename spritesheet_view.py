@@ -1,6 +1,7 @@
 """
 Load spritesheet for the game and enable extraction of the desired sprites.
 """
+from collections import OrderedDict
 import pygame as pg
 
 
@@ -8,16 +9,36 @@ class Spritesheet:
     """
     Utility class for loading and parsing spritesheets
 
+    Images are cached, so asking for the same image again returns the same
+    Surface. Once the cached images take up more than max_bytes, the least
+    recently used ones are dropped.
+
     Attributes:
         spritesheet: the spritesheet we will be using in our game
+        max_bytes: the most bytes of image data to keep cached
+        images: an ordered dictionary mapping the arguments of get_image to
+            the images cut out, least recently used first
+        bytes: the number of bytes of image data cached
+        misses: the number of images that were not cached, so had to be cut
+            out of the spritesheet
+        hits: the number of images returned from the cache
     """
-    def __init__(self, filename):
+    def __init__(self, filename, max_bytes=8 * 1024 * 1024):
         self.spritesheet = pg.image.load(filename).convert()
+        self.max_bytes = max_bytes
+        self.images = OrderedDict()
+        self.bytes = 0
+        self.misses = 0
+        self.hits = 0
 
-    def get_image(self, x_coord, y_coord, width, height, scale=1):
+    def get_image(self, x_coord, y_coord, width, height, scale=1, rotate=0,
+                  colorkey=None):
         """
         Grab an image out of a larger spreadsheet
 
+        The image is converted to the format of the display, so it is fast to
+        blit. It is shared with later calls and should not be modified.
+
         Args:
             x_coord: int, the x position of the smaller image
             y_coord: int, the y position of the smaller image
@@ -26,9 +47,47 @@ class Spritesheet:
             scale: an optional argument to scale the image. This should be set
             to an int and will be the scale factor by which the size of the
             image will be multiplied
+            rotate: an optional number of degrees to turn the image
+            anticlockwise by, after it is scaled
+            colorkey: an optional colour to make transparent
         """
+        key = (x_coord, y_coord, width, height, scale, rotate, colorkey)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return image
 
+        self.misses += 1
         image = pg.Surface((width, height))
         image.blit(self.spritesheet, (0,0), (x_coord,y_coord,width,height))
-        image = pg.transform.scale(image, (round(width * scale), round(height * scale)))
+        if scale != 1:
+            image = pg.transform.scale(image, (round(width * scale),
+                                               round(height * scale)))
+        if rotate:
+            image = pg.transform.rotate(image, rotate)
+        image = image.convert()
+        if colorkey is not None:
+            image.set_colorkey(colorkey)
+
+        # Cache the image, dropping the least recently used images if the
+        # cache is full.
+        self.images[key] = image
+        self.bytes += image_bytes(image)
+        while self.bytes > self.max_bytes and len(self.images) > 1:
+            _, dropped = self.images.popitem(last=False)
+            self.bytes -= image_bytes(dropped)
         return image
+
+
+def image_bytes(image):
+    """
+    Find how much memory the pixels of an image take up.
+
+    Args:
+        image: a pygame Surface
+
+    Returns:
+        An integer number of bytes.
+    """
+    return image.get_pitch() * image.get_height()
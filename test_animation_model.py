@@ -0,0 +1,75 @@
+"""
+Test choosing the player's animation frames with the Animation class.
+"""
+import pytest
+from animation_model import Animation, ANIMATIONS, FRAME_TICKS
+from atlas_view import read_frames
+from game_model import GameModel
+
+step_cases = [
+    # Check that a jump to the right shows the right jump frame.
+    ([(True, 2)], ("jump", "right"), "jumpright.png"),
+    # Check that the player keeps facing right once it stops.
+    ([(False, 2), (False, 0)], ("idle", "right"), "lookright.png"),
+    # Check that walking shows its first frame for FRAME_TICKS ticks.
+    ([(False, -2)] * FRAME_TICKS, ("walk", "left"), "lookleft.png"),
+    # Check that walking then moves on to its second frame.
+    ([(False, -2)] * (FRAME_TICKS + 1), ("walk", "left"), "prepleft.png"),
+    # Check that walking loops back to its first frame.
+    ([(False, 2)] * (2 * FRAME_TICKS + 1), ("walk", "right"),
+     "prepright.png"),
+    # Check that landing from a jump starts the walking frames again.
+    ([(False, 2)] * (FRAME_TICKS + 1) + [(True, 2), (False, 2)],
+     ("walk", "right"), "prepright.png"),
+    # Check that moving too slowly does not count as walking.
+    ([(False, 0.4)], ("idle", "right"), "lookright.png"),
+]
+
+# Test if the animation picks its state and frame from the ticks stepped.
+@pytest.mark.parametrize("steps,key,frame", step_cases)
+def test_step(steps, key, frame):
+    """
+    Check the frame shown after stepping an animation for some ticks.
+
+    Args:
+        steps: A list of tuples, each containing whether the player is
+            jumping and its horizontal velocity on one tick.
+        key: A tuple containing the state and facing expected.
+        frame: A string containing the name of the frame expected.
+    """
+    animation = Animation()
+    for jumping, vel_x in steps:
+        animation.step(jumping, vel_x)
+    assert animation.key == key
+    assert animation.frame == frame
+
+
+def test_frames_in_atlas():
+    """
+    Check that every frame of every animation is in the spritesheet.
+    """
+    frames = read_frames()
+    for names in ANIMATIONS.values():
+        assert names and all(name in frames for name in names)
+
+
+def test_headless_matches_view():
+    """
+    Check that a headless game animates its player exactly like a game with
+    a view, as animation only depends on the ticks simulated.
+    """
+    games = [GameModel(headless=True, seed=3), GameModel(seed=3)]
+    frames = []
+    for game in games:
+        game.new()
+        game.player.vel.x = 3
+        game_frames = []
+        for _ in range(30):
+            game.update()
+            game_frames.append(game.player.animation.frame)
+        frames.append(game_frames)
+    assert frames[0] == frames[1]
+    assert len(set(frames[0])) > 1
+    view = games[1].view
+    assert view.sprites()[-1].image is \
+        view.atlas[games[1].player.animation.frame]
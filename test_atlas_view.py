@@ -0,0 +1,67 @@
+"""
+Test the Atlas class and frame lookups in the atlas_view file.
+"""
+import pytest
+import pygame as pg
+from atlas_view import frame_size, load_atlas, read_frames
+from game_model import GameModel
+from game_view import GameView
+from settings import WIDTH, HEIGHT
+
+# Define game display.
+screen = pg.display.set_mode((WIDTH, HEIGHT))
+
+test_atlas = load_atlas()
+
+frame_cases = [
+    # Check the walking frames.
+    ("lookleft.png", (64, 50)),
+    ("prepleft.png", (66, 50)),
+    ("prepright.png", (66, 50)),
+    ("lookright.png", (64, 50)),
+    # Check the jump frames (rotated and scaled).
+    ("jumpleft.png", (108, 96)),
+    ("jumpright.png", (108, 96)),
+    # Check the start and game over screen titles.
+    ("title.png", (418, 158)),
+    ("gameover.png", (410, 96)),
+    # Check the small and large (scaled) platforms.
+    ("smallplatform.png", (136, 40)),
+    ("largeplatform.png", (254, 54)),
+]
+
+# Test if every frame has the correct size.
+@pytest.mark.parametrize("name,dimensions", frame_cases)
+def test_frames(name, dimensions):
+    """
+    Check that each frame is extracted with the expected size, and that the
+    size found from the XML alone matches it.
+
+    Args:
+        name: A string containing the name of the frame.
+        dimensions: A tuple containing integers representing the expected width
+        and height of the frame in pixels.
+    """
+    assert test_atlas[name].get_size() == dimensions
+    assert frame_size(name) == dimensions
+
+
+def test_all_frames_read():
+    """
+    Check that every frame in the XML file is in the atlas.
+    """
+    assert set(test_atlas.frames) == set(read_frames())
+
+
+def test_shared_frames():
+    """
+    Check that the atlas is only loaded once and its frames are shared by
+    every game view.
+    """
+    test_model = GameModel()
+    first_view = GameView(test_model)
+    second_view = GameView(test_model)
+    assert load_atlas() is test_atlas
+    assert first_view.player_frames == second_view.player_frames
+    assert first_view.player_frames[("walk", "left")][0] is \
+        test_atlas["lookleft.png"]
@@ -0,0 +1,88 @@
+"""
+Test playing sounds and music with the AudioManager class.
+"""
+import pytest
+import pygame as pg
+from audio_view import AudioManager, MUSIC, SOUNDS, load_audio
+from game_model import GameModel
+from game_view import GameView
+
+audio = load_audio()
+
+disabled_cases = [
+    # Check that sound effects are not played.
+    ("play", "jump"),
+    # Check that music is not played.
+    ("play_music", "game"),
+    # Check that stopping music does nothing.
+    ("stop_music",),
+]
+
+# Test if a disabled audio manager does nothing.
+@pytest.mark.parametrize("call", disabled_cases)
+def test_disabled(call):
+    """
+    Check that an audio manager with audio turned off loads nothing and
+    ignores every call.
+
+    Args:
+        call: A tuple containing the name of a method and its arguments.
+    """
+    silent = AudioManager(enabled=False)
+    getattr(silent, call[0])(*call[1:])
+    assert silent.sounds == {} and silent.music == {}
+    assert silent.track is None
+
+
+def test_loaded_once():
+    """
+    Check that every view shares one audio manager, with every sound and
+    track loaded.
+    """
+    test_view = GameView(GameModel())
+    assert test_view.audio is audio
+    assert GameView(GameModel()).audio is audio
+    assert audio.enabled
+    assert set(audio.sounds) == set(SOUNDS)
+    assert audio.loaded.wait(10)
+    assert set(audio.music) == set(MUSIC)
+
+
+def test_reserved_channels():
+    """
+    Check that sound effects play on their own reserved channels, which
+    other sounds are never given.
+    """
+    audio.play("jump")
+    assert audio.channels["jump"].get_sound() is audio.sounds["jump"]
+    reserved = set(audio.channels.values()) | set(audio.music_channels)
+    assert pg.mixer.find_channel(True) not in reserved
+
+
+def test_crossfade():
+    """
+    Check that a new track fades in on the other music channel while the old
+    one fades out, and that asking for the same track again changes nothing.
+    """
+    audio.loaded.wait()
+    audio.play_music("menu")
+    audio.play_music("game")
+    new, old = audio.music_channels
+    assert audio.track == "game"
+    assert new.get_sound() is audio.music["game"]
+    audio.play_music("game")
+    assert audio.music_channels == [new, old]
+    audio.stop_music()
+    assert audio.track is None
+
+
+def test_track_starts_when_decoded():
+    """
+    Check that a track asked for before it is decoded starts playing once it
+    is.
+    """
+    early = AudioManager()
+    early.play_music("game")
+    assert early.loaded.wait(10)
+    assert early.music_channels[0].get_sound() is early.music["game"]
+    early.stop_music(0)
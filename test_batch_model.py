@@ -0,0 +1,198 @@
+"""
+Test that the BatchGameModel class in the batch_model file steps games exactly
+like the scalar GameModel on the same platforms, until the two generate
+different levels.
+"""
+import random
+import pytest
+from game_model import GameModel
+from input_log import LEFT, RIGHT, JUMP, JUMP_CUT
+from input_model import InputSnapshot
+
+np = pytest.importorskip("numpy")
+# pylint: disable=wrong-import-position
+import batch_model
+from batch_model import BatchGameModel, round_rect
+from settings import HEIGHT
+
+GAMES = 16
+FRAMES = 300
+
+
+rounding_cases = [
+    # Check that halves are rounded away from zero like a pygame Rect.
+    (10.5, 11),
+    (-10.5, -11),
+    (2.5, 3),
+    (-0.5, -1),
+    # Check that other values are rounded to the nearest integer.
+    (2.4999, 2),
+    (-7.6, -8),
+]
+
+# Test if positions are rounded like a pygame Rect.
+@pytest.mark.parametrize("value,rounded", rounding_cases)
+def test_round_rect(value, rounded):
+    """
+    Check that positions are rounded the same way as by a pygame Rect.
+
+    Args:
+        value: A float containing the position to round.
+        rounded: An integer containing the expected rounded position.
+    """
+    assert round_rect(np.array([value]))[0] == rounded
+
+
+def platforms(game_model):
+    """
+    Get the rectangles of a scalar game's platforms.
+
+    Args:
+        game_model: An instance of a GameModel class.
+
+    Returns:
+        A sorted list of (x, y, width, height) tuples.
+    """
+    return sorted(tuple(plat.rect) for plat in game_model.platforms)
+
+
+def batch_platforms(batch, index):
+    """
+    Get the rectangles of one game's platforms in a batch.
+
+    Args:
+        batch: An instance of a BatchGameModel class.
+        index: An integer containing the index of the game.
+
+    Returns:
+        A sorted list of (x, y, width, height) tuples.
+    """
+    active = batch.plat_active[:, index]
+    return sorted(zip(batch.plat_x[active, index].tolist(),
+                      batch.plat_y[active, index].tolist(),
+                      batch.plat_w[active, index].tolist(),
+                      batch.plat_h[active, index].tolist()))
+
+
+def check_parity(start_high):
+    """
+    Step scalar games and a batch loaded with the same states through the
+    same random input, checking they stay identical until a game spawns a
+    platform (spawning uses different random numbers).
+
+    Args:
+        start_high: A boolean that is True to start the players high up and
+            moving up fast, so the screen scrolls.
+
+    Returns:
+        An integer containing the number of game ticks compared.
+    """
+    rng = random.Random(1)
+    models = []
+    batch = BatchGameModel(GAMES, seed=1)
+    for index in range(GAMES):
+        game_model = GameModel(headless=True, seed=index)
+        game_model.new()
+        game_model.update()
+        if start_high:
+            game_model.player.pos.y = rng.randrange(150, 300)
+            game_model.player.vel.y = -rng.randrange(5, 20)
+        batch.load(index, game_model)
+        models.append(game_model)
+
+    compared = 0
+    matching = np.ones(GAMES, dtype=bool)
+    for _ in range(FRAMES):
+        left = np.array([rng.random() < 0.4 for _ in range(GAMES)])
+        right = np.array([rng.random() < 0.4 for _ in range(GAMES)])
+        jump = np.array([rng.random() < 0.2 for _ in range(GAMES)])
+        jump_cut = np.array([rng.random() < 0.1 for _ in range(GAMES)])
+        batch.step(left, right, jump, jump_cut)
+        for index, game_model in enumerate(models):
+            if not matching[index] or not game_model.playing:
+                continue
+            player = game_model.player
+            inputs = InputSnapshot(LEFT * left[index] | RIGHT * right[index]
+                                   | JUMP * jump[index]
+                                   | JUMP_CUT * jump_cut[index])
+            spawned = game_model.pool.created + game_model.pool.reused
+            game_model.update(inputs)
+
+            assert (batch.pos_x[index], batch.pos_y[index]) == \
+                tuple(player.pos)
+            assert (batch.vel_x[index], batch.vel_y[index]) == \
+                tuple(player.vel)
+            assert (batch.rect_x[index], batch.rect_y[index]) == \
+                player.rect.topleft
+            assert batch.camera[index] == game_model.camera.y
+            assert batch.jumping[index] == player.jumping
+            assert batch.score[index] == game_model.score
+            assert batch.playing[index] == game_model.playing
+            if game_model.pool.created + game_model.pool.reused != spawned:
+                matching[index] = False
+                continue
+            assert batch_platforms(batch, index) == platforms(game_model)
+            compared += 1
+    return compared
+
+
+def test_parity_walking():
+    """
+    Check that players walking and jumping on the starting platforms move
+    exactly like in the scalar game.
+    """
+    assert check_parity(False) > GAMES * FRAMES / 2
+
+
+def test_parity_scrolling():
+    """
+    Check that scrolling and scoring match the scalar game exactly.
+    """
+    assert check_parity(True) > GAMES * 10
+
+
+def test_games_end():
+    """
+    Check that games where the player walks off the starting platform end,
+    and can be restarted.
+    """
+    batch = BatchGameModel(GAMES, seed=0)
+    no_keys = np.zeros(GAMES, dtype=bool)
+    for _ in range(2000):
+        batch.step(no_keys, ~no_keys)
+    assert not batch.playing.any()
+    batch.new(~batch.playing)
+    assert batch.playing.all()
+    assert (batch.plat_active.sum(axis=0) == 5).all()
+
+
+def test_closest_platforms_fit(monkeypatch):
+    """
+    Check that levels where every platform is as close as possible to the
+    one below never hold more platforms than there are slots.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch used to make every rise the
+            smallest.
+    """
+    monkeypatch.setattr(batch_model, "MAX_RISE", batch_model.MIN_RISE)
+    rng = np.random.default_rng(1)
+    batch = BatchGameModel(200, seed=1)
+    for _ in range(1000):
+        if not batch.playing.all():
+            batch.new(~batch.playing)
+        batch.step(rng.random(200) < 0.3, rng.random(200) < 0.5,
+                   rng.random(200) < 0.5, rng.random(200) < 0.05)
+    assert batch.next_height.max() > 2 * HEIGHT
+
+
+def test_full_slots():
+    """
+    Check that spawning a platform in a game with no free slot raises an
+    error instead of overwriting a platform.
+    """
+    batch = BatchGameModel(2, seed=0)
+    batch.plat_active[:] = True
+    batch.next_height[:] = batch.level_bottom - batch.camera
+    with pytest.raises(RuntimeError):
+        batch.update(np.zeros(2, dtype=bool), np.zeros(2, dtype=bool))
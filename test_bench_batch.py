@@ -0,0 +1,46 @@
+"""
+Test that bench_batch fails when the batch engine gets far slower.
+"""
+import pytest
+
+pytest.importorskip("numpy")
+# pylint: disable=wrong-import-position
+import bench_batch
+
+speedup_cases = [
+    # Check that a batch engine over the target passes.
+    (1000, 150000, 0),
+    # Check that a batch engine just under the target, as noise can make
+    # it, still passes.
+    (1000, 99000, 0),
+    # Check that a batch engine exactly at the least speedup passes.
+    (1000, 50000, 0),
+    # Check that a batch engine under the least speedup fails.
+    (1000, 49000, 1),
+]
+
+# Test if the exit status reports a gross regression only.
+@pytest.mark.parametrize("scalar,batch,status", speedup_cases)
+def test_regression_status(monkeypatch, scalar, batch, status):
+    """
+    Check the exit status for engines timed at given speeds.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch used to replace the timings.
+        scalar: A float containing the ticks per second of the loop.
+        batch: A float containing the ticks per second of the batch engine.
+        status: An integer containing the expected exit status.
+    """
+    monkeypatch.setattr(bench_batch, "bench_scalar",
+                        lambda games, frames: scalar)
+    monkeypatch.setattr(bench_batch, "bench_batch",
+                        lambda games, frames: batch)
+    assert bench_batch.main([]) == status
+
+
+def test_engines_run():
+    """
+    Check that both engines can be timed.
+    """
+    assert bench_batch.bench_scalar(2, 5) > 0
+    assert bench_batch.bench_batch(2, 5) > 0
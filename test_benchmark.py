@@ -0,0 +1,77 @@
+"""
+Test the benchmark suite and how it compares results with a baseline.
+"""
+import json
+import pytest
+from benchmark import BENCHMARKS, compare, entity_memory, main
+
+compare_cases = [
+    # Check that a benchmark that got faster is not a regression.
+    ({"update_steady": 8.0}, {"update_steady": 10.0}, -0.2, False),
+    # Check that a benchmark within its threshold is not a regression.
+    ({"update_steady": 11.0}, {"update_steady": 10.0}, 0.1, False),
+    # Check that a benchmark past its threshold is a regression.
+    ({"update_steady": 20.0}, {"update_steady": 10.0}, 1.0, True),
+    # Check that a benchmark missing from the baseline is not compared.
+    ({"update_steady": 20.0}, {}, None, False),
+]
+
+# Test if every benchmark runs.
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark_runs(name):
+    """
+    Check that a benchmark can be set up and timed.
+
+    Args:
+        name: A string containing the name of the benchmark.
+    """
+    assert BENCHMARKS[name].run(repeat=1, scale=0.01) > 0
+
+# Test if results are compared with the baseline correctly.
+@pytest.mark.parametrize("results,baseline,change,regression", compare_cases)
+def test_compare(results, baseline, change, regression):
+    """
+    Check the change from the baseline and whether it is a regression.
+
+    Args:
+        results: A dictionary mapping benchmark names to times.
+        baseline: A dictionary mapping benchmark names to times.
+        change: The expected fractional change, or None.
+        regression: A boolean that is True if a regression is expected.
+    """
+    [(_, _, _, actual_change, actual_regression)] = compare(results, baseline)
+    assert actual_change == pytest.approx(change)
+    assert actual_regression == regression
+
+
+def test_save_and_compare(tmp_path):
+    """
+    Check that results are saved as a baseline, and that an impossibly fast
+    baseline makes the command fail.
+
+    Args:
+        tmp_path: A pathlib Path of a temporary directory.
+    """
+    baseline = str(tmp_path / "baseline.json")
+    assert main(["player_update", "--repeat", "1", "--save",
+                 "--baseline", baseline]) == 0
+    with open(baseline) as file:
+        saved = json.load(file)
+    assert list(saved["results"]) == ["player_update"]
+
+    saved["results"]["player_update"] = 1e-6
+    with open(baseline, "w") as file:
+        json.dump(saved, file)
+    assert main(["player_update", "--repeat", "1",
+                 "--baseline", baseline]) == 1
+
+
+def test_entity_memory():
+    """
+    Check that the memory of each entity is measured, and that platforms,
+    which the game keeps many of, stay small.
+    """
+    sizes = entity_memory(count=100)
+    assert set(sizes) == {"Player", "Platform"}
+    assert 0 < sizes["Platform"] < 400
+    assert 0 < sizes["Player"]
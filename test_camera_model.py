@@ -0,0 +1,73 @@
+"""
+Test moving the camera over the game world with the Camera class.
+"""
+import pytest
+from camera_model import Camera
+from game_model import GameModel
+from game_view import GameView
+from settings import WIDTH, HEIGHT
+
+top_cases = [
+    # Check that the latest position is used at the end of a tick.
+    (1, -20),
+    # Check that the previous position is used at the start of a tick.
+    (0, 0),
+    # Check that the position is interpolated in between.
+    (0.25, -5),
+]
+
+# Test if the camera is interpolated between ticks.
+@pytest.mark.parametrize("alpha,expected", top_cases)
+def test_top(alpha, expected):
+    """
+    Check where the top of the screen is drawn between two ticks.
+
+    Args:
+        alpha: A float containing how far the frame is between the ticks.
+        expected: An integer containing the y coordinate expected.
+    """
+    camera = Camera()
+    camera.begin_tick()
+    camera.move(-20)
+    assert camera.top(alpha) == expected
+    assert camera.bounds(alpha).size == (WIDTH, HEIGHT)
+
+
+def test_scrolling_moves_camera():
+    """
+    Check that scrolling moves only the camera, leaving the platforms where
+    they are in the world.
+    """
+    test_model = GameModel(headless=True, seed=0)
+    test_model.new()
+    positions = {plat: plat.rect.topleft for plat in test_model.platforms}
+    test_model.player.pos.y = HEIGHT / 4
+    test_model.update()
+    assert test_model.camera.y < 0
+    for plat in test_model.platforms:
+        assert plat.rect.topleft == positions.get(plat, plat.rect.topleft)
+
+
+def test_draw_culls():
+    """
+    Check that only sprites the camera can see are drawn, moved onto the
+    screen.
+    """
+    test_model = GameModel(seed=0)
+    test_view = GameView(test_model, dirty_rects=True)
+    test_model.new()
+    test_model.update()
+    test_model.camera.move(-300)
+    test_model.camera.begin_tick()
+    test_view.draw()
+    sprites = test_view.sprites()
+    drawn = {sprite: test_view.renderer.drawn[sprite][1]
+             for sprite in sprites
+             if sprite in test_view.renderer.drawn}
+    bounds = test_model.camera.bounds()
+    for sprite in sprites:
+        if sprite.rect.colliderect(bounds):
+            assert drawn[sprite] == sprite.rect.move(0, 300)
+        else:
+            assert sprite not in drawn
+    assert len(drawn) < len(sprites)
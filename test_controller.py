@@ -1,21 +1,28 @@
 """
-Test the PlayerController class to respond appropriately to key inputs.
+Test the KeyboardInput class to respond appropriately to key inputs.
 """
 import pytest
 import pygame as pg
 from game_model import GameModel
-from controller import PlayerController
+from controller import KeyboardInput
+from input_log import JUMP, JUMP_CUT, CUT_FIRST
 
 test_model = GameModel()
 test_model.new()
 test_model.playing = False
-test_player_controller = PlayerController(test_model)
+test_input = KeyboardInput()
 
 jumping_cases = [
     # Check if keydown on the spacebar results in a jump.
-    (pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE), 1),
+    ([pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE)], JUMP),
     # Check if keyup on the spacebar results in a jump cut.
-    (pg.event.Event(pg.KEYUP, key=pg.K_SPACE), 2),
+    ([pg.event.Event(pg.KEYUP, key=pg.K_SPACE)], JUMP_CUT),
+    # Check if a release before a press is kept in that order.
+    ([pg.event.Event(pg.KEYUP, key=pg.K_SPACE),
+      pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE)],
+     JUMP | JUMP_CUT | CUT_FIRST),
+    # Check if other keys are ignored.
+    ([pg.event.Event(pg.KEYDOWN, key=pg.K_a)], 0),
 ]
 
 quit_case = [
@@ -23,43 +30,38 @@ quit_case = [
     (pg.event.Event(pg.QUIT), False)
 ]
 
-move_cases = [
-    # Check if keydown on the spacebar results in a jump.
-    ("left", 4),
-    # Check
-]
 # Test if jumping occurs correctly.
-
-
-@pytest.mark.parametrize("pygame_event, flag_value", jumping_cases)
-def test_jumping_cases(pygame_event, flag_value):
+@pytest.mark.parametrize("pygame_events, bits", jumping_cases)
+def test_jumping_cases(pygame_events, bits):
     """
-    Check if the key press to jump and jump cut results in the correct action.
+    Check if the key presses to jump and jump cut give the correct input.
 
-    If the spacebar is pressed down, call the jump method in the Player class,
-    and if the the spacebar is released, call the jump_cut method in the class.
+    If the spacebar is pressed down, the snapshot has a jump, and if the the
+    spacebar is released, it has a jump cut.
 
     Args:
-        pygame_event: A pygame event simulating the key press of the spacebar.
-        flag_value: An integer indicating which Player method has been called.
+        pygame_events: A list of pygame events simulating key presses of the
+            spacebar.
+        bits: An integer containing the input bits expected.
     """
-    # Simulate key press.
-    pg.event.post(pygame_event)  # add the event to the queue
+    # Simulate key presses.
+    for pygame_event in pygame_events:
+        pg.event.post(pygame_event)  # add the event to the queue
 
-    # Check if correct method is called.
-    test_player_controller.events()
-    assert test_player_controller.game.player.flag_unit_test == flag_value
+    # Check if the correct input is given.
+    inputs = test_input.poll()
+    assert inputs.bits == bits
+    assert not inputs.quit
 
 # Test if quitting occurs correctly.
-
-
 @pytest.mark.parametrize("pygame_event, is_running", quit_case)
 def test_quit_case(pygame_event, is_running):
     """
     Check if clicking the 'X' to quit the game results in the correct action.
 
-    If the button is pressed, call the quit_game method in the GameModel class.
-    This method sets running to False, which stops the game from running.
+    The input snapshot asks to quit, which makes the GameModel call its
+    quit_game method. This method sets running to False, which stops the game
+    from running.
 
     Args:
         pygame_event: A pygame event simulating the button click to quit.
@@ -69,5 +71,7 @@ def test_quit_case(pygame_event, is_running):
     pg.event.post(pygame_event)  # add the event to the queue
 
     # Check if game stops running.
-    test_player_controller.events()
-    assert test_player_controller.game.running == is_running
+    inputs = test_input.poll()
+    assert inputs.quit
+    test_model.update(inputs)
+    assert test_model.running == is_running
@@ -0,0 +1,104 @@
+"""
+Test the DirtyRenderer class in the dirty_view file.
+"""
+import random
+import pytest
+import pygame as pg
+from dirty_view import DirtyRenderer
+from game_model import GameModel
+from game_view import GameView
+from settings import WIDTH, HEIGHT, BGCOLOUR, BLACK
+
+# Define game display.
+screen = pg.display.set_mode((WIDTH, HEIGHT))
+
+image = pg.Surface((40, 30))
+image.fill((200, 40, 40))
+other_image = pg.Surface((40, 30))
+other_image.fill((40, 40, 200))
+
+dirty_cases = [
+    # Check that nothing is repainted if nothing changed.
+    ([("a", image, pg.Rect(10, 10, 40, 30))], []),
+    # Check that a moved item repaints its old and new position.
+    ([("a", image, pg.Rect(100, 100, 40, 30))],
+     [pg.Rect(10, 10, 40, 30), pg.Rect(100, 100, 40, 30)]),
+    # Check that an overlapping move repaints the union of both positions.
+    ([("a", image, pg.Rect(15, 10, 40, 30))], [pg.Rect(10, 10, 45, 30)]),
+    # Check that a changed image repaints its position.
+    ([("a", other_image, pg.Rect(10, 10, 40, 30))], [pg.Rect(10, 10, 40, 30)]),
+    # Check that a removed item repaints its old position.
+    ([], [pg.Rect(10, 10, 40, 30)]),
+]
+
+
+def draw_full(surface, items):
+    """
+    Draw a frame by filling the whole surface and blitting every item.
+
+    Args:
+        surface: A pygame Surface to draw on.
+        items: A list of (key, image, rect) tuples in drawing order.
+    """
+    surface.fill(BGCOLOUR)
+    for _, item_image, rect in items:
+        surface.blit(item_image, rect)
+
+# Test if only the changed regions are repainted.
+@pytest.mark.parametrize("items,expected_rects", dirty_cases)
+def test_dirty_rects(items, expected_rects):
+    """
+    Check that the regions repainted after a first frame match the changes
+    between the frames.
+
+    Args:
+        items: A list of (key, image, rect) tuples drawn in the second frame.
+        expected_rects: A list of the pygame Rect objects that should be
+            repainted.
+    """
+    renderer = DirtyRenderer(pg.Surface((WIDTH, HEIGHT)), BGCOLOUR)
+    assert renderer.render([("a", image, pg.Rect(10, 10, 40, 30))]) == \
+        [pg.Rect(0, 0, WIDTH, HEIGHT)]
+    assert renderer.render(items) == expected_rects
+
+
+def test_matches_full_repaint():
+    """
+    Check that many frames of overlapping, moving and transparent items look
+    exactly the same as filling the screen and drawing everything.
+    """
+    rng = random.Random(0)
+    keyed = pg.Surface((50, 50))
+    keyed.fill(BLACK)
+    pg.draw.circle(keyed, (20, 160, 20), (25, 25), 20)
+    keyed.set_colorkey(BLACK)
+    images = [image, other_image, keyed]
+
+    surface = pg.Surface((WIDTH, HEIGHT))
+    expected = pg.Surface((WIDTH, HEIGHT))
+    renderer = DirtyRenderer(surface, BGCOLOUR)
+    items = [(key, rng.choice(images),
+              pg.Rect(rng.randrange(WIDTH), rng.randrange(HEIGHT), 50, 50))
+             for key in range(8)]
+    for _ in range(50):
+        items = [(key, item_image, rect.move(rng.randrange(-20, 20), 0))
+                 if rng.random() < 0.5 else (key, item_image, rect)
+                 for key, item_image, rect in items]
+        renderer.render(items[:rng.randrange(4, 9)])
+        draw_full(expected, items[:len(renderer.drawn)])
+        assert pg.image.tobytes(surface, "RGB") == \
+            pg.image.tobytes(expected, "RGB")
+
+
+def test_game_view_dirty_rects():
+    """
+    Check that a game view using the dirty rectangle renderer repaints the
+    whole screen once and then nothing while the game doesn't change.
+    """
+    test_model = GameModel()
+    test_model.new()
+    test_view = GameView(test_model, dirty_rects=True)
+    test_view.draw()
+    assert test_view.renderer.pixels == WIDTH * HEIGHT
+    test_view.draw()
+    assert test_view.renderer.pixels == 0
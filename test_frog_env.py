@@ -0,0 +1,110 @@
+"""
+Test playing the game through the FrogEnv environment.
+"""
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+# pylint: disable=wrong-import-position
+from frog_env import FrogEnv, ACTIONS, PLAYER_VALUES, PLATFORM_VALUES
+
+size_cases = [
+    # Check the size of observations of the default number of platforms.
+    (5, PLAYER_VALUES + 5 * PLATFORM_VALUES),
+    # Check the size of observations of more platforms than there are.
+    (40, PLAYER_VALUES + 40 * PLATFORM_VALUES),
+]
+
+
+def play(env, seed, steps):
+    """
+    Play a game with random actions.
+
+    Args:
+        env: An instance of a FrogEnv class.
+        seed: An integer seeding the game and the actions.
+        steps: An integer containing the most steps to take.
+
+    Returns:
+        A tuple containing a list of the observations, the sum of the
+        rewards and the info of the last step.
+    """
+    rng = random.Random(seed)
+    observations = [env.reset(seed)]
+    total = 0
+    info = None
+    for _ in range(steps):
+        observation, reward, done, info = env.step(
+            rng.randrange(len(ACTIONS)))
+        observations.append(observation)
+        total += reward
+        if done:
+            break
+    return observations, total, info
+
+# Test if observations have the size and type expected.
+@pytest.mark.parametrize("nearest,size", size_cases)
+def test_observation(nearest, size):
+    """
+    Check that observations are float32 arrays of the size given by the
+    number of platforms observed, with zeros for platforms that do not exist.
+
+    Args:
+        nearest: An integer containing the number of platforms to observe.
+        size: An integer containing the length of observations expected.
+    """
+    env = FrogEnv(nearest=nearest)
+    observation = env.reset(0)
+    assert observation.shape == (size,) == (env.observation_size,)
+    assert observation.dtype == np.float32
+    platforms = len(env.game.platforms)
+    present = observation[PLAYER_VALUES::PLATFORM_VALUES]
+    assert present.sum() == min(platforms, nearest)
+    assert not observation[PLAYER_VALUES + platforms * PLATFORM_VALUES:].any()
+
+
+def test_rewards_add_up():
+    """
+    Check that the rewards of a game add up to its score, and that games
+    with the same seed and actions are the same.
+    """
+    env = FrogEnv()
+    observations, total, info = play(env, 2, 5000)
+    assert total == info["score"] == env.game.score
+    again, _, _ = play(env, 2, 5000)
+    assert len(again) == len(observations)
+    assert all((first == second).all()
+               for first, second in zip(observations, again))
+
+
+def test_truncated():
+    """
+    Check that games are cut short after max_frames steps, and cannot be
+    stepped again until they are reset.
+    """
+    env = FrogEnv(max_frames=50)
+    env.reset(0)
+    for _ in range(49):
+        assert not env.step(0)[2]
+    _, _, done, info = env.step(0)
+    assert done and info["truncated"] and info["frames"] == 50
+    with pytest.raises(RuntimeError):
+        env.step(0)
+    env.reset()
+    env.step(0)
+
+
+def test_render():
+    """
+    Check that only environments made to be shown have a view, and that
+    rendering a headless environment does nothing.
+    """
+    headless = FrogEnv()
+    headless.reset(0)
+    headless.render()
+    assert headless.game.view is None
+    shown = FrogEnv(render_mode="human")
+    shown.reset(0)
+    shown.step(3)
+    shown.render()
+    assert shown.game.view is not None
@@ -9,7 +9,7 @@ from player_model import Player
 from settings import HEIGHT
 
 test_model = GameModel()
-test_player = Player(test_model)
+test_player = Player()
 test_view = GameView(test_model)
 
 model_cases = [
@@ -25,8 +25,8 @@ test_model.new()
 platform_gen_cases = [
     # Check if correct number of platforms are initialized.
     (test_model.platforms, 5),
-    # Check if correct number of total sprites are initialized.
-    (test_model.all_sprites, 6),
+    # Check if the view draws a sprite for each platform and the player.
+    (test_view.sprites(), 6),
 ]
 
 score_screen_cases = [
@@ -41,6 +41,28 @@ wait_cases = [
     (pg.event.Event(pg.QUIT), 2),
 ]
 
+menu_event_cases = [
+    # Check that a driver that can wait for events sleeps until one arrives.
+    ("x11", [pg.event.Event(pg.KEYUP)], [pg.KEYUP]),
+    # Check that a driver that has to be polled gets its events.
+    ("offscreen", [pg.event.Event(pg.KEYUP)], [pg.KEYUP]),
+    # Check that waiting with no events gives an empty event.
+    ("x11", [], [pg.NOEVENT]),
+    # Check that polling with no events gives an empty event.
+    ("offscreen", [], [pg.NOEVENT]),
+]
+
+menu_wait_cases = [
+    # Check that desktop drivers wait for events.
+    ("x11", True),
+    ("windows", True),
+    # Check that drivers without a desktop wait for events too.
+    ("kmsdrm", True),
+    ("dummy", True),
+    # Check that the offscreen driver, which cannot sleep, is polled.
+    ("offscreen", False),
+]
+
 quit_case = [
     # Check if game stops running if method is called.
     (False)
@@ -94,6 +116,47 @@ def test_wait(key_press,flag):
     test_model.wait_for_key()
     assert test_model.flag == flag
 
+# Test if menu screens get their events with any video driver.
+@pytest.mark.parametrize("driver,events,types", menu_event_cases)
+def test_menu_events(monkeypatch, driver, events, types):
+    """
+    Check that the events of a menu screen are found whether the video
+    driver can wait for them or is polled.
+
+    Args:
+        monkeypatch: A pytest fixture used to pretend to use another driver.
+        driver: A string containing the name of the video driver.
+        events: A list of the pygame events posted.
+        types: A list of the types of the events expected.
+    """
+    monkeypatch.setattr(pg.display, "get_driver", lambda: driver)
+    monkeypatch.setattr("game_model.MENU_TIMEOUT", 10)
+    pg.event.clear()
+    for event in events:
+        pg.event.post(event)
+    assert [event.type for event in test_model.menu_events()] == types
+
+# Test if every video driver but the broken ones waits for events.
+@pytest.mark.parametrize("driver,waits", menu_wait_cases)
+def test_menu_waits(monkeypatch, driver, waits):
+    """
+    Check that menu screens sleep on events with any video driver, only
+    polling the drivers known not to be able to sleep.
+
+    Args:
+        monkeypatch: A pytest fixture used to pretend to use another driver.
+        driver: A string containing the name of the video driver.
+        waits: A boolean that is True if the driver should wait for events.
+    """
+    waited = []
+    monkeypatch.setattr(pg.display, "get_driver", lambda: driver)
+    monkeypatch.setattr(pg.event, "wait",
+                        lambda timeout: waited.append(timeout)
+                        or pg.event.Event(pg.NOEVENT))
+    pg.event.clear()
+    test_model.menu_events()
+    assert bool(waited) == waits
+
 # Test if the game is quit correctly.
 @pytest.mark.parametrize("is_running", quit_case)
 def test_quit(is_running):
@@ -6,6 +6,7 @@ import pygame as pg
 from game_model import GameModel
 from game_view import GameView
 from player_model import Player
+from score_store import LEADERBOARD_SIZE, ScoreStore
 from settings import TITLE, WIDTH, HEIGHT
 
 test_model = GameModel()
@@ -35,20 +36,19 @@ highscore_cases = [
     (0, 0, 0),
 ]
 
-
 frame_cases = [
     # Check if correct image is chosen for right jump frame.
-    (test_view.jump_r, (108, 96)),
+    (test_view.player_frames[("jump", "right")][0], (108, 96)),
     # Check if correct image is chosen for left jump frame.
-    (test_view.jump_l, (108, 96)),
+    (test_view.player_frames[("jump", "left")][0], (108, 96)),
     # Check if correct image is chosen for first left walking frame.
-    (test_view.walk_frames_l[0], (64, 50)),
+    (test_view.player_frames[("walk", "left")][0], (64, 50)),
     # Check if correct image is chosen for second left walking frame.
-    (test_view.walk_frames_l[1], (66, 50)),
+    (test_view.player_frames[("walk", "left")][1], (66, 50)),
     # Check if correct image is chosen for first right walking frame.
-    (test_view.walk_frames_r[0], (66, 50)),
+    (test_view.player_frames[("walk", "right")][0], (66, 50)),
     # Check if correct image is chosen for second right walking frame.
-    (test_view.walk_frames_r[1], (64, 50)),
+    (test_view.player_frames[("walk", "right")][1], (64, 50)),
 ]
 # Test if display screen is initialzed correctly.
 @pytest.mark.parametrize("actual_value,expected_value", display_cases)
@@ -113,3 +113,52 @@ def test_load_images(image, dimensions):
         and height of the sprite in pixels.
     """
     assert (image.get_width(), image.get_height()) == dimensions
+
+
+def test_single_view():
+    """
+    Check that a game makes one view, which draws the player and every
+    platform through its own sprites.
+    """
+    game_model = GameModel()
+    game_model.new()
+    sprites = game_model.view.sprites()
+    assert [sprite.entity for sprite in sprites] == \
+        list(game_model.platforms) + [game_model.player]
+    assert all(sprite.game_view is game_model.view for sprite in sprites)
+    assert game_model.view.sprites() == sprites
+
+def test_start_screen_layout():
+    """
+    Check that no text on the start screen overlaps other text, with a full
+    leaderboard, and that the prompt to play is below the leaderboard.
+    """
+    game_model = GameModel(scores=ScoreStore(threaded=False))
+    game_view = game_model.view
+    for score in range(LEADERBOARD_SIZE):
+        game_view.scores.record(1000 * score, score, 1.0)
+    rects = []
+    draw_text = game_view.draw_text
+    game_view.draw_text = lambda *args: rects.append(draw_text(*args))
+    game_view.draw_start_screen()
+    assert len(rects) == 3 + LEADERBOARD_SIZE
+    for index, rect in enumerate(rects):
+        assert rect.collidelist(rects[index + 1:]) == -1
+
+    # Check that the prompt is a whole line below the last line of the
+    # leaderboard, whatever the height of the font found.
+    _, prompt, _, *lines = rects
+    assert prompt.top >= lines[-1].top + (lines[-1].top - lines[-2].top)
+
+
+def test_refresh_menu():
+    """
+    Check that showing the start screen again after the window is uncovered
+    does not draw anything on it.
+    """
+    game_model = GameModel(scores=ScoreStore(threaded=False))
+    game_model.view.draw_start_screen()
+    shown = pg.image.tobytes(game_model.view.screen, "RGB")
+    game_model.view.scores.record(50, 0, 1.0)
+    game_model.view.refresh_menu()
+    assert pg.image.tobytes(game_model.view.screen, "RGB") == shown
@@ -0,0 +1,59 @@
+"""
+Test running the game as a headless simulation.
+"""
+import pytest
+from game_model import GameModel
+from headless import HopAgent, run
+
+test_model = GameModel(headless=True)
+test_model.new()
+
+headless_cases = [
+    # Check that no game view is created.
+    (test_model.view, None),
+    # Check that the player has no image.
+    (getattr(test_model.player, "image", None), None),
+]
+
+run_cases = [
+    # Check that frames are simulated with the scripted agent.
+    (500, HopAgent),
+    # Check that frames are simulated without any input.
+    (500, None),
+]
+
+# Test if headless models are initialized without a view.
+@pytest.mark.parametrize("actual_value,expected_value", headless_cases)
+def test_headless_initialization(actual_value, expected_value):
+    """
+    Check that a headless model is made without any display objects.
+
+    Args:
+        actual_value: The attribute of the model or player to check.
+        expected_value: The value this attribute is supposed to have.
+    """
+    assert actual_value is expected_value
+
+
+def test_headless_platform_sizes():
+    """
+    Check that headless platforms still have collision rectangles of the
+    sizes of the platform images.
+    """
+    for plat in test_model.platforms:
+        assert plat.rect.size in [(136, 40), (254, 54)]
+
+# Test if the headless runner steps the requested number of frames.
+@pytest.mark.parametrize("frames,agent", run_cases)
+def test_run(frames, agent):
+    """
+    Check that the headless runner simulates exactly the requested number of
+    frames, starting at least one game.
+
+    Args:
+        frames: An integer containing the number of frames to simulate.
+        agent: The input source class used to move the player, or None.
+    """
+    steps, games, _ = run(frames, agent)
+    assert steps == frames
+    assert games >= 1
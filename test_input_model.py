@@ -0,0 +1,68 @@
+"""
+Test combining the input of a tick with the InputSnapshot class.
+"""
+import pytest
+from input_log import LEFT, RIGHT, JUMP, JUMP_CUT, CUT_FIRST
+from input_model import InputSnapshot, NO_INPUT
+
+then_cases = [
+    # Check that a jump is kept.
+    ([JUMP], JUMP),
+    # Check that a jump followed by a jump cut is kept in that order.
+    ([JUMP, JUMP_CUT], JUMP | JUMP_CUT),
+    # Check that a jump cut followed by a jump is kept in that order.
+    ([JUMP_CUT, JUMP], JUMP | JUMP_CUT | CUT_FIRST),
+    # Check that only the arrow keys held last are kept.
+    ([LEFT | JUMP, RIGHT], JUMP | RIGHT),
+]
+
+field_cases = [
+    # Check the arrow keys.
+    (LEFT, "left"),
+    (RIGHT, "right"),
+    # Check the jump key.
+    (JUMP, "jump"),
+    (JUMP_CUT, "jump_cut"),
+    (CUT_FIRST, "cut_first"),
+]
+
+# Test if input from before a tick is combined in order.
+@pytest.mark.parametrize("polls,bits", then_cases)
+def test_then(polls, bits):
+    """
+    Check that the input of several polls before a tick is combined with the
+    order it was given in, like the input logged for the tick.
+
+    Args:
+        polls: A list of the input bits of each poll, in order.
+        bits: An integer containing the input bits expected for the tick.
+    """
+    inputs = NO_INPUT
+    for poll in polls:
+        inputs = inputs.then(InputSnapshot(poll))
+    assert inputs.bits == bits
+
+
+# Test if each key can be read from a snapshot.
+@pytest.mark.parametrize("bit,field", field_cases)
+def test_fields(bit, field):
+    """
+    Check that each key is read from its own bit.
+
+    Args:
+        bit: An integer containing the bit of the key.
+        field: A string containing the name of the property reading it.
+    """
+    assert getattr(InputSnapshot(bit), field)
+    assert not getattr(InputSnapshot(0b11111 & ~bit), field)
+
+
+def test_held():
+    """
+    Check that only the arrow keys and quitting carry on to the next tick,
+    and that snapshots cannot be changed.
+    """
+    inputs = InputSnapshot(LEFT | JUMP | JUMP_CUT, quit=True)
+    assert inputs.held() == InputSnapshot(LEFT, quit=True)
+    with pytest.raises(AttributeError):
+        inputs.bits = 0
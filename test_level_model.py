@@ -0,0 +1,100 @@
+"""
+Test generating levels with the level_model module.
+"""
+import random
+import pytest
+from level_model import (LevelGenerator,
+                         LevelPlatform,
+                         ENVELOPE,
+                         MAX_RISE,
+                         MIN_RISE,
+                         PLATFORM_SIZES,
+                         generate_chunk,
+                         next_platform,
+                         reach,)
+from settings import WIDTH
+
+FIRST = LevelPlatform(0, 100, 0)
+
+reach_cases = [
+    # Check that the lowest platforms can be reached from furthest away.
+    (MIN_RISE, (MIN_RISE + MAX_RISE) // 2),
+    # Check that higher platforms have to be closer.
+    ((MIN_RISE + MAX_RISE) // 2, MAX_RISE),
+]
+
+seed_cases = [
+    # Check a level with a small seed.
+    0,
+    # Check a level with a large seed.
+    2**32 - 1,
+]
+
+# Test if higher platforms leave less room to move sideways.
+@pytest.mark.parametrize("lower,higher", reach_cases)
+def test_reach(lower, higher):
+    """
+    Check that the reach shrinks as the rise grows, and that the highest rise
+    is within the jump.
+
+    Args:
+        lower: An integer containing a rise.
+        higher: An integer containing a larger rise.
+    """
+    assert reach(lower) > reach(higher) > 0
+    assert max(rise for _, rise in ENVELOPE) > MAX_RISE
+
+
+def test_next_platform_reachable():
+    """
+    Check that every platform is on the screen, not too high above the one
+    below it and close enough sideways to jump to.
+    """
+    rng = random.Random(0)
+    below = FIRST
+    for _ in range(1000):
+        plat = next_platform(rng, below)
+        rise = plat.height - below.height
+        assert MIN_RISE <= rise <= MAX_RISE
+        width = PLATFORM_SIZES[plat.kind][0]
+        below_width = PLATFORM_SIZES[below.kind][0]
+        assert 0 <= plat.x <= WIDTH - width
+        gap = max(plat.x - below.x - below_width, below.x - plat.x - width)
+        assert gap < reach(rise)
+        below = plat
+
+# Test if chunks never have overlapping platforms.
+@pytest.mark.parametrize("seed", seed_cases)
+def test_chunks_do_not_overlap(seed):
+    """
+    Check that no two platforms of the first chunks of a level overlap.
+
+    Args:
+        seed: An integer containing the seed of the level.
+    """
+    last = FIRST
+    for index in range(20):
+        platforms, last = generate_chunk(seed, index, last)
+        for number, plat in enumerate(platforms):
+            width, height = PLATFORM_SIZES[plat.kind]
+            for other in platforms[number + 1:]:
+                other_width, other_height = PLATFORM_SIZES[other.kind]
+                assert not (plat.x < other.x + other_width
+                            and other.x < plat.x + width
+                            and plat.height - height < other.height
+                            and other.height - other_height < plat.height)
+
+
+def test_threaded_matches_synchronous():
+    """
+    Check that a level is the same whether it is generated on a worker
+    thread or when asked for, and the same every time for one seed.
+    """
+    threaded = LevelGenerator(7, FIRST)
+    synchronous = LevelGenerator(7, FIRST, threaded=False)
+    try:
+        for _ in range(10):
+            assert threaded.next_chunk() == synchronous.next_chunk()
+    finally:
+        threaded.close()
+    assert generate_chunk(7, 3, FIRST) == generate_chunk(7, 3, FIRST)
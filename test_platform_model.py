@@ -1,8 +1,10 @@
 """
 Test the initialization of the Platform model class.
 """
+import random
 import pytest
-from platform_model import Platform
+import pygame as pg
+from platform_model import Platform, PlatformGroup
 from game_model import GameModel
 from game_view import GameView
 
@@ -20,17 +22,25 @@ platform_cases = [
     (1, (354, 154)),
 ]
 
+collide_cases = [
+    # Check collisions with platforms that have never moved.
+    0,
+    # Check collisions after the platforms scrolled down together.
+    7.5,
+    # Check collisions after the platforms moved up together.
+    -10,
+]
+
 # Test if correct image is drawn for each frame.
 @pytest.mark.parametrize("index,coordinates", platform_cases)
 def test_platforms(index,coordinates):
     """
     Check if both the small and large platforms are initialized correctly.
 
-    It is not possible to directly identify a sprite, so check the coordinates
-    of the bottom-right of the platform sprite rectangle which essentially has
-    the coordinates of (x + width, y + height), hence by fixing the expected
-    coordinates of placement, check if correct platform is initialized in the
-    correct position.
+    Check the coordinates of the bottom-right of the platform rectangle which
+    essentially has the coordinates of (x + width, y + height), hence by fixing
+    the expected coordinates of placement, check if correct platform is
+    initialized in the correct position.
 
     Args:
         index: An integer containing the list index of the platform image in
@@ -38,12 +48,59 @@ def test_platforms(index,coordinates):
         coordinates: A tuple containing integers representing the coordinates
             of the bottomright of the platform sprite rectangle.
     """
-    # Keep initializing instances of Platform until the desired platform is
-    # obtained (the type of platform is chosen randomly so this can't be
-    # explicitly selected).
-    test_platform = Platform(test_view, X_COORD, Y_COORD)
-    while test_platform.image != test_platform.images[index]:
-        test_platform = Platform(test_view, X_COORD, Y_COORD)
+    # Initialize the desired kind of platform.
+    test_platform = Platform(X_COORD, Y_COORD, kind=index)
 
     # Check if the coordinates of the bottom-right point match as expected.
     assert (test_platform.rect.bottomright) == coordinates
+
+
+def test_pool_long_run():
+    """
+    Check that a long, constantly scrolling game recycles its platforms and
+    only creates new ones when more platforms are on the screen than ever
+    before, and no new images once it is running.
+
+    Keep the player in the top fourth of the screen so every frame scrolls
+    the platforms off the bottom and new ones are spawned. The game is seeded
+    so the player rarely comes to rest on a platform, which would slow down
+    the scrolling.
+    """
+    test_model.new(seed=0)
+    test_model.update()
+    created = test_model.pool.created
+    misses = test_model.view.spritesheet.misses
+    most = len(test_model.platforms)
+    for _ in range(5000):
+        test_model.player.pos.y = test_model.camera.y + 150
+        test_model.update()
+        most = max(most, len(test_model.platforms))
+    assert test_model.pool.reused > 10 * test_model.pool.created
+    assert test_model.pool.created <= max(created, most)
+    assert test_model.view.spritesheet.misses == misses
+
+
+# Test if the platform index finds the same collisions as pygame.
+@pytest.mark.parametrize("distance", collide_cases)
+def test_group_collide(distance):
+    """
+    Check that a PlatformGroup finds the same platforms, in the same order,
+    as checking every platform in the order it was added, including after all
+    platforms are moved by the same distance and some of them are killed.
+
+    Args:
+        distance: A number of pixels to move every platform down by.
+    """
+    rng = random.Random(0)
+    group = PlatformGroup()
+    for _ in range(30):
+        group.add(Platform(rng.randrange(0, 400), rng.randrange(0, 600)))
+    for plat in group:
+        plat.rect.y += distance
+    for plat in list(group)[::3]:
+        plat.kill()
+    for _ in range(200):
+        rect = pg.Rect(rng.randrange(-50, 450), rng.randrange(-50, 650), 64, 50)
+        assert group.collide(rect) == \
+            [plat for plat in group if plat.rect.colliderect(rect)]
+    assert len(group.by_top) == len(group) == 20
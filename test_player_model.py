@@ -2,17 +2,16 @@
 Test all the class methods in the Player class in the player_model file.
 """
 import pytest
-import pygame as pg
 from game_model import GameModel
 from game_view import GameView
-from controller import PlayerController
-from player_model import Player
-from platform_model import Platform
+from animation_model import Animation
+from player_model import Player, vec
+from platform_model import Platform, PlatformGroup
 from settings import WIDTH, HEIGHT, PLAYER_ACC
+from sprite_view import PlayerSprite
 test_model = GameModel()
-test_controller = PlayerController(test_model)
 test_view = GameView(test_model)
-test_player = Player(test_model)
+test_player = Player()
 
 move_cases = [
     # Test sprite moving Right.
@@ -90,15 +89,15 @@ animate_check_walking_cases = [
 
 animate_check_image_cases = [
     # Check if the player is animated correctly when jumping to the right.
-    (True, False, 2, test_player.game_view.jump_r),
+    (True, 2, "jumpright.png"),
     # Check if the player is animated correctly when jumping to the left.
-    (True, False, -2, test_player.game_view.jump_l),
+    (True, -2, "jumpleft.png"),
     # Check if the player is animated correctly when walking to the right.
-    (False, True, 2, test_player.game_view.walk_frames_r[0]),
+    (False, 2, "prepright.png"),
     # Check if the player is animated correctly when walking to the left.
-    (False, True, -2, test_player.game_view.walk_frames_l[1]),
+    (False, -2, "lookleft.png"),
     # Check if player is initially sitting towards the left.
-    (False, False, 0, test_player.game_view.walk_frames_l[1])
+    (False, 0, "lookleft.png")
 ]
 # Test if player is initialized correctly.
 @pytest.mark.parametrize("attribute,value", initial_player_cases)
@@ -157,13 +156,18 @@ def test_jump(platform_coordinates, player_coordinates,jumping):
     # Initialize the player to be not jumping.
     test_player.jumping = False
 
-    # Define a platform sprite at the specified coordinates.
-    test_player.game_model.platforms = pg.sprite.Group()
-    platform = Platform(test_view, *platform_coordinates)
-    test_player.game_model.platforms.add(platform)
+    # Define a platform at the specified coordinates.
+    platforms = PlatformGroup()
+    platforms.add(Platform(*platform_coordinates))
 
-    # Place the player at the specified coordinates.
-    test_player.rect.bottomleft = player_coordinates
+    # Place the player at the specified coordinates, falling one pixel into
+    # the platform as it would during a game, and land it if it is on the
+    # platform.
+    test_player.rect.bottomleft = (player_coordinates[0],
+                                   player_coordinates[1] + 1)
+    test_player.pos = vec(test_player.rect.midbottom)
+    test_player.vel.y = 1
+    test_player.land(platforms)
 
     # Check if the jump method correctly determines if the player is allowed to
     # jump in that particular situation.
@@ -233,8 +237,8 @@ def test_animate_check_walking(velocity, is_walking):
     test_player.animate()
     assert test_player.walking == is_walking
 
-@pytest.mark.parametrize("is_jumping, is_walking, velocity, image", animate_check_image_cases)
-def test_animate_check_image(is_jumping, is_walking, velocity, image):
+@pytest.mark.parametrize("is_jumping, velocity, frame", animate_check_image_cases)
+def test_animate_check_image(is_jumping, velocity, frame):
     """
     Check if the player sprite is displayed as it is supposed to be considering
     its current state.
@@ -244,20 +248,17 @@ def test_animate_check_image(is_jumping, is_walking, velocity, image):
 
     Args:
         is_jumping: A boolean determining if the player is currently jumping.
-        is_walking: A boolean determining if the player is currently walking.
         velocity: An integer containing the velocity of the player sprite in
         the x direction.
-        image: A pygame Surface object that is an attribute of the player class
-        and contains the specific animation to be shown on screen.
+        frame: A string containing the name of the frame in the atlas that
+        should be shown on screen.
     """
-    # Set the player sprite's state as desired.
+    # Set the player sprite's state as desired, starting a new animation.
     test_player.jumping = is_jumping
-    test_player.walking = is_walking
     test_player.vel.x = velocity
+    test_player.animation = Animation()
 
-    # Set this to a large negative value to enter walking animation.
-    test_player.last_update = -1000
-
-    # Check if the animate method displays the correct frames.
+    # Check if the animate method makes the view display the correct frames.
     test_player.animate()
-    assert test_player.image == image
+    assert PlayerSprite(test_player, test_view).image is \
+        test_view.atlas[frame]
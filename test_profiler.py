@@ -0,0 +1,237 @@
+"""
+Test timing the sections of frames with the FrameProfiler class.
+"""
+import csv
+import json
+import pytest
+from game_model import GameModel
+from game_view import GameView
+from profiler import (FrameHistogram,
+                      FrameProfiler,
+                      NullProfiler,
+                      PHASES,
+                      percentile,)
+
+
+class FakeClock:
+    """
+    Clock that moves forward by a set amount each time it is read.
+
+    Attributes:
+        now: A float containing the current time in seconds.
+        step: A float containing how far the clock moves each time it is read.
+    """
+
+    def __init__(self, step):
+        """
+        Start the clock at zero.
+
+        Args:
+            step: A float containing how far the clock moves each time it is
+                read.
+        """
+        self.now = 0
+        self.step = step
+
+    def __call__(self):
+        """
+        Read the clock.
+
+        Returns:
+            A float containing the time in seconds.
+        """
+        self.now += self.step
+        return self.now
+
+
+def profile_frames(profiler, frames):
+    """
+    Profile frames where each section takes one tick of the clock, and the
+    update sections run twice.
+
+    Args:
+        profiler: An instance of a FrameProfiler class.
+        frames: An integer containing the number of frames to profile.
+    """
+    for _ in range(frames):
+        profiler.begin_frame()
+        profiler.mark("events")
+        for _ in range(2):
+            for section in PHASES["update"]:
+                profiler.mark(section)
+        for section in PHASES["draw"]:
+            profiler.mark(section)
+        profiler.end_frame()
+
+
+percentile_cases = [
+    # Check the median of an odd number of values.
+    ([1, 2, 3, 4, 5], 50, 3),
+    # Check the median of an even number of values.
+    ([1, 2, 3, 4], 50, 2),
+    # Check a high percentile rounds up to the next value.
+    ([1, 2, 3, 4], 95, 4),
+    # Check there is no percentile without values.
+    ([], 99, 0),
+]
+
+phase_cases = [
+    # Check each section is timed once per frame.
+    ("events", 1),
+    # Check that repeated sections add up.
+    ("sprites", 2),
+    # Check that phases add up their sections.
+    ("update", 10),
+    # Check that phases add up their sections.
+    ("draw", 5),
+    # Check that a frame adds up every section but waiting.
+    ("frame", 16),
+]
+
+histogram_cases = [
+    # Check that an interval is counted in the bucket it falls in.
+    ([0.003], [0, 1, 0, 0]),
+    # Check that intervals on a boundary go in the later bucket.
+    ([0.002, 0.004], [0, 1, 1, 0]),
+    # Check that long intervals are counted in the last bucket.
+    ([0.001, 0.5], [1, 0, 0, 1]),
+]
+
+# Test if percentiles are found with the nearest-rank method.
+@pytest.mark.parametrize("values,percent,expected", percentile_cases)
+def test_percentile(values, percent, expected):
+    """
+    Check that the right value is picked as a percentile.
+
+    Args:
+        values: A sorted list of numbers.
+        percent: A number from 0 to 100.
+        expected: The value expected to be the percentile.
+    """
+    assert percentile(values, percent) == expected
+
+# Test if the sections and phases of a frame are timed.
+@pytest.mark.parametrize("section,ticks", phase_cases)
+def test_phase_times(section, ticks):
+    """
+    Check that each section or phase is given the time it took.
+
+    Args:
+        section: A string containing the name of a section or phase.
+        ticks: An integer containing the number of clock steps it took.
+    """
+    profiler = FrameProfiler(size=8, clock=FakeClock(0.001))
+    profile_frames(profiler, 3)
+    assert profiler.history(section) == pytest.approx([ticks * 0.001] * 3)
+
+
+def test_ring_buffer():
+    """
+    Check that only the most recent frames are kept, oldest first.
+    """
+    profiler = FrameProfiler(size=4, clock=FakeClock(0.001))
+    for frame in range(10):
+        profiler.begin_frame()
+        for _ in range(frame + 1):
+            profiler.mark("events")
+        profiler.end_frame()
+    assert profiler.frames == 10
+    assert profiler.history("events") == pytest.approx(
+        [0.007, 0.008, 0.009, 0.010])
+
+
+def test_null_profiler():
+    """
+    Check that the model is not profiled by default, and that the null
+    profiler accepts the same calls as a real one.
+    """
+    test_model = GameModel(headless=True)
+    assert isinstance(test_model.profiler, NullProfiler)
+    test_model.profiler.begin_frame()
+    test_model.profiler.mark("events")
+    test_model.profiler.end_frame()
+    assert not test_model.profiler.overlay
+
+
+def test_game_sections():
+    """
+    Check that updating and drawing a game times every section.
+    """
+    test_model = GameModel()
+    test_view = GameView(test_model)
+    test_model.new()
+    test_model.profiler = FrameProfiler(size=8, overlay=True)
+    test_model.profiler.summary_every = 1
+    for _ in range(3):
+        test_model.profiler.begin_frame()
+        test_model.profiler.mark("events")
+        test_model.update()
+        test_view.draw()
+        test_model.profiler.end_frame()
+    for phase in ("update", "draw"):
+        for section in PHASES[phase]:
+            assert all(time > 0 for time in test_model.profiler.history(section))
+    assert len(test_model.profiler.summary) == len(PHASES)
+    assert test_model.profiler.summary[1].startswith("update p50")
+
+
+def test_dump(tmp_path):
+    """
+    Check that frame times are saved as CSV and JSON in milliseconds.
+
+    Args:
+        tmp_path: A pathlib Path of a temporary directory.
+    """
+    profiler = FrameProfiler(size=8, clock=FakeClock(0.001))
+    profile_frames(profiler, 5)
+    profiler.dump(str(tmp_path / "profile.csv"))
+    profiler.dump(str(tmp_path / "profile.json"))
+
+    with open(tmp_path / "profile.csv", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 5
+    assert float(rows[-1]["update"]) == pytest.approx(10)
+
+    with open(tmp_path / "profile.json") as file:
+        data = json.load(file)
+    assert data["frames"] == 5
+    assert data["percentiles"]["frame"]["p99"] == pytest.approx(16)
+    assert data["times"]["draw"] == pytest.approx([5] * 5)
+
+# Test if intervals are counted in the right buckets.
+@pytest.mark.parametrize("intervals,counts", histogram_cases)
+def test_histogram(intervals, counts):
+    """
+    Check that each interval between ticks is counted in the bucket holding
+    its length.
+
+    Args:
+        intervals: A list of floats containing the intervals in seconds.
+        counts: A list of integers containing the count expected in each
+            bucket.
+    """
+    clock = FakeClock(0)
+    histogram = FrameHistogram(bucket_ms=2, buckets=4, clock=clock)
+    histogram.tick()
+    for interval in intervals:
+        clock.now += interval
+        histogram.tick()
+    assert histogram.counts == counts
+    assert histogram.percentiles()[50] == pytest.approx(
+        percentile(sorted(intervals), 50) * 1000)
+
+
+def test_histogram_lines():
+    """
+    Check that the histogram is drawn from the first to the last bucket used,
+    with the longest bar for the bucket holding the most intervals.
+    """
+    histogram = FrameHistogram(bucket_ms=2, buckets=4)
+    for interval in (0.003, 0.003, 0.009):
+        histogram.add(interval)
+    assert histogram.lines(width=10) == [
+        "    2-4   ms      2 ##########",
+        "    4-6   ms      0 ",
+        "    6+    ms      1 #####",
+    ]
+    assert FrameHistogram().lines() == []
@@ -0,0 +1,116 @@
+"""
+Test recording games and saving them with the ScoreStore class.
+"""
+import sqlite3
+import pytest
+import pygame as pg
+from game_model import GameModel
+from game_view import GameView
+from score_store import ScoreStore, LEADERBOARD_SIZE
+
+leaderboard_cases = [
+    # Check that no runs make an empty leaderboard.
+    ([], []),
+    # Check that runs are ranked best first.
+    ([30, 10, 20], [30, 20, 10]),
+    # Check that only the best runs are kept.
+    ([10, 60, 20, 50, 30, 40], [60, 50, 40, 30, 20]),
+]
+
+legacy_cases = [
+    # Check that a saved high score is imported.
+    ("400", 400),
+    # Check that an empty file is ignored.
+    ("", 0),
+    # Check that a file that is not a number is ignored.
+    ("frog", 0),
+]
+
+# Test if runs are ranked on the leaderboard.
+@pytest.mark.parametrize("scores,expected", leaderboard_cases)
+def test_leaderboard(scores, expected):
+    """
+    Check that the best runs recorded are on the leaderboard, in order, and
+    that the high score is the best of them.
+
+    Args:
+        scores: A list of the integer scores of the runs recorded.
+        expected: A list of the integer scores expected on the leaderboard.
+    """
+    store = ScoreStore(threaded=False)
+    for seed, score in enumerate(scores):
+        store.record(score, seed, 1.5)
+    assert [run.score for run in store.leaderboard()] == expected
+    assert store.highscore == (expected[0] if expected else 0)
+    assert store.count() == len(scores)
+    store.close()
+
+# Test if the old high score file is imported into a new database.
+@pytest.mark.parametrize("contents,highscore", legacy_cases)
+def test_legacy_import(tmp_path, contents, highscore):
+    """
+    Check that the score in an old high score file is imported only into a
+    database without any runs.
+
+    Args:
+        tmp_path: A pathlib Path of a temporary directory.
+        contents: A string containing the contents of the old file.
+        highscore: An integer containing the high score expected.
+    """
+    legacy_file = tmp_path / "highscore.txt"
+    legacy_file.write_text(contents)
+    database = str(tmp_path / "scores.db")
+    store = ScoreStore(database, legacy_file=str(legacy_file))
+    assert store.highscore == highscore
+    store.record(1, 0, 1.0)
+    store.close()
+
+    legacy_file.write_text("1000")
+    store = ScoreStore(database, legacy_file=str(legacy_file))
+    assert store.highscore == max(highscore, 1)
+    store.close()
+
+
+def test_saved_in_background(tmp_path):
+    """
+    Check that runs recorded on the writer thread are saved to a database in
+    WAL mode, and read back when it is opened again.
+
+    Args:
+        tmp_path: A pathlib Path of a temporary directory.
+    """
+    database = str(tmp_path / "scores.db")
+    store = ScoreStore(database)
+    for score in range(0, 100, 10):
+        store.record(score, score, 2.0)
+    store.flush()
+    assert store.count() == 10
+    store.close()
+
+    connection = sqlite3.connect(database)
+    [(mode,)] = connection.execute("PRAGMA journal_mode")
+    connection.close()
+    assert mode == "wal"
+
+    store = ScoreStore(database, threaded=False)
+    assert [run.score for run in store.leaderboard()] == \
+        list(range(90, 90 - 10 * LEADERBOARD_SIZE, -10))
+    assert store.leaderboard(1)[0].seed == 90
+    store.close()
+
+
+def test_go_screen_records():
+    """
+    Check that the game over screen records the game that ended.
+    """
+    test_model = GameModel(seed=3)
+    test_view = GameView(test_model)
+    test_model.new()
+    for _ in range(30):
+        test_model.update()
+    test_model.score = 70
+    pg.event.post(pg.event.Event(pg.KEYUP))
+    test_view.show_go_screen()
+    [run] = test_view.scores.leaderboard()
+    assert (run.score, run.seed, run.duration) == \
+        (70, test_model.game_seed, 0.5)
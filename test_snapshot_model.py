@@ -0,0 +1,158 @@
+"""
+Test saving and restoring the state of games with snapshots.
+"""
+import random
+import pytest
+from game_model import GameModel
+from headless import HopAgent
+from input_log import JUMP
+from input_model import InputSnapshot
+from snapshot_model import STATE, PLATFORM, UPCOMING, RNG
+
+
+def state(game_model):
+    """
+    Get everything that decides how a game continues.
+
+    Args:
+        game_model: An instance of a GameModel class.
+
+    Returns:
+        A tuple of the game's score, ticks, camera, player and platforms.
+    """
+    player = game_model.player
+    return (game_model.score, game_model.ticks, game_model.playing,
+            game_model.camera.y, tuple(player.pos), tuple(player.vel),
+            player.rect.topleft, player.jumping, player.animation.frame,
+            [(tuple(plat.rect), plat.kind) for plat in game_model.platforms],
+            list(game_model.upcoming), game_model.rng.random())
+
+
+def play(game_model, rng, ticks):
+    """
+    Play a game with a scripted agent that climbs the level, sometimes
+    replaced by random input.
+
+    Args:
+        game_model: An instance of a GameModel class.
+        rng: A random number generator choosing the input.
+        ticks: An integer containing the most ticks to play.
+    """
+    source = HopAgent(game_model)
+    for _ in range(ticks):
+        if not game_model.playing:
+            return
+        inputs = source.poll()
+        if rng.random() < 0.05:
+            inputs = InputSnapshot(rng.randrange(32))
+        game_model.update(inputs)
+
+restore_cases = [
+    # Check that a game is rolled back to the snapshot.
+    (2, 300, True),
+    # Check that a snapshot can be resumed by another model.
+    (3, 500, False),
+    # Check that a snapshot of the start of a game can be restored.
+    (4, 0, False),
+]
+
+# Test if restored games carry on exactly like the original.
+@pytest.mark.parametrize("seed,ticks,same_model", restore_cases)
+def test_restore(seed, ticks, same_model):
+    """
+    Check that a game restored from a snapshot carries on exactly like the
+    game it was taken from, given the same input.
+
+    Args:
+        seed: An integer containing the seed of the game and its input.
+        ticks: An integer containing the number of ticks played before the
+            snapshot.
+        same_model: A boolean that is True to restore the snapshot into the
+            game it was taken from.
+    """
+    game_model = GameModel(headless=True, seed=seed, record=True)
+    game_model.new()
+    play(game_model, random.Random(seed), ticks)
+    data = game_model.snapshot()
+    play(game_model, random.Random(seed + 100), 400)
+    expected = state(game_model)
+    assert game_model.score > 0
+
+    restored = game_model if same_model else GameModel(headless=True)
+    restored.restore(data)
+    play(restored, random.Random(seed + 100), 400)
+    assert state(restored) == expected
+    if same_model:
+        assert len(restored.input_log) == restored.ticks
+
+
+def test_restore_jumps():
+    """
+    Check that rolling a game back across a jump also rolls back its count
+    of jumps, so the game carries on exactly like the original.
+    """
+    game_model = GameModel(headless=True, seed=5)
+    game_model.new()
+    game_model.update()
+    data = game_model.snapshot()
+    game_model.update(InputSnapshot(JUMP))
+    assert game_model.jumps == 1
+    game_model.restore(data)
+    assert game_model.jumps == 0
+    game_model.update(InputSnapshot(JUMP))
+    assert game_model.jumps == 1
+
+seed_cases = [
+    # Check that the largest seed a replay can store is saved.
+    (2**64 - 1, True),
+    # Check that a seed above it is rejected.
+    (2**64, False),
+    # Check that a negative seed is rejected.
+    (-1, False),
+]
+
+# Test if any seed a game can start with can be saved in a snapshot.
+@pytest.mark.parametrize("seed,valid", seed_cases)
+def test_seed_range(seed, valid):
+    """
+    Check that a game started with a seed in range can be restored, and
+    that other seeds are rejected when the game starts.
+
+    Args:
+        seed: An integer containing the seed of the game.
+        valid: A boolean that is True if the seed is in range.
+    """
+    game_model = GameModel(headless=True)
+    if not valid:
+        with pytest.raises(ValueError):
+            game_model.new(seed)
+        return
+    game_model.new(seed)
+    restored = GameModel(headless=True)
+    restored.restore(game_model.snapshot())
+    assert restored.game_seed == seed
+
+
+def test_size():
+    """
+    Check that a snapshot is as small as its layout, a few kilobytes at most.
+    """
+    game_model = GameModel(headless=True, seed=3)
+    game_model.new()
+    data = game_model.snapshot()
+    assert len(data) == STATE.size + RNG.size \
+        + len(game_model.platforms) * PLATFORM.size \
+        + len(game_model.upcoming) * UPCOMING.size
+    assert len(data) < 4096
+
+
+def test_restore_invalid():
+    """
+    Check that restoring data that is not a snapshot fails.
+    """
+    game_model = GameModel(headless=True)
+    game_model.new()
+    data = game_model.snapshot()
+    for invalid in [b"", b"PFIL" + data[4:], data[:-1]]:
+        with pytest.raises(ValueError):
+            game_model.restore(invalid)
@@ -53,3 +53,61 @@ def test_player_initialization(specifications, dimensions):
     """
     image = test_spritesheet.get_image(*specifications)
     assert (image.get_width(), image.get_height()) == dimensions
+
+
+cache_cases = [
+    # Check that the same arguments give the same image.
+    ((83, 346, 64, 50), (83, 346, 64, 50), True),
+    # Check that a different scale gives a different image.
+    ((83, 346, 64, 50), (83, 346, 64, 50, 1.2), False),
+    # Check that a different colour key gives a different image.
+    ((83, 346, 64, 50), (83, 346, 64, 50, 1, 0, (0, 0, 0)), False),
+    # Check that a different rotation gives a different image.
+    ((83, 346, 64, 50), (83, 346, 64, 50, 1, 90), False),
+]
+
+# Test if images are cached by all of their arguments.
+@pytest.mark.parametrize("first,second,same", cache_cases)
+def test_cached(first, second, same):
+    """
+    Check that an image is only cut out of the spritesheet once for the same
+    arguments.
+
+    Args:
+        first: A tuple containing the arguments of the first get_image call.
+        second: A tuple containing the arguments of the second call.
+        same: A boolean that is True if the same image should be returned.
+    """
+    spritesheet = Spritesheet(path.join(img_dir, SPRITESHEET))
+    image = spritesheet.get_image(*first)
+    assert (spritesheet.get_image(*second) is image) == same
+    assert spritesheet.hits == int(same)
+    assert spritesheet.misses == 2 - int(same)
+
+
+def test_converted():
+    """
+    Check that images are converted to the format of the display, with the
+    colour key asked for.
+    """
+    image = test_spritesheet.get_image(83, 346, 64, 50, colorkey=(0, 0, 0))
+    assert image.get_bitsize() == screen.get_bitsize()
+    assert image.get_colorkey()[:3] == (0, 0, 0)
+
+
+def test_evicted():
+    """
+    Check that the least recently used images are dropped once the cache is
+    full, and that the cache keeps count of its size.
+    """
+    spritesheet = Spritesheet(path.join(img_dir, SPRITESHEET),
+                              max_bytes=66 * 50 * 4 * 2)
+    first = spritesheet.get_image(83, 346, 64, 50)
+    second = spritesheet.get_image(149, 346, 64, 50)
+    assert spritesheet.get_image(83, 346, 64, 50) is first
+    spritesheet.get_image(413, 178, 66, 50)
+    assert len(spritesheet.images) == 2
+    assert spritesheet.get_image(83, 346, 64, 50) is first
+    assert spritesheet.get_image(149, 346, 64, 50) is not second
+    assert spritesheet.bytes == sum(image.get_pitch() * image.get_height()
+                                    for image in spritesheet.images.values())
@@ -0,0 +1,94 @@
+"""
+Test the TextCache class in the text_view file.
+"""
+import pytest
+import pygame as pg
+from game_model import GameModel
+from text_view import TextCache, find_font
+from settings import WIDTH, HEIGHT, WHITE, GREEN
+
+# Define game display.
+screen = pg.display.set_mode((WIDTH, HEIGHT))
+pg.font.init()
+
+render_cases = [
+    # Check that rendering the same text again uses the cached surface.
+    (("10", 22, WHITE), ("10", 22, WHITE), True),
+    # Check that different text is rendered separately.
+    (("10", 22, WHITE), ("20", 22, WHITE), False),
+    # Check that a different font size is rendered separately.
+    (("10", 22, WHITE), ("10", 30, WHITE), False),
+    # Check that a different colour is rendered separately.
+    (("10", 22, WHITE), ("10", 22, GREEN), False),
+]
+
+# Test if rendered text is reused only for identical text, size and colour.
+@pytest.mark.parametrize("first,second,is_same", render_cases)
+def test_render(first, second, is_same):
+    """
+    Check that a cached surface is returned only for the same text, font size
+    and colour.
+
+    Args:
+        first: A tuple containing the text, font size and colour rendered
+            first.
+        second: A tuple containing the text, font size and colour rendered
+            second.
+        is_same: A boolean that is True if the same surface should be
+            returned.
+    """
+    cache = TextCache(None)
+    assert (cache.render(*first) is cache.render(*second)) == is_same
+
+
+def test_fonts_loaded_once():
+    """
+    Check that each font size is only loaded once.
+    """
+    cache = TextCache(None)
+    cache.render("a", 22, WHITE)
+    cache.render("b", 22, WHITE)
+    cache.render("c", 30, WHITE)
+    assert sorted(cache.fonts) == [22, 30]
+    assert cache.font(22) is cache.font(22)
+
+
+def test_font_found_in_background():
+    """
+    Check that a font is only searched for once, and that a cache given the
+    search waits for its result before loading a font.
+    """
+    search = find_font("arial")
+    assert find_font("arial") is search
+    cache = TextCache(search)
+    cache.render("a", 22, WHITE)
+    assert cache.font_name == search.result()
+
+
+def test_eviction():
+    """
+    Check that only the most recently used surfaces are kept.
+    """
+    cache = TextCache(None, max_surfaces=2)
+    cache.render("a", 22, WHITE)
+    cache.render("b", 22, WHITE)
+    cache.render("a", 22, WHITE)
+    cache.render("c", 22, WHITE)
+    assert list(cache.surfaces) == [("a", 22, WHITE), ("c", 22, WHITE)]
+
+
+def test_score_rendered_on_change():
+    """
+    Check that the score is only rendered again when it changes.
+    """
+    test_model = GameModel()
+    test_model.new()
+    test_view = test_model.view
+    test_view.draw()
+    misses = test_view.text_cache.misses
+    for _ in range(10):
+        test_view.draw()
+    assert test_view.text_cache.misses == misses
+    test_model.score += 10
+    test_view.draw()
+    assert test_view.text_cache.misses == misses + 1
@@ -0,0 +1,146 @@
+"""
+Test running the simulation on a thread of its own and drawing the snapshots
+it publishes.
+"""
+import time
+import pytest
+import pygame as pg
+from game_model import GameModel
+from input_log import LEFT, RIGHT, JUMP
+from input_model import InputSnapshot
+from threaded_model import (InputMailbox,
+                            SimulationThread,
+                            StateBuffer,
+                            capture,)
+
+mailbox_cases = [
+    # Check that a jump is used by the next tick only.
+    ([JUMP], JUMP, 0),
+    # Check that an arrow key stays held for the tick after.
+    ([RIGHT], RIGHT, RIGHT),
+    # Check that only the arrow key held last is kept.
+    ([LEFT | JUMP, RIGHT], RIGHT | JUMP, RIGHT),
+]
+
+
+def test_capture():
+    """
+    Check that a snapshot holds copies of everything the view draws, which
+    stay the same as the game goes on.
+    """
+    game_model = GameModel(headless=True, seed=0)
+    game_model.new()
+    game_model.update()
+    state = capture(game_model)
+    assert state.tick == 1
+    assert [plat.rect for plat in state.platforms] == \
+        [plat.rect for plat in game_model.platforms]
+    assert state.player.rect == game_model.player.rect
+    assert state.player.key == game_model.player.animation.key
+    rect = pg.Rect(state.player.rect)
+    for _ in range(30):
+        game_model.update(InputSnapshot(RIGHT))
+    assert state.player.rect == rect != game_model.player.rect
+
+
+def test_state_buffer():
+    """
+    Check that the latest snapshot published is read, and that the
+    snapshots published are counted.
+    """
+    buffer = StateBuffer()
+    assert buffer.latest() is None
+    buffer.publish("first")
+    buffer.publish("second")
+    assert buffer.latest() == "second"
+    assert buffer.published == 2
+
+# Test if input posted between ticks is given to the next tick.
+@pytest.mark.parametrize("posts,first,second", mailbox_cases)
+def test_mailbox(posts, first, second):
+    """
+    Check that input posted before a tick is combined for it, and that only
+    the arrow keys carry on to the tick after.
+
+    Args:
+        posts: A list of the input bits of each post, in order.
+        first: An integer containing the input bits of the first tick.
+        second: An integer containing the input bits of the second tick.
+    """
+    mailbox = InputMailbox()
+    for bits in posts:
+        mailbox.post(InputSnapshot(bits))
+    assert mailbox.take().bits == first
+    assert mailbox.take().bits == second
+
+
+def test_simulation_thread():
+    """
+    Check that the thread plays the game with the input posted, publishing a
+    snapshot after every tick, until it is stopped.
+    """
+    game_model = GameModel(headless=True, seed=0)
+    game_model.new()
+    simulation = SimulationThread(game_model, tick_rate=1000)
+    simulation.post(InputSnapshot(RIGHT))
+    simulation.start()
+    time.sleep(0.1)
+    simulation.stop()
+    state, alpha = simulation.latest()
+    assert not simulation.is_alive()
+    assert game_model.ticks > 10
+    assert simulation.buffer.published == game_model.ticks + 1
+    assert state.tick == game_model.ticks
+    assert 0 <= alpha <= 1
+    assert game_model.player.vel.x > 0
+
+
+def test_simulation_sounds():
+    """
+    Check that the sounds of jumps made on the thread are left for the
+    thread drawing the snapshots, and given to it once each.
+    """
+    game_model = GameModel(headless=True, seed=0)
+    game_model.new()
+    game_model.update()
+    simulation = SimulationThread(game_model, tick_rate=1000)
+    assert game_model.defer_sounds
+    simulation.post(InputSnapshot(JUMP))
+    simulation.start()
+    time.sleep(0.1)
+    simulation.stop()
+    state, _ = simulation.latest()
+    assert not game_model.defer_sounds
+    assert state.jumps == game_model.jumps == 1
+    assert simulation.sounds(state) == ["jump"]
+    assert simulation.sounds(state) == []
+
+
+def test_simulation_ends():
+    """
+    Check that the thread stops by itself when the game ends.
+    """
+    game_model = GameModel(headless=True, seed=0)
+    game_model.new()
+    simulation = SimulationThread(game_model, tick_rate=1000)
+    simulation.post(InputSnapshot(quit=True))
+    simulation.start()
+    simulation.join(5)
+    assert not simulation.is_alive()
+    assert not game_model.playing
+
+
+def test_draw_state():
+    """
+    Check that drawing a snapshot shows the same picture as drawing the game
+    it was taken from.
+    """
+    game_model = GameModel(seed=0)
+    game_model.new()
+    for _ in range(40):
+        game_model.update(InputSnapshot(JUMP | RIGHT))
+    screens = []
+    for state in (None, capture(game_model)):
+        game_model.view.draw(0.5, state)
+        screens.append(pg.image.tobytes(game_model.view.screen, "RGB"))
+    assert screens[0] == screens[1]
@@ -0,0 +1,103 @@
+"""
+Test the FixedTimestep class in the timestep file.
+"""
+import pytest
+import pygame as pg
+from game_view import GameView
+from player_model import Player
+from settings import WIDTH
+from timestep import FixedTimestep
+
+advance_cases = [
+    # Check that no tick is run if less than a tick has passed.
+    ([0.01], 0, 0.5),
+    # Check that one tick is run for each tick length that passes.
+    ([0.025], 1, 0.25),
+    # Check that leftover time adds up to another tick.
+    ([0.015, 0.015], 1, 0.5),
+    # Check that several ticks are run after a slow frame.
+    ([0.065], 3, 0.25),
+    # Check that frames faster than the tick rate run a tick every few frames.
+    ([1 / 144] * 12, 4, 1 / 6),
+    # Check that a long stall only runs the most ticks allowed and drops the
+    # rest of the time.
+    ([5], 10, 0),
+]
+
+interpolation_cases = [
+    # Check that a sprite is drawn at its current position at the latest tick.
+    ((0, 0), (10, 20), 1, (10, 20)),
+    # Check that a sprite is drawn at its previous position at the last tick.
+    ((0, 0), (10, 20), 0, (0, 0)),
+    # Check that a sprite is drawn halfway between the two positions.
+    ((0, 0), (10, 20), 0.5, (5, 10)),
+    # Check that a sprite that didn't move is drawn where it is.
+    ((10, 20), (10, 20), 0.3, (10, 20)),
+]
+
+wrap_cases = [
+    # Check a player walking off the left edge of the screen.
+    (-61, -3),
+    # Check a player walking off the right edge of the screen.
+    (WIDTH + 61, 3),
+]
+
+# Test if the right number of ticks is run for the time that has passed.
+@pytest.mark.parametrize("frame_times,ticks,alpha", advance_cases)
+def test_advance(frame_times, ticks, alpha):
+    """
+    Check that the number of ticks run over some frames, and the time left
+    over, match the time that has passed for a 50 tick per second game.
+
+    Args:
+        frame_times: A list of floats containing the time each frame took in
+            seconds.
+        ticks: An integer containing the expected total number of ticks.
+        alpha: A float containing the expected fraction of a tick left over.
+    """
+    timestep = FixedTimestep(50)
+    assert sum(timestep.advance(time) for time in frame_times) == ticks
+    assert timestep.alpha == pytest.approx(alpha)
+
+# Test if sprites are drawn between their previous and current positions.
+@pytest.mark.parametrize("previous,current,alpha,drawn", interpolation_cases)
+def test_sprite_rect(previous, current, alpha, drawn):
+    """
+    Check that a sprite is drawn at the right point between its position at
+    the last two ticks.
+
+    Args:
+        previous: A tuple containing the position of the sprite at the
+            previous tick.
+        current: A tuple containing the position of the sprite at the latest
+            tick.
+        alpha: A float containing how far the frame is between the two ticks.
+        drawn: A tuple containing the expected position to draw the sprite at.
+    """
+    sprite = pg.sprite.Sprite()
+    sprite.rect = pg.Rect(current, (20, 20))
+    sprite.previous_topleft = previous
+    assert GameView.sprite_rect(sprite, alpha).topleft == drawn
+
+# Test if a player wrapping around the screen is drawn at the edge.
+@pytest.mark.parametrize("pos_x,vel_x", wrap_cases)
+def test_wrap_not_interpolated(pos_x, vel_x):
+    """
+    Check that a player wrapping across the screen is drawn next to the edge
+    it wrapped to at every point between the two ticks, instead of streaking
+    across the middle of the screen.
+
+    Args:
+        pos_x: A number containing the x position of the player before it
+            wraps.
+        vel_x: A number containing the player's velocity towards the edge.
+    """
+    player = Player()
+    player.pos.x = pos_x
+    player.vel.x = vel_x
+    player.previous_topleft = player.rect.topleft
+    player.update()
+    for alpha in (0, 0.5, 1):
+        rect = GameView.sprite_rect(player, alpha)
+        assert rect.right <= 0 or rect.left >= WIDTH
+        assert rect == player.rect
@@ -0,0 +1,117 @@
+"""
+Test playing tournaments of headless games across a pool of processes.
+"""
+import pytest
+import tournament
+from input_log import LEFT, RIGHT, JUMP
+from input_model import InputSnapshot
+from tournament import GameResult, Report, chunk, play, run
+
+# Input that jumps from the first starting platform up to the second, then
+# walks off it back down to the first.
+THERE_AND_BACK = [0] * 10 + [JUMP | RIGHT] + [RIGHT] * 20 + [0] * 60 \
+    + [LEFT] * 120
+
+
+class ScriptAgent:
+    """
+    An agent giving the input of THERE_AND_BACK, one tick at a time.
+
+    Attributes:
+        inputs: An iterator of the InputSnapshots left to give.
+    """
+
+    def __init__(self, game_model):
+        """
+        Start the script.
+
+        Args:
+            game_model: An instance of a GameModel class (unused).
+        """
+        self.inputs = iter([InputSnapshot(bits) for bits in THERE_AND_BACK])
+
+    def poll(self):
+        """
+        Get the input of the next tick.
+
+        Returns:
+            An InputSnapshot.
+        """
+        return next(self.inputs)
+
+chunk_cases = [
+    # Check that games split evenly into chunks.
+    (list(range(6)), 2, [[0, 1], [2, 3], [4, 5]]),
+    # Check that the last chunk holds the games left over.
+    (list(range(5)), 2, [[0, 1], [2, 3], [4]]),
+    # Check that a chunk bigger than the games holds all of them.
+    (list(range(3)), 10, [[0, 1, 2]]),
+]
+
+# Test if games are split into chunks.
+@pytest.mark.parametrize("games,size,chunks", chunk_cases)
+def test_chunk(games, size, chunks):
+    """
+    Check that every game is sent to a worker once, in chunks of the size
+    asked for.
+
+    Args:
+        games: A list of the games to play.
+        size: An integer containing the most games in a chunk.
+        chunks: A list of the lists of games expected.
+    """
+    assert chunk(games, size) == chunks
+
+
+def test_pool_matches_serial():
+    """
+    Check that games played by worker processes have the same results as
+    games played one after another in this process.
+    """
+    seeds = list(range(6))
+    pooled = sorted(run(["hop", "idle"], seeds, workers=2, chunk_size=2,
+                        max_frames=1500))
+    serial = sorted(play(agent, seed, max_frames=1500)
+                    for agent in ["hop", "idle"] for seed in seeds)
+    assert pooled == serial
+    assert len(pooled) == 12
+
+
+def test_limits():
+    """
+    Check that a game is stopped once it reaches its frame limit or time
+    limit, and reported as stopped.
+    """
+    result = play("idle", 0, max_frames=200)
+    assert result.frames == 200 and result.timed_out
+    result = play("idle", 0, max_frames=5000, timeout=0)
+    assert result.frames == 1000 and result.timed_out
+
+
+def test_platforms_landed(monkeypatch):
+    """
+    Check that landing on a platform again is not counted as another
+    platform.
+
+    Args:
+        monkeypatch: A pytest MonkeyPatch used to add the scripted agent.
+    """
+    monkeypatch.setitem(tournament.AGENTS, "script", ScriptAgent)
+    result = play("script", 0, max_frames=len(THERE_AND_BACK))
+    assert result.platforms == 2
+
+
+def test_report():
+    """
+    Check that the results of each agent are added up separately.
+    """
+    report = Report()
+    report.add(GameResult("hop", 0, 30, 900, 4, False))
+    report.add(GameResult("hop", 1, 10, 300, 2, True))
+    report.add(GameResult("idle", 0, 0, 100, 1, True))
+    assert len(report) == 3
+    assert report.summary("hop") == {"games": 2, "mean": 20, "median": 20,
+                                     "best": 30, "frames": 600,
+                                     "platforms": 3, "timed_out": 1}
+    lines = report.format().splitlines()
+    assert len(lines) == 3 and lines[1].split()[0] == "hop"
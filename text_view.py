@@ -0,0 +1,111 @@
+"""
+Cache fonts and rendered text so text only has to be rendered when it changes.
+"""
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+import pygame as pg
+
+# Thread that searches the system fonts, which can take a while.
+FONT_SEARCH = ThreadPoolExecutor(max_workers=1)
+
+
+@lru_cache(maxsize=None)
+def find_font(name):
+    """
+    Start looking for a system font in the background, the first time it is
+    asked for.
+
+    Args:
+        name: A string containing the name of the font, e.g. "arial".
+
+    Returns:
+        A Future giving the path to the font file, or None if it is not
+        found, shared by every call with the same name.
+    """
+    return FONT_SEARCH.submit(pg.font.match_font, name)
+
+
+class TextCache:
+    """
+    A cache of fonts by size and of rendered text surfaces.
+
+    Rendered surfaces are kept for the most recently used combinations of
+    text, font size and colour. Once there are more than max_surfaces, the
+    least recently used surface is dropped.
+
+    Attributes:
+        font_name: A string containing the path to the font file, or a Future
+            giving it until the first font is loaded.
+        max_surfaces: An integer containing the most rendered surfaces to keep.
+        fonts: A dictionary mapping font sizes to pygame Font objects.
+        surfaces: An ordered dictionary mapping (text, size, colour) tuples to
+            rendered pygame Surface objects, least recently used first.
+        hits: An integer counting the renders served from the cache.
+        misses: An integer counting the renders that had to be drawn.
+    """
+    def __init__(self, font_name, max_surfaces=64):
+        """
+        Create an empty text cache.
+
+        Args:
+            font_name: A string containing the path to the font file, or None
+                for the default pygame font, or a Future giving either.
+            max_surfaces: An optional integer containing the most rendered
+                surfaces to keep.
+        """
+        self.font_name = font_name
+        self.max_surfaces = max_surfaces
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, font_size):
+        """
+        Get the font of a given size, loading it the first time it is used.
+
+        Args:
+            font_size: An integer containing the size of the font.
+
+        Returns:
+            A pygame Font object.
+        """
+        font = self.fonts.get(font_size)
+        if font is None:
+            # Wait for the font file to be found, if it is not yet.
+            if isinstance(self.font_name, Future):
+                self.font_name = self.font_name.result()
+            font = pg.font.Font(self.font_name, font_size)
+            self.fonts[font_size] = font
+        return font
+
+    def render(self, text, font_size, colour):
+        """
+        Get a surface with the text drawn on it, rendering it only if it is not
+        already cached.
+
+        The returned surface is shared with later calls and should not be
+        modified.
+
+        Args:
+            text: A string representing the text to draw.
+            font_size: An integer containing the size of the font to use.
+            colour: A tuple representing the colour of the font in RGB.
+
+        Returns:
+            A pygame Surface containing the rendered text.
+        """
+        key = (text, font_size, tuple(colour))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(font_size).render(text, True, colour)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
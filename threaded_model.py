@@ -0,0 +1,256 @@
+"""
+Run the game simulation on a thread of its own at a fixed rate, publishing
+an immutable snapshot of what to draw after every tick, so a slow frame never
+holds up the physics.
+
+The simulation thread owns the game model while a game is played. The main
+thread only posts the input it reads, draws the latest snapshot and plays the
+sounds of the jumps the snapshots count, so the view and its audio are only
+used from the main thread.
+"""
+from collections import namedtuple
+import threading
+import time
+import pygame as pg
+from input_model import NO_INPUT
+from settings import FPS
+
+# Most ticks the simulation falls behind before it stops trying to catch up.
+MAX_BEHIND = 10
+
+# The player as drawn: its rect, position at the start of the tick, and the
+# animation key and frame index of its image.
+PlayerState = namedtuple("PlayerState", ["rect", "previous_topleft", "key",
+                                         "index"])
+
+# A platform as drawn: a key identifying it between frames, its kind, rect
+# and position at the start of the tick.
+PlatformState = namedtuple("PlatformState", ["key", "kind", "rect",
+                                             "previous_topleft"])
+
+# Everything drawn for one tick: the tick number, when it was published, the
+# score, the camera's position now and at the start of the tick, the
+# platforms in the order they were added, the player (None once it died) and
+# the number of jumps so far, whose sounds are played by the main thread.
+FrameState = namedtuple("FrameState", ["tick", "time", "score", "camera_y",
+                                       "previous_camera_y", "platforms",
+                                       "player", "jumps"])
+
+
+def capture(game_model, now=None):
+    """
+    Copy what the view draws out of a game model.
+
+    Args:
+        game_model: An instance of a GameModel class.
+        now: An optional float containing the time of the tick in seconds.
+            By default it is the current time.
+
+    Returns:
+        A FrameState. Its rects are copies, which are never changed.
+    """
+    player = game_model.player
+    player_state = None
+    if player.alive():
+        player_state = PlayerState(pg.Rect(player.rect),
+                                   player.previous_topleft,
+                                   player.animation.key,
+                                   player.animation.index)
+    return FrameState(
+        game_model.ticks, time.perf_counter() if now is None else now,
+        game_model.score, game_model.camera.y, game_model.camera.previous_y,
+        tuple(PlatformState(id(plat), plat.kind, pg.Rect(plat.rect),
+                            plat.previous_topleft)
+              for plat in game_model.platforms),
+        player_state, game_model.jumps)
+
+
+class StateBuffer:
+    """
+    The latest snapshot, shared between the simulation and drawing threads.
+
+    Snapshots are never changed once published, so a single slot is enough:
+    the simulation replaces the reference to the latest one under a lock,
+    and a reader can keep drawing the snapshot it got for as long as it
+    needs. Each snapshot holds its own positions at the start of the tick,
+    so no older snapshot is kept to interpolate from.
+
+    Attributes:
+        state: The FrameState published last, or None.
+        published: An integer containing the number of snapshots published.
+        lock: A threading Lock held while the snapshot is replaced.
+    """
+
+    def __init__(self):
+        """
+        Create a buffer with no snapshot.
+        """
+        self.state = None
+        self.published = 0
+        self.lock = threading.Lock()
+
+    def publish(self, state):
+        """
+        Make a snapshot the latest one.
+
+        Args:
+            state: A FrameState.
+        """
+        with self.lock:
+            self.state = state
+            self.published += 1
+
+    def latest(self):
+        """
+        Get the latest snapshot.
+
+        Returns:
+            A FrameState, or None if none has been published.
+        """
+        with self.lock:
+            return self.state
+
+
+class InputMailbox:
+    """
+    Input posted by the main thread for the next tick of the simulation.
+
+    Attributes:
+        inputs: An InputSnapshot of the input not yet used by a tick.
+        lock: A threading Lock held while the input is changed.
+    """
+
+    def __init__(self):
+        """
+        Create a mailbox with no input.
+        """
+        self.inputs = NO_INPUT
+        self.lock = threading.Lock()
+
+    def post(self, inputs):
+        """
+        Add input given after the input already posted.
+
+        Args:
+            inputs: An InputSnapshot from an input source.
+        """
+        with self.lock:
+            self.inputs = self.inputs.then(inputs)
+
+    def take(self):
+        """
+        Take the input for a tick, leaving only the arrow keys held.
+
+        Returns:
+            An InputSnapshot.
+        """
+        with self.lock:
+            inputs = self.inputs
+            self.inputs = inputs.held()
+        return inputs
+
+
+class SimulationThread(threading.Thread):
+    """
+    A thread playing one game at a fixed tick rate until it ends.
+
+    Attributes:
+        game_model: An instance of a GameModel class with a game started.
+        tick_length: A float containing the length of a tick in seconds.
+        buffer: A StateBuffer holding the snapshots of the latest ticks.
+        mailbox: An InputMailbox holding the input for the next tick.
+        histogram: A FrameHistogram timing the intervals between ticks, or
+            None.
+        stopping: A threading Event set to stop the game early.
+        jumps_played: An integer containing the number of jumps whose sound
+            has been played by the main thread.
+    """
+
+    def __init__(self, game_model, tick_rate=FPS, histogram=None):
+        """
+        Create the thread, publishing the game's current state. The game
+        leaves its sounds to the main thread until the thread finishes.
+
+        Args:
+            game_model: An instance of a GameModel class with a game started.
+            tick_rate: An optional integer containing the ticks per second.
+            histogram: An optional FrameHistogram to time the ticks with.
+        """
+        threading.Thread.__init__(self, daemon=True)
+        self.game_model = game_model
+        self.tick_length = 1 / tick_rate
+        self.buffer = StateBuffer()
+        self.mailbox = InputMailbox()
+        self.histogram = histogram
+        self.stopping = threading.Event()
+        self.jumps_played = game_model.jumps
+        game_model.defer_sounds = True
+        self.buffer.publish(capture(game_model))
+
+    def run(self):
+        """
+        Update the game once per tick length, sleeping between ticks, until
+        the game ends or the thread is stopped. If the thread falls more than
+        MAX_BEHIND ticks behind, the time lost is dropped.
+        """
+        game_model = self.game_model
+        next_tick = time.perf_counter() + self.tick_length
+        while game_model.playing and not self.stopping.is_set():
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -MAX_BEHIND * self.tick_length:
+                next_tick = time.perf_counter()
+            next_tick += self.tick_length
+
+            game_model.update(self.mailbox.take())
+            self.buffer.publish(capture(game_model))
+            if self.histogram is not None:
+                self.histogram.tick()
+        game_model.defer_sounds = False
+
+    def post(self, inputs):
+        """
+        Give the simulation input read on another thread.
+
+        Args:
+            inputs: An InputSnapshot from an input source.
+        """
+        self.mailbox.post(inputs)
+
+    def latest(self):
+        """
+        Get the latest snapshot and how far the present is between its tick
+        and the next one.
+
+        Returns:
+            A tuple containing a FrameState and a float from 0 to 1, used to
+            interpolate positions when drawing it.
+        """
+        state = self.buffer.latest()
+        alpha = (time.perf_counter() - state.time) / self.tick_length
+        return state, max(0, min(alpha, 1))
+
+    def sounds(self, state):
+        """
+        Get the sounds to play for a snapshot about to be drawn, which are
+        the jumps made since the last snapshot drawn. Only call this from the
+        thread drawing the snapshots.
+
+        Args:
+            state: A FrameState from latest.
+
+        Returns:
+            A list of the names of the sounds to play, in order.
+        """
+        jumps = state.jumps - self.jumps_played
+        self.jumps_played = state.jumps
+        return ["jump"] * jumps
+
+    def stop(self):
+        """
+        Stop the game early and wait for the thread to finish.
+        """
+        self.stopping.set()
+        if self.is_alive():
+            self.join()
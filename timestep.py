@@ -0,0 +1,71 @@
+"""
+Run the game simulation at a fixed rate, independently of how often frames
+are drawn.
+"""
+
+
+class FixedTimestep:
+    """
+    Accumulator deciding how many fixed-length simulation ticks to run for
+    each drawn frame.
+
+    Real time that has passed is added to an accumulator, and one tick is
+    run for every full tick length it holds. What is left over is how far the
+    drawn frame is between the last two ticks, used to interpolate sprite
+    positions.
+
+    Attributes:
+        tick_length: A float containing the length of a tick in seconds.
+        max_ticks: An integer containing the most ticks run for one frame.
+            Any time beyond that is dropped, so a long stall doesn't make the
+            game run hundreds of ticks to catch up.
+        accumulator: A float containing the time in seconds not yet simulated.
+    """
+    def __init__(self, tick_rate, max_ticks=10):
+        """
+        Create an accumulator with no time in it.
+
+        Args:
+            tick_rate: An integer containing the number of ticks per second.
+            max_ticks: An optional integer containing the most ticks run for
+                one frame.
+        """
+        self.tick_length = 1 / tick_rate
+        self.max_ticks = max_ticks
+        self.accumulator = 0
+
+    def reset(self):
+        """
+        Forget any time not yet simulated, e.g. when a new game starts.
+        """
+        self.accumulator = 0
+
+    def advance(self, elapsed):
+        """
+        Add the real time that has passed and take out whole ticks.
+
+        Args:
+            elapsed: A float containing the time in seconds since the last
+                frame.
+
+        Returns:
+            An integer containing the number of ticks to run this frame.
+        """
+        self.accumulator += elapsed
+        ticks = int(self.accumulator / self.tick_length)
+        if ticks > self.max_ticks:
+            ticks = self.max_ticks
+            self.accumulator = 0
+        else:
+            self.accumulator -= ticks * self.tick_length
+        return ticks
+
+    @property
+    def alpha(self):
+        """
+        How far the current frame is between the last tick and the next one.
+
+        Returns:
+            A float from 0 to 1.
+        """
+        return max(0, min(self.accumulator / self.tick_length, 1))
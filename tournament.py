@@ -0,0 +1,280 @@
+"""
+Play scripted agents against many seeds of headless games, spread across a
+pool of processes, and report how well each agent did.
+
+Run `python tournament.py` to play every agent on seeds 0 to 999, or pass
+`--agents`, `--seeds`, `--workers` and the limits on each game. Every game
+is simulated without a window or frame cap, so the runner scales with the
+number of cores.
+"""
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import statistics
+import sys
+import time
+from game_model import GameModel
+from headless import HopAgent
+from input_model import NO_INPUT
+
+# Agents that can play in a tournament, by name. None plays with no input.
+AGENTS = {
+    "hop": HopAgent,
+    "idle": None,
+}
+
+# Most ticks a game may last, and most seconds it may take, before it is
+# stopped.
+MAX_FRAMES = 10000
+TIMEOUT = 30.0
+
+# Chunks of games handed to each worker, so they stay busy until the end
+# without sending every game on its own.
+CHUNKS_PER_WORKER = 4
+
+# The result of one game: the agent and seed played, the final score, the
+# number of ticks survived, the number of different platforms landed on and
+# whether the game was stopped by a limit instead of ending.
+GameResult = namedtuple("GameResult", ["agent", "seed", "score", "frames",
+                                       "platforms", "timed_out"])
+
+
+def play(agent, seed, max_frames=MAX_FRAMES, timeout=TIMEOUT):
+    """
+    Play one headless game with an agent until it ends or reaches a limit.
+
+    Args:
+        agent: A string containing the name of an agent in AGENTS.
+        seed: An integer containing the seed of the game.
+        max_frames: An optional integer containing the most ticks to play.
+        timeout: An optional float containing the most seconds to play for.
+
+    Returns:
+        A GameResult of the game.
+    """
+    game_model = GameModel(headless=True, record=False)
+    agent_class = AGENTS[agent]
+    source = None if agent_class is None else agent_class(game_model)
+    game_model.new(seed)
+    game_model.playing = True
+    deadline = time.perf_counter() + timeout
+    player = game_model.player
+    landed = set()
+    frames = 0
+    while game_model.playing and frames < max_frames:
+        game_model.update(NO_INPUT if source is None else source.poll())
+        frames += 1
+
+        # Count each platform the first time the player lands on it.
+        # Platforms never move in the world, so their position tells them
+        # apart, even when the pool reuses a platform object for another.
+        if player.ground is not None:
+            landed.add(player.ground.rect.topleft)
+
+        # Checking the time on every tick would slow the game down.
+        if not frames % 1000 and time.perf_counter() > deadline:
+            break
+    game_model.level.close()
+    return GameResult(agent, seed, game_model.score, frames, len(landed),
+                      game_model.playing)
+
+
+def play_chunk(games, max_frames=MAX_FRAMES, timeout=TIMEOUT):
+    """
+    Play a chunk of games one after another, in a worker process.
+
+    Args:
+        games: A list of tuples, each containing the name of an agent and a
+            seed.
+        max_frames: An optional integer containing the most ticks to play
+            each game for.
+        timeout: An optional float containing the most seconds to play each
+            game for.
+
+    Returns:
+        A list of the GameResults of the games, in order.
+    """
+    return [play(agent, seed, max_frames, timeout) for agent, seed in games]
+
+
+def chunk(games, size):
+    """
+    Split a list of games into chunks.
+
+    Args:
+        games: A list of the games to play.
+        size: An integer containing the most games in a chunk.
+
+    Returns:
+        A list of lists of games, together containing every game once.
+    """
+    return [games[start:start + size] for start in range(0, len(games), size)]
+
+
+def run(agents, seeds, workers=None, chunk_size=None, max_frames=MAX_FRAMES,
+        timeout=TIMEOUT):
+    """
+    Play every agent on every seed across a pool of processes, giving back
+    the results as each chunk of games finishes.
+
+    Args:
+        agents: A list of the names of agents in AGENTS.
+        seeds: A list of integers containing the seeds of the games.
+        workers: An optional integer containing the number of processes to
+            use. By default there is one for each core, and 0 plays every
+            game in this process.
+        chunk_size: An optional integer containing the most games sent to a
+            worker at once. By default each worker gets CHUNKS_PER_WORKER
+            chunks.
+        max_frames: An optional integer containing the most ticks to play
+            each game for.
+        timeout: An optional float containing the most seconds to play each
+            game for.
+
+    Yields:
+        A GameResult for each game, in the order they finish.
+    """
+    games = [(agent, seed) for agent in agents for seed in seeds]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, len(games) // (max(workers, 1)
+                                           * CHUNKS_PER_WORKER))
+    chunks = chunk(games, chunk_size)
+
+    # Without workers, play the chunks here, for debugging or profiling.
+    if workers == 0:
+        for games_chunk in chunks:
+            yield from play_chunk(games_chunk, max_frames, timeout)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(play_chunk, games_chunk, max_frames,
+                                   timeout)
+                   for games_chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+class Report:
+    """
+    The results of a tournament, added up for each agent.
+
+    Attributes:
+        results: A dictionary mapping the name of each agent to a list of the
+            GameResults of its games.
+    """
+
+    def __init__(self):
+        """
+        Start a report with no results.
+        """
+        self.results = {}
+
+    def __len__(self):
+        """
+        Get the number of games reported.
+
+        Returns:
+            An integer containing the number of results added.
+        """
+        return sum(len(results) for results in self.results.values())
+
+    def add(self, result):
+        """
+        Add the result of a game.
+
+        Args:
+            result: A GameResult.
+        """
+        self.results.setdefault(result.agent, []).append(result)
+
+    def summary(self, agent):
+        """
+        Sum up the games of an agent.
+
+        Args:
+            agent: A string containing the name of the agent.
+
+        Returns:
+            A dictionary containing the number of games, the mean, median and
+            best scores, the mean frames survived and platforms landed on,
+            and the number of games stopped by a limit.
+        """
+        results = self.results[agent]
+        scores = [result.score for result in results]
+        return {
+            "games": len(results),
+            "mean": statistics.mean(scores),
+            "median": statistics.median(scores),
+            "best": max(scores),
+            "frames": statistics.mean(result.frames for result in results),
+            "platforms": statistics.mean(result.platforms
+                                         for result in results),
+            "timed_out": sum(result.timed_out for result in results),
+        }
+
+    def format(self):
+        """
+        Make a table of the summary of every agent.
+
+        Returns:
+            A string with a line for each agent, best mean score first.
+        """
+        summaries = {agent: self.summary(agent) for agent in self.results}
+        lines = [f"{'agent':>8} {'games':>6} {'mean':>8} {'median':>8} "
+                 f"{'best':>6} {'frames':>8} {'platforms':>9} "
+                 f"{'stopped':>7}"]
+        for agent, summary in sorted(summaries.items(),
+                                     key=lambda item: -item[1]["mean"]):
+            lines.append(f"{agent:>8} {summary['games']:>6} "
+                         f"{summary['mean']:>8.1f} "
+                         f"{summary['median']:>8.1f} {summary['best']:>6} "
+                         f"{summary['frames']:>8.0f} "
+                         f"{summary['platforms']:>9.1f} "
+                         f"{summary['timed_out']:>7}")
+        return "\n".join(lines)
+
+
+def main(argv):
+    """
+    Run a tournament from the command line, showing its progress.
+
+    Args:
+        argv: A list of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--agents", nargs="+", default=list(AGENTS),
+                        choices=list(AGENTS), help="agents to play")
+    parser.add_argument("--seeds", type=int, nargs=2, default=[0, 1000],
+                        metavar=("FIRST", "STOP"),
+                        help="play seeds from FIRST up to STOP")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes to use (one per core by default)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="games sent to a worker at once")
+    parser.add_argument("--max-frames", type=int, default=MAX_FRAMES,
+                        help="most ticks to play each game for")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT,
+                        help="most seconds to play each game for")
+    args = parser.parse_args(argv)
+
+    report = Report()
+    seeds = list(range(*args.seeds))
+    total = len(seeds) * len(args.agents)
+    start = time.perf_counter()
+    for result in run(args.agents, seeds, args.workers, args.chunk_size,
+                      args.max_frames, args.timeout):
+        report.add(result)
+        print(f"\r{len(report)}/{total} games", end="", flush=True)
+    elapsed = time.perf_counter() - start
+    frames = sum(result.frames for results in report.results.values()
+                 for result in results)
+    print(f"\r{total} games in {elapsed:.2f} s ({total / elapsed:.0f} "
+          f"games/sec, {frames / elapsed:.0f} ticks/sec)")
+    print(report.format())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])